@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+
+"""Benchmark of the single-pass ffield parser (`ReaxReader.read_ffield`) against the previous implementation, which
+called np.genfromtxt once per array section and built atom/bond rows through repeated list concatenation.
+
+A synthetic multi-element force field is generated by repeating the rows of every section of the reference training
+set ffield `scale` times, so that the section sizes resemble those of large multi-element parametrizations.
+
+Usage: python benchmarks/bench_ffield_parser.py [scale] [repeats]
+"""
+
+# Standard library
+import os
+import sys
+import tempfile
+import timeit
+
+# 3rd party packages
+import numpy as np
+
+# Local source
+from parametrization_clean.infrastructure.utils.reax_reader import ReaxReader, read_array
+
+REFERENCE_FFIELD_PATH = os.path.join(os.path.dirname(__file__), os.pardir, 'tests', 'integration',
+                                     'reference_training_set', 'ReaxFF_ZnO_Raymand_with_Sglass_control_all_bounds',
+                                     'ffield')
+
+
+def legacy_read_ffield(dir_path):
+    """Previous ffield reader, kept here as the benchmark baseline."""
+    ffield = {}
+    atom_types = {}
+    with open(os.path.join(dir_path, 'ffield'), 'r') as in_file:
+        in_file.readline()
+        num_general = int(in_file.readline().split().pop(0))
+        ffield[1] = read_array(file=in_file, max_rows=num_general, columns=(0,))
+
+        ffield[2] = []
+        atom_types[2] = []
+        num_atoms = int(in_file.readline().split().pop(0))
+        for i in range(3):
+            in_file.readline()
+        for i in range(num_atoms):
+            temp = []
+            for j in range(4):
+                temp = temp + in_file.readline().split()
+            atom_types[2].append(temp.pop(0))
+            ffield[2].append([float(param) for param in temp])
+
+        ffield[3] = []
+        atom_types[3] = []
+        num_bonds = int(in_file.readline().split().pop(0))
+        in_file.readline()
+        for i in range(num_bonds):
+            temp = []
+            for j in range(2):
+                temp = temp + in_file.readline().split()
+            atom_types[3].append([temp.pop(0), temp.pop(0)])
+            ffield[3].append([float(param) for param in temp])
+
+        for section, num_atom_type_columns in ((4, 2), (5, 3), (6, 4), (7, 3)):
+            num_rows = int(in_file.readline().split().pop(0))
+            table = read_array(file=in_file, max_rows=num_rows)
+            atom_types[section] = table[:, list(range(num_atom_type_columns))]
+            ffield[section] = table[:, num_atom_type_columns:]
+
+    return ffield, atom_types
+
+
+def write_synthetic_ffield(output_path, scale):
+    """Write a copy of the reference ffield with every atom, bond, off diagonal, angle, torsion and hydrogen bond
+    entry repeated `scale` times.
+    """
+    with open(REFERENCE_FFIELD_PATH, 'r') as in_file:
+        lines = in_file.read().splitlines()
+
+    output = lines[0:2]
+    num_general = int(lines[1].split()[0])
+    position = 2
+    output.extend(lines[position:position + num_general])
+    position += num_general
+
+    # (header lines after the count line, lines per entry) for sections 2-7
+    for num_header_lines, lines_per_entry in ((3, 4), (1, 2), (0, 1), (0, 1), (0, 1), (0, 1)):
+        count_line = lines[position]
+        num_entries = int(count_line.split()[0])
+        output.append("{:3d}".format(num_entries * scale) + count_line[3:])
+        output.extend(lines[position + 1:position + 1 + num_header_lines])
+        position += 1 + num_header_lines
+        entries = lines[position:position + num_entries * lines_per_entry]
+        output.extend(entries * scale)
+        position += num_entries * lines_per_entry
+
+    with open(output_path, 'w') as out_file:
+        out_file.write("\n".join(output) + "\n")
+
+
+def main(scale=50, repeats=5):
+    with tempfile.TemporaryDirectory() as dir_path:
+        write_synthetic_ffield(os.path.join(dir_path, 'ffield'), scale)
+        reader = ReaxReader(dir_path)
+
+        ffield, atom_types = reader.read_ffield()
+        legacy_ffield, legacy_atom_types = legacy_read_ffield(dir_path)
+        for section in legacy_ffield:
+            assert np.array_equal(np.asarray(ffield[section]), np.asarray(legacy_ffield[section]))
+            assert np.array_equal(np.asarray(atom_types.get(section)), np.asarray(legacy_atom_types.get(section)))
+
+        print("Synthetic ffield: {} atoms, {} bonds, {} off diagonal, {} angle, {} torsion, {} hydrogen bond terms"
+              .format(*[len(ffield[section]) for section in range(2, 8)]))
+        legacy_time = min(timeit.repeat(lambda: legacy_read_ffield(dir_path), number=1, repeat=repeats))
+        single_pass_time = min(timeit.repeat(reader.read_ffield, number=1, repeat=repeats))
+        print("genfromtxt/list concatenation: {:.4f} s".format(legacy_time))
+        print("single-pass parser:            {:.4f} s".format(single_pass_time))
+        print("speedup:                       {:.1f}x".format(legacy_time / single_pass_time))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+
+"""Benchmark of writing a generation of children's ffield files with the precompiled `FfieldTemplate` against
+`write_ffield`, which re-reads and re-formats the whole reference ffield for every child.
+
+Usage: python benchmarks/bench_ffield_writer.py [num_children]
+"""
+
+# Standard library
+import os
+import sys
+import tempfile
+import time
+
+# 3rd party packages
+import numpy as np
+
+# Local source
+from parametrization_clean.domain.root_individual import FirstGenerationRootIndividual
+from parametrization_clean.domain.individual import Individual
+from parametrization_clean.infrastructure.utils.ffield_template import FfieldTemplate
+from parametrization_clean.infrastructure.utils.reax_reader import ReaxReader, write_ffield
+
+TRAINING_SET_PATH = os.path.join(os.path.dirname(__file__), os.pardir, 'tests', 'integration',
+                                 'reference_training_set', 'ReaxFF_ZnO_Raymand_with_Sglass_control_all_bounds')
+
+
+def main(num_children=1000):
+    reader = ReaxReader(TRAINING_SET_PATH)
+    param_keys, _, _ = reader.read_params()
+    root_ffield, atom_types = reader.read_ffield()
+    root_individual = FirstGenerationRootIndividual(root_ffield, param_keys)
+    ffield_path = os.path.join(TRAINING_SET_PATH, 'ffield')
+
+    random_generator = np.random.default_rng(0)
+    root_params = np.array(root_individual.root_params)
+    population = [Individual((root_params * random_generator.uniform(0.9, 1.1, len(param_keys))).tolist(),
+                             root_individual=root_individual) for _ in range(num_children)]
+
+    with tempfile.TemporaryDirectory() as dir_path:
+        start = time.perf_counter()
+        for i, individual in enumerate(population):
+            write_ffield(ffield_path, os.path.join(dir_path, 'ffield-{}'.format(i)), individual.ffield, atom_types)
+        write_ffield_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ffield_template = FfieldTemplate(ffield_path, param_keys)
+        for i, individual in enumerate(population):
+            ffield_template.write(os.path.join(dir_path, 'ffield-{}'.format(i)), individual.params)
+        template_time = time.perf_counter() - start
+
+    print("{} children, {} optimized parameters".format(num_children, len(param_keys)))
+    print("write_ffield:   {:.3f} s".format(write_ffield_time))
+    print("FfieldTemplate: {:.3f} s (including compilation)".format(template_time))
+    print("speedup:        {:.1f}x".format(write_ffield_time / template_time))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+"""Benchmark of the whole generational loop (initialization, evaluation, selection, crossover, mutation and, with
+`ann`, the nested ANN) without ReaxFF: every generation is evaluated by the in-process `AnalyticEvaluator` and kept
+in memory by `InMemoryPopulationRepository`, using the parameters and training set size of the reference training set.
+
+Usage: python benchmarks/bench_generation_loop.py [num_generations] [population_size] [ann]
+Profile with: python -m cProfile -s cumtime benchmarks/bench_generation_loop.py [num_generations]
+"""
+
+# Standard library
+import os
+import sys
+import time
+
+# 3rd party packages
+
+# Local source
+from parametrization_clean.domain.root_individual import FirstGenerationRootIndividual
+from parametrization_clean.use_case.generation_loop import GenerationLoop
+from parametrization_clean.infrastructure.config.default import DefaultSettings
+from parametrization_clean.infrastructure.evaluator.analytic import AnalyticEvaluator
+from parametrization_clean.infrastructure.repository.in_memory import InMemoryPopulationRepository
+from parametrization_clean.infrastructure.utils.reax_reader import ReaxReader
+
+TRAINING_SET_PATH = os.path.join(os.path.dirname(__file__), os.pardir, 'tests', 'integration',
+                                 'reference_training_set', 'ReaxFF_ZnO_Raymand_with_Sglass_control_all_bounds')
+
+
+def main(num_generations=1000, population_size=30, use_neural_network=False):
+    reader = ReaxReader(TRAINING_SET_PATH)
+    param_keys, _, param_bounds = reader.read_params()
+    root_ffield, _ = reader.read_ffield()
+    num_energies = len(reader.read_fort99_array())
+
+    settings = DefaultSettings()
+    settings.ga_settings.population_size = population_size
+    settings.ga_settings.use_neural_network = use_neural_network
+    settings.mutation_settings.param_bounds = param_bounds
+    settings.neural_net_settings.verbosity = 0
+    settings.neural_net_settings.num_epochs = 100
+
+    # Reference energies of the root individual are synthesized by the evaluator
+    root_params = FirstGenerationRootIndividual(root_ffield, param_keys).root_params
+    evaluator = AnalyticEvaluator(root_params, num_energies)
+    root_individual = evaluator.root_individual(root_ffield, param_keys)
+    population_repository = InMemoryPopulationRepository(root_individual)
+    evaluator.population_repository = population_repository
+    generation_loop = GenerationLoop(settings, population_repository, evaluator)
+
+    start = time.perf_counter()
+    last_population = generation_loop.run(num_generations)
+    elapsed_time = time.perf_counter() - start
+
+    print("{} generations of {} children, {} optimized parameters, {} training set rows{}"
+          .format(num_generations, population_size, len(param_keys), num_energies,
+                  ", with nested ANN" if use_neural_network else ""))
+    print("elapsed:         {:.3f} s".format(elapsed_time))
+    print("generations/min: {:.0f}".format(60.0 * num_generations / elapsed_time))
+    print("best cost:       {:.6g}".format(last_population.costs.min()))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]], *[arg == 'ann' for arg in sys.argv[3:4]])
@@ -44,6 +44,12 @@ __root="$(cd "$(dirname "${__dir}")" && pwd)"
 # POPULATION_SIZE: int
 #   Number of individuals one wishes to create for each generation in the generational genetic algorithm.
 #   For example, if POPULATION_SIZE = 50, then 50 children will be created in each generation.
+#
+# NUM_EXTRA_CHILDREN: int
+#   Number of children created on top of POPULATION_SIZE in each generation (same as `num_extra_children` in the
+#   configuration file). The watcher closes a generation once POPULATION_SIZE children have completed, after which the
+#   jobs of the remaining children are cancelled (not if the watcher stopped without closing the generation, e.g.,
+#   after WATCH_TIMEOUT).
 #######################################
 GENERATION_NUM=1
 MAX_GENERATION_NUM=501
@@ -51,6 +57,7 @@ TRAINING_PATH=""
 POPULATION_PATH=""
 CONFIG_PATH=""
 POPULATION_SIZE=30
+NUM_EXTRA_CHILDREN=0
 
 
 # REAXFF JOB AUTOMATION CONSTANTS
@@ -58,6 +65,7 @@ USER=daksha  # user ID to use for checking number of remaining jobs
 JOB_NAME="RUN-1"  # job name to use for ReaxFF optimizations
 MAX_JOB_TIME="0-00:30:00"  # maximum allowable ReaxFF optimization run time
 JOB_INTERVAL=30  # How often the script should check for the job status in seconds.
+WATCH_TIMEOUT=3600  # Maximum time (seconds) to stage results of a generation's children while their jobs run.
 
 
 #######################################
@@ -72,12 +80,32 @@ cli --generation_number ${GENERATION_NUM} --training_path "${TRAINING_PATH}" --p
     --config_path "${CONFIG_PATH}"
 }
 
+#######################################
+# Stage the results of each child of generation-$GENERATION_NUM as soon as its ReaxFF optimization completes, so the
+# next call to `main` only merges already-parsed results. Runs in the background while the jobs are monitored.
+#######################################
+watchGeneration() {
+cli watch --generation_number ${GENERATION_NUM} --training_path "${TRAINING_PATH}" \
+    --population_path "${POPULATION_PATH}" --config_path "${CONFIG_PATH}" --timeout ${WATCH_TIMEOUT} &
+watcher_pid=$!
+}
+
+#######################################
+# Whether the watcher closed generation-$GENERATION_NUM, i.e., recorded the children that had not completed as late
+# ("GenerationClosed" errors in the generation's manifest). A watcher that timed out or failed leaves no late children.
+#######################################
+generationClosed() {
+cli status --generation_number ${GENERATION_NUM} --population_path "${POPULATION_PATH}" --children 2>/dev/null \
+    | grep -q "GenerationClosed"
+}
+
 #######################################
 # Create SLURM submission files & submit for each folder in generation-$GENERATION_NUM.
+# Children that reuse results from the evaluation cache (cached-result.npz) are not submitted.
 # *** DOES NOT USE SLURM JOB ARRAY ***
 #######################################
 submitReaxFFOptimizations() {
-total_num_files=$POPULATION_SIZE
+total_num_files=$((POPULATION_SIZE + NUM_EXTRA_CHILDREN))
 
 # Safety measure
 if [[ ! -d "${POPULATION_PATH}/generation-${GENERATION_NUM}" ]]; then
@@ -90,6 +118,9 @@ echo "Submitting simulations for generation-${GENERATION_NUM}..."
 for ((i = 0; i < ${total_num_files}; i++)); do
 INPUT="child-${i}"
 cd "${POPULATION_PATH}/generation-${GENERATION_NUM}/$INPUT" || exit
+if [[ -f cached-result.npz ]]; then
+  continue
+fi
 
 cat > $INPUT.sh << EOF
 #!/bin/bash -l
@@ -133,13 +164,23 @@ SECONDS=0
 while [ $GENERATION_NUM -le $MAX_GENERATION_NUM ]; do
     main
     submitReaxFFOptimizations
+    watchGeneration
 
-    num_optimizations_remaining=${POPULATION_SIZE}
+    num_optimizations_remaining=$((POPULATION_SIZE + NUM_EXTRA_CHILDREN))
     while [ "$num_optimizations_remaining" -gt 0 ]; do
         echo "Number of remaining jobs: ${num_optimizations_remaining}..."
         sleep ${JOB_INTERVAL}
         num_optimizations_remaining=$(squeue -u ${USER} | grep -c ${JOB_NAME})
+        # Over-provisioned generation closed by the watcher -> the remaining (straggling) jobs are not waited for.
+        # A watcher that timed out or failed did not close the generation -> its jobs are still waited for.
+        if [ "${NUM_EXTRA_CHILDREN}" -gt 0 ] && ! kill -0 ${watcher_pid} 2>/dev/null && generationClosed; then
+            scancel -u ${USER} --name ${JOB_NAME}
+            break
+        fi
     done
+    # Failed children never complete -> stop the watcher once all jobs are done
+    kill ${watcher_pid} 2>/dev/null
+    wait ${watcher_pid} 2>/dev/null
 
     GENERATION_NUM=$((GENERATION_NUM + 1))
     echo "Time Elapsed: ${SECONDS} seconds."
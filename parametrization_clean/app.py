@@ -1,20 +1,31 @@
 #!/usr/bin/env python3
 
 """Main module to initialize/propagate genetic population and output files containing Individuals to execute
-using ReaxFF.
+using ReaxFF, and to stage the results of a generation's ReaxFF optimizations while they complete.
+Generations can either be propagated one per process (`run_application`), or consecutively in a single long-running
+process (`run_generations`) that keeps settings, reference data and the trained ANN in memory between generations.
+Alternatively, the steady-state GA (`run_steady_state`) creates new children as soon as evaluations finish, without
+generations.
 """
 
 # Standard library
+import os
+import subprocess
 
 # 3rd party packages
 
 # Local source
-from parametrization_clean.use_case.population_initializer import PopulationInitializer
-from parametrization_clean.use_case.population_propagator import PopulationPropagator
+from parametrization_clean.use_case.generation_loop import GenerationLoop
+from parametrization_clean.use_case.steady_state_loop import SteadyStateLoop
 from parametrization_clean.use_case.population_writer import PopulationWriter
 from parametrization_clean.infrastructure.config.local import UserSettings
 from parametrization_clean.infrastructure.repository.from_files import PopulationFileRepository
+from parametrization_clean.infrastructure.repository.generation_manifest import GenerationManifest, count_statuses
 from parametrization_clean.infrastructure.presenter.file_writer import DataWriter
+from parametrization_clean.infrastructure.evaluator.from_files import FileReaxEvaluator
+from parametrization_clean.infrastructure.utils.completion_watcher import CompletionWatcher
+from parametrization_clean.infrastructure.utils.local_runner import LocalReaxRunner, LATE_ERROR, is_late
+from parametrization_clean.infrastructure.utils.response_object import ResponseSuccess, ResponseWarning, ResponseFailure
 
 
 def run_application(generation_number, training_path, population_path, config_path):
@@ -38,36 +49,368 @@ def run_application(generation_number, training_path, population_path, config_pa
         response: ResponseSuccess, ResponseWarning, or ResponseFailure
             Response object indicating if next generation was successfully created.
     """
+    generation_driver = GenerationDriver(training_path, population_path, config_path, generation_number)
+    return generation_driver.step(generation_number)
+
+
+def run_generations(generation_number, max_generation_number, training_path, population_path, config_path,
+                    evaluate_command=None, timeout=None, poll_interval=1.0, use_local_runner=False):
+    """Long-running application driver that propagates generations `generation_number` to `max_generation_number`
+    in a single process, blocking on the evaluation of each generation's ReaxFF optimizations in between. Once the
+    last generation is evaluated, its outputs are gathered by propagating one more generation (which is not evaluated).
+
+    Settings, the training set, the root individual and the parameter index are only read once, and the ANN of the
+    nested GA is trained further from one generation to the next instead of being rebuilt.
+
+    Parameters
+    ----------
+    generation_number: int
+        Generation number at which to start the generational genetic algorithm.
+    max_generation_number: int
+        Last generation number to evaluate.
+    training_path: str
+        File path with location of reference training set files.
+    population_path: str
+        File path with desired output location for generational GA data.
+    config_path: str, optional
+        File path containing JSON user configuration file.
+    evaluate_command: str, optional
+        Shell command that runs (or submits and waits for) the ReaxFF optimizations of a generation and returns once
+        they are completed; `{generation_number}` and `{generation_path}` are replaced by the generation's number
+        and directory. By default, the optimizations are assumed to be run by another process, and the generation's
+        children are watched until they complete.
+    timeout: float, optional
+        Maximum time to watch the children of a generation, in seconds (ignored if `evaluate_command` is given).
+    poll_interval: float, default = 1.0
+        Initial interval between checks of the children's directories, in seconds.
+    use_local_runner: bool, default = False
+        Whether to run the optimizations on the local machine with the built-in runner (see `evaluate_generation`),
+        instead of `evaluate_command` or watching the children.
+
+    Returns
+    -------
+        response: ResponseSuccess, ResponseWarning, or ResponseFailure
+            Response object of the last propagated generation, or of the first step that failed.
+    """
+    generation_driver = GenerationDriver(training_path, population_path, config_path, generation_number)
+    return generation_driver.run(generation_number, max_generation_number, evaluate_command, timeout, poll_interval,
+                                 use_local_runner)
+
+
+def evaluate_generation(generation_number, training_path, population_path, config_path):
+    """Run the ReaxFF optimizations of generation `generation_number` on the local machine, through a bounded pool of
+    `runner_settings.num_run_workers` processes, and stage the results of each child as soon as its optimization
+    succeeds. Optimizations are killed after `runner_settings.run_timeout` seconds and restarted up to
+    `runner_settings.max_retries` times if they crash (or, with `runner_settings.reseed_stragglers`, replaced by fresh
+    individuals if they time out). The status of the children is tracked in the generation's manifest.
+
+    The generation is closed once `ga_settings.population_size` children have completed (if it was over-provisioned
+    with `ga_settings.num_extra_children` children) or once `runner_settings.generation_deadline` seconds have
+    passed; the children that have not completed by then are killed and recorded as late failures.
+
+    Parameters
+    ----------
+    generation_number: int
+        Generation number of the generation to evaluate.
+    training_path: str
+        File path with location of reference training set files.
+    population_path: str
+        File path with desired output location for generational GA data.
+    config_path: str, optional
+        File path containing JSON user configuration file.
+
+    Returns
+    -------
+        response: ResponseSuccess, ResponseWarning, or ResponseFailure
+            Response object indicating if the optimizations of all, some or none of the children succeeded.
+    """
     user_settings = UserSettings(config_path)
     population_repository = PopulationFileRepository(training_path, population_path,
                                                      user_settings, generation_number)
-    population_writer = PopulationWriter(population_repository)
-
-    if generation_number == 1:
-        # First generation of the genetic algorithm --> initialize first population
-        population_initializer = PopulationInitializer(population_repository, user_settings)
-        next_population = population_initializer.execute()
-    else:
-        # Generation number > 1. Propagate population by either using standalone GA or by using GA + nested ANN.
-        previous_generation_number = generation_number - 1
-        previous_population, successfully_retrieved_case_numbers = \
-            population_repository.get_population(previous_generation_number)
-
-        enough_generations_elapsed = (previous_generation_number >=
-                                      user_settings.neural_net_settings.num_populations_to_train_on)
-        use_neural_network = user_settings.ga_settings.use_neural_network
-        if use_neural_network and enough_generations_elapsed:
-            from parametrization_clean.use_case.nested_ga_with_ann import GeneticNeuralNetPropagator
-            population_propagator = GeneticNeuralNetPropagator(user_settings, population_repository)
-            next_population, _, history = population_propagator.execute(previous_population)
+    generation_dir_path = os.path.join(population_path,
+                                       PopulationFileRepository.GENERATION_FOLDER_PREFIX + str(generation_number))
+    evaluator = _file_evaluator(user_settings, population_repository)
+    return _run_children(evaluator, generation_number, generation_dir_path)
+
+
+def run_steady_state(num_evaluations, training_path, population_path, config_path):
+    """Run the steady-state (asynchronous) genetic algorithm on the local machine: up to
+    `runner_settings.num_run_workers` ReaxFF optimizations run at the same time, and whenever one finishes, new
+    children are bred right away from the pool of the best `ga_settings.population_size` evaluated individuals. Each
+    evaluation gets its own directory, `steady-state/child-<evaluation number>`, in the population path.
+
+    Parameters
+    ----------
+    num_evaluations: int
+        Total number of ReaxFF optimizations to run, including the initial population.
+    training_path: str
+        File path with location of reference training set files.
+    population_path: str
+        File path with desired output location for genetic algorithm data.
+    config_path: str, optional
+        File path containing JSON user configuration file.
+
+    Returns
+    -------
+        response: ResponseSuccess, ResponseWarning, or ResponseFailure
+            Response object with the best evaluated individual, indicating if all, some or none of the evaluations
+            succeeded.
+    """
+    user_settings = UserSettings(config_path)
+    population_repository = PopulationFileRepository(training_path, population_path, user_settings, 1)
+    evaluator = FileReaxEvaluator(population_repository, _local_runner(user_settings))
+    steady_state_loop = SteadyStateLoop(user_settings, population_repository, evaluator,
+                                        user_settings.runner_settings.num_run_workers)
+
+    # Evaluated individual (None if failed) by evaluation number
+    evaluations = {}
+
+    def on_evaluation(case_number, individual):
+        evaluations[case_number] = individual
+
+    steady_state_loop.run(num_evaluations, on_evaluation=on_evaluation)
+    successful_evaluations = {case_number: individual for case_number, individual in evaluations.items()
+                              if individual is not None}
+    steady_state_path = os.path.join(population_path, FileReaxEvaluator.STEADY_STATE_FOLDER_NAME)
+    if not successful_evaluations:
+        return ResponseFailure.build_system_error("None of the {} evaluations at {} succeeded."
+                                                  .format(len(evaluations), steady_state_path))
+
+    best_case_number = min(successful_evaluations, key=lambda case_number: successful_evaluations[case_number].cost)
+    message = "{} of {} evaluations at {} succeeded; best cost {:.6g} ({}).".format(
+        len(successful_evaluations), len(evaluations), steady_state_path,
+        successful_evaluations[best_case_number].cost,
+        PopulationFileRepository.INDIVIDUAL_FOLDER_PREFIX + str(best_case_number))
+    if len(successful_evaluations) < len(evaluations):
+        return ResponseWarning(message=message)
+    return ResponseSuccess(message=message)
+
+
+class GenerationDriver(object):
+    """Propagates generations of the genetic algorithm, keeping the user settings, the population repository (and
+    with it the training set, root individual and parameter index) and the trained ANN in memory from one generation
+    to the next.
+    """
+
+    def __init__(self, training_path, population_path, config_path, generation_number=1):
+        self.user_settings = UserSettings(config_path)
+        self.population_repository = PopulationFileRepository(training_path, population_path,
+                                                              self.user_settings, generation_number)
+        self.population_writer = PopulationWriter(self.population_repository)
+        self.population_path = population_path
+        self.evaluator = _file_evaluator(self.user_settings, self.population_repository)
+        # Keeps the ANN of the last nested GA run, trained further by the next one
+        self.generation_loop = GenerationLoop(self.user_settings, self.population_repository, self.evaluator)
+
+    def step(self, generation_number):
+        """Either initialize the first population (`generation_number` = 1) or propagate the population one step
+        forward (`generation_number` > 1), and write the individuals of generation `generation_number`.
+        """
+        population_repository = self.population_repository
+        population_repository.set_generation_number(generation_number)
+
+        if generation_number == 1:
+            # First generation of the genetic algorithm --> initialize first population
+            next_population = self.generation_loop.initialize()
         else:
-            population_propagator = PopulationPropagator(user_settings, population_repository)
-            next_population = population_propagator.execute(previous_population)
-            history = None
+            # Generation number > 1. Propagate population by either using standalone GA or by using GA + nested ANN.
+            # The previous generation is completed at this point -> consolidate it into its archive
+            previous_population = population_repository.compact_generation(generation_number - 1)
+            successfully_retrieved_case_numbers = previous_population.case_numbers.tolist()
+            next_population, history = self.generation_loop.propagate(previous_population, generation_number)
+
+            DataWriter.write_outputs(previous_population, successfully_retrieved_case_numbers, population_repository,
+                                     self.user_settings, generation_number, history)
 
-        DataWriter.write_outputs(previous_population, successfully_retrieved_case_numbers, population_repository,
-                                 user_settings, generation_number, history)
+        return self.population_writer.write_population(next_population, generation_number)
 
-    response = population_writer.write_population(next_population, generation_number)
+    def evaluate(self, generation_number, evaluate_command=None, timeout=None, poll_interval=1.0,
+                 use_local_runner=False):
+        """Block until the ReaxFF optimizations of generation `generation_number` are completed, either by running
+        them with the local runner, by running `evaluate_command`, or by watching (and staging) the generation's
+        children.
+        """
+        generation_dir_path = os.path.join(self.population_path,
+                                           PopulationFileRepository.GENERATION_FOLDER_PREFIX + str(generation_number))
+        if use_local_runner:
+            return _run_children(self.evaluator, generation_number, generation_dir_path)
+        if evaluate_command is None:
+            return _watch_children(self.population_repository, generation_number, generation_dir_path, timeout,
+                                   poll_interval, self.user_settings.runner_settings.generation_deadline)
 
-    return response
+        command = evaluate_command.format(generation_number=generation_number, generation_path=generation_dir_path)
+        return_code = subprocess.call(command, shell=True)
+        if return_code:
+            return ResponseFailure.build_system_error("Evaluation command '{}' exited with status {}."
+                                                      .format(command, return_code))
+        return ResponseSuccess(message="Generation directory {} evaluated.".format(generation_dir_path))
+
+    def run(self, generation_number, max_generation_number, evaluate_command=None, timeout=None, poll_interval=1.0,
+            use_local_runner=False):
+        """Propagate and evaluate generations `generation_number` to `max_generation_number`, then propagate one
+        more generation to gather the outputs of the last evaluated one. Stops at the first step that fails.
+        """
+        for current_generation_number in range(generation_number, max_generation_number + 1):
+            response = self.step(current_generation_number)
+            if not response:
+                return response
+            response = self.evaluate(current_generation_number, evaluate_command, timeout, poll_interval,
+                                     use_local_runner)
+            if not response:
+                return response
+        return self.step(max_generation_number + 1)
+
+
+def watch_generation(generation_number, training_path, population_path, config_path, timeout=None,
+                     poll_interval=1.0):
+    """Watch the children of generation `generation_number` while their ReaxFF optimizations run, and stage the
+    results of each child as soon as its fort.99 file is complete. Propagating the population afterwards
+    (`run_application` with `generation_number` + 1) then merges the staged results instead of parsing every child.
+
+    Parameters
+    ----------
+    generation_number: int
+        Generation number of the generation being evaluated.
+    training_path: str
+        File path with location of reference training set files.
+    population_path: str
+        File path with desired output location for generational GA data.
+    config_path: str, optional
+        File path containing JSON user configuration file.
+    timeout: float, optional
+        Maximum time to watch the generation, in seconds. Watches until all children have completed by default.
+    poll_interval: float, default = 1.0
+        Initial interval between checks of the children's directories, in seconds.
+
+    The generation is closed once `ga_settings.population_size` children have been staged (if it was
+    over-provisioned with `ga_settings.num_extra_children` children) or once `runner_settings.generation_deadline`
+    seconds have passed; the children that have not completed by then are recorded as late failures (their
+    optimizations are not stopped, but their results are ignored).
+
+    Returns
+    -------
+        response: ResponseSuccess or ResponseWarning
+            Response object indicating if all children of the generation were staged.
+    """
+    user_settings = UserSettings(config_path)
+    population_repository = PopulationFileRepository(training_path, population_path,
+                                                     user_settings, generation_number)
+    generation_dir_path = os.path.join(population_path,
+                                       PopulationFileRepository.GENERATION_FOLDER_PREFIX + str(generation_number))
+    return _watch_children(population_repository, generation_number, generation_dir_path, timeout, poll_interval,
+                           user_settings.runner_settings.generation_deadline)
+
+
+def _local_runner(user_settings):
+    runner_settings = user_settings.runner_settings
+    return LocalReaxRunner(runner_settings.reax_command, runner_settings.num_run_workers, runner_settings.run_timeout,
+                           runner_settings.max_retries)
+
+
+def _file_evaluator(user_settings, population_repository):
+    """Evaluator running the children of `population_repository` with the local runner. With
+    `runner_settings.reseed_stragglers`, children that time out are replaced by fresh individuals bred from the
+    previous generation (see `GenerationLoop.reseed`).
+    """
+    evaluator = FileReaxEvaluator(population_repository, _local_runner(user_settings),
+                                  user_settings.runner_settings.generation_deadline)
+    if user_settings.runner_settings.reseed_stragglers:
+        generation_loop = GenerationLoop(user_settings, population_repository, evaluator)
+        # Parents by generation number, read once
+        parents = {}
+
+        def reseed(generation_number):
+            if generation_number > 1 and generation_number not in parents:
+                parents[generation_number] = population_repository.get_population_matrix(generation_number - 1)
+            return generation_loop.reseed(parents.get(generation_number))
+
+        evaluator.reseed = reseed
+    return evaluator
+
+
+def _run_children(evaluator, generation_number, generation_dir_path):
+    """Run the optimizations of the children of a generation locally; see `evaluate_generation`."""
+    population_repository = evaluator.population_repository
+    num_children = population_repository.num_children
+    errors = evaluator.run_generation(generation_number)
+    failures = {case_number: error for case_number, error in errors.items() if error is not None}
+    num_late = sum(is_late(error) for error in failures.values())
+
+    if not failures:
+        return ResponseSuccess(message="All {} children of generation directory {} were evaluated."
+                               .format(num_children, generation_dir_path))
+    if num_late == len(failures) and num_children - num_late >= population_repository.population_size:
+        return ResponseSuccess(message="{} of {} children of generation directory {} were evaluated; the generation "
+                               "was closed before the {} others completed."
+                               .format(num_children - num_late, num_children, generation_dir_path, num_late))
+    errors = " ".join(failures[case_number] for case_number in sorted(failures))
+    message = "{} of {} children of generation directory {} failed: {}".format(len(failures), num_children,
+                                                                               generation_dir_path, errors)
+    if len(failures) == num_children:
+        return ResponseFailure.build_system_error(message)
+    return ResponseWarning(message=message)
+
+
+def _watch_children(population_repository, generation_number, generation_dir_path, timeout, poll_interval,
+                    deadline=None):
+    """Stage the results of the children of a generation as they complete; see `watch_generation`.
+    Children whose results were reused from the evaluation cache are not run, hence not watched.
+    """
+    num_children = population_repository.num_children
+    cached_case_numbers = set(population_repository.cached_case_numbers(generation_number))
+    case_numbers = [case_number for case_number in range(num_children) if case_number not in cached_case_numbers]
+    child_dirs = [os.path.join(generation_dir_path, PopulationFileRepository.INDIVIDUAL_FOLDER_PREFIX + str(i))
+                  for i in case_numbers]
+    # Over-provisioned generation -> closed once `population_size` children have completed
+    num_required = None
+    if num_children > population_repository.population_size:
+        num_required = max(0, population_repository.population_size - len(cached_case_numbers))
+
+    # The watch ends at the deadline (closing the generation) unless it times out first
+    closes_at_deadline = deadline is not None and (timeout is None or deadline <= timeout)
+    completion_watcher = CompletionWatcher(child_dirs, poll_interval=poll_interval)
+    staged_case_numbers = completion_watcher.watch(
+        lambda index, _: population_repository.stage_child(generation_number, case_numbers[index]),
+        timeout=deadline if closes_at_deadline else timeout, num_required=num_required)
+    num_staged = len(staged_case_numbers) + len(cached_case_numbers)
+
+    if num_staged == num_children:
+        return ResponseSuccess(message="All {} children of generation directory {} were staged."
+                               .format(num_children, generation_dir_path))
+    if num_staged >= population_repository.population_size or closes_at_deadline:
+        # Generation closed -> the children that have not completed are late
+        late_case_numbers = sorted(set(case_numbers).difference(case_numbers[index] for index in staged_case_numbers))
+        population_repository.mark_late(generation_number, {
+            case_number: "{}: generation closed before child-{} completed.".format(LATE_ERROR, case_number)
+            for case_number in late_case_numbers})
+        message = "{} of {} children of generation directory {} were staged; the generation was closed before the " \
+                  "{} others completed.".format(num_staged, num_children, generation_dir_path, len(late_case_numbers))
+        if num_staged >= population_repository.population_size:
+            return ResponseSuccess(message=message)
+        return ResponseWarning(message=message)
+    return ResponseWarning(message="{} of {} children of generation directory {} were staged before the watch ended."
+                           .format(num_staged, num_children, generation_dir_path))
+
+
+def get_generation_status(generation_number, population_path):
+    """Status of the children of generation `generation_number`, read from the generation's manifest only.
+
+    Parameters
+    ----------
+    generation_number: int
+        Generation number of the generation to query.
+    population_path: str
+        File path with output location for generational GA data.
+
+    Returns
+    -------
+        manifest: dict or None
+            Content of the generation manifest (see `generation_manifest`) with the number of children per status
+            (`status_counts`), or None if the generation has no manifest.
+    """
+    generation_dir_path = os.path.join(population_path,
+                                       PopulationFileRepository.GENERATION_FOLDER_PREFIX + str(generation_number))
+    manifest = GenerationManifest(generation_dir_path).read()
+    if manifest is not None:
+        manifest['status_counts'] = count_statuses(manifest['children'])
+    return manifest
@@ -4,27 +4,38 @@
 
 # Standard library
 import sys
+import time
 import click
 
 # 3rd party packages
 
 # Local source
-from parametrization_clean.app import run_application
+from parametrization_clean.app import (run_application, run_generations, evaluate_generation, watch_generation,
+                                       get_generation_status, run_steady_state)
 
 
-@click.command('cli', short_help="Run one generation of GA.")
+@click.group('cli', invoke_without_command=True, short_help="Run one generation of GA.")
 @click.option('-g', '--generation_number', default=1, show_default=True, type=click.IntRange(min=1), required=True,
               help="Generation number for the genetic algorithm. Default = 1 = first generation.")
-@click.option('-t', '--training_path', type=click.Path(), required=True,
-              help="File path with reference/training set files.")
-@click.option('-p', '--population_path', type=click.Path(), required=True,
-              help="File path for generational genetic algorithm output.")
+@click.option('-t', '--training_path', type=click.Path(),
+              help="File path with reference/training set files.  [required]")
+@click.option('-p', '--population_path', type=click.Path(),
+              help="File path for generational genetic algorithm output.  [required]")
 @click.option('-c', '--config_path', type=click.Path(),
               help="File path with location of (optional) user configuration file.")
-def main(generation_number, training_path, population_path, config_path):
+@click.pass_context
+def main(context, generation_number, training_path, population_path, config_path):
     """Command-line interface for genetic algorithm + neural network generational propagation.
     Runs one generation of the GA.
     """
+    if context.invoked_subcommand is not None:
+        return None
+    # Options are only required when running a generation, not for the subcommands
+    if not training_path:
+        raise click.MissingParameter(ctx=context, param_type="option", param_hint="'-t' / '--training_path'")
+    if not population_path:
+        raise click.MissingParameter(ctx=context, param_type="option", param_hint="'-p' / '--population_path'")
+
     # TODO: Make population size a command line option instead of a user configuration file option?
     click.echo("Generation Number: {}".format(generation_number))
     click.echo("Retrieving reference data from: {}".format(training_path))
@@ -38,5 +49,146 @@ def main(generation_number, training_path, population_path, config_path):
     return response.status_code
 
 
+@main.command('run', short_help="Run many generations of GA in a single process.")
+@click.option('-g', '--generation_number', default=1, show_default=True, type=click.IntRange(min=1),
+              help="Generation number at which to start the genetic algorithm.")
+@click.option('-m', '--max_generation_number', type=click.IntRange(min=1), required=True,
+              help="Last generation number whose ReaxFF optimizations are evaluated.")
+@click.option('-t', '--training_path', type=click.Path(), required=True,
+              help="File path with reference/training set files.")
+@click.option('-p', '--population_path', type=click.Path(), required=True,
+              help="File path for generational genetic algorithm output.")
+@click.option('-c', '--config_path', type=click.Path(),
+              help="File path with location of (optional) user configuration file.")
+@click.option('-e', '--evaluate_command',
+              help="Shell command that runs the ReaxFF optimizations of a generation and returns once they are "
+                   "completed; {generation_number} and {generation_path} are replaced by the generation's number and "
+                   "directory. Default = watch the children until they complete.")
+@click.option('-l', '--local', 'use_local_runner', is_flag=True, default=False,
+              help="Run the ReaxFF optimizations on this machine with the built-in runner (see runner_settings).")
+@click.option('--timeout', type=click.FloatRange(min=0), default=None,
+              help="Maximum time to watch the children of a generation, in seconds (without --evaluate_command).")
+@click.option('--poll_interval', type=click.FloatRange(min=0), default=1.0, show_default=True,
+              help="Initial interval between checks of the children's directories, in seconds.")
+def run(generation_number, max_generation_number, training_path, population_path, config_path, evaluate_command,
+        use_local_runner, timeout, poll_interval):
+    """Run generations GENERATION_NUMBER to MAX_GENERATION_NUMBER of the GA in a single process, waiting for the
+    ReaxFF optimizations of each generation before propagating the next one. Settings, reference data and the
+    trained ANN are kept in memory between generations.
+    """
+    if max_generation_number < generation_number:
+        raise click.BadParameter("must be at least the generation number ({}).".format(generation_number),
+                                 param_hint="'-m' / '--max_generation_number'")
+    if use_local_runner and evaluate_command:
+        raise click.BadParameter("cannot be combined with --local.", param_hint="'-e' / '--evaluate_command'")
+    click.echo("Running generations {} to {} at: {}".format(generation_number, max_generation_number, population_path))
+
+    response = run_generations(generation_number, max_generation_number, training_path, population_path,
+                               config_path, evaluate_command, timeout, poll_interval, use_local_runner)
+
+    click.echo("{}: {}".format(response.type, response.message))
+    return response.status_code
+
+
+@main.command('evaluate', short_help="Run the ReaxFF optimizations of a generation on this machine.")
+@click.option('-g', '--generation_number', type=click.IntRange(min=1), required=True,
+              help="Generation number of the generation to evaluate.")
+@click.option('-t', '--training_path', type=click.Path(), required=True,
+              help="File path with reference/training set files.")
+@click.option('-p', '--population_path', type=click.Path(), required=True,
+              help="File path for generational genetic algorithm output.")
+@click.option('-c', '--config_path', type=click.Path(),
+              help="File path with location of (optional) user configuration file.")
+def evaluate(generation_number, training_path, population_path, config_path):
+    """Run the ReaxFF optimizations of the children of a generation on this machine, a few at a time, and stage the
+    results of each child as soon as its optimization succeeds. The command, number of concurrent optimizations,
+    time limit and number of restarts are set in the runner_settings of the user configuration file.
+    """
+    click.echo("Evaluating generation {} at: {}".format(generation_number, population_path))
+
+    response = evaluate_generation(generation_number, training_path, population_path, config_path)
+
+    click.echo("{}: {}".format(response.type, response.message))
+    return response.status_code
+
+
+@main.command('steady', short_help="Run the steady-state GA on this machine.")
+@click.option('-n', '--num_evaluations', type=click.IntRange(min=1), required=True,
+              help="Total number of ReaxFF optimizations to run, including the initial population.")
+@click.option('-t', '--training_path', type=click.Path(), required=True,
+              help="File path with reference/training set files.")
+@click.option('-p', '--population_path', type=click.Path(), required=True,
+              help="File path for genetic algorithm output.")
+@click.option('-c', '--config_path', type=click.Path(),
+              help="File path with location of (optional) user configuration file.")
+def steady(num_evaluations, training_path, population_path, config_path):
+    """Run the steady-state genetic algorithm on this machine: whenever one of the concurrent ReaxFF optimizations
+    finishes, new children are bred right away from the best individuals evaluated so far, so no optimization waits
+    for the slowest child of a generation. The nested ANN is not used.
+    """
+    click.echo("Running {} steady-state evaluations at: {}".format(num_evaluations, population_path))
+
+    response = run_steady_state(num_evaluations, training_path, population_path, config_path)
+
+    click.echo("{}: {}".format(response.type, response.message))
+    return response.status_code
+
+
+@main.command('watch', short_help="Stage results of a generation's children as they complete.")
+@click.option('-g', '--generation_number', type=click.IntRange(min=1), required=True,
+              help="Generation number of the generation whose ReaxFF optimizations are running.")
+@click.option('-t', '--training_path', type=click.Path(), required=True,
+              help="File path with reference/training set files.")
+@click.option('-p', '--population_path', type=click.Path(), required=True,
+              help="File path for generational genetic algorithm output.")
+@click.option('-c', '--config_path', type=click.Path(),
+              help="File path with location of (optional) user configuration file.")
+@click.option('--timeout', type=click.FloatRange(min=0), default=None,
+              help="Maximum time to watch the generation, in seconds. Default = until all children complete.")
+@click.option('--poll_interval', type=click.FloatRange(min=0), default=1.0, show_default=True,
+              help="Initial interval between checks of the children's directories, in seconds.")
+def watch(generation_number, training_path, population_path, config_path, timeout, poll_interval):
+    """Watch the children of a generation while their ReaxFF optimizations run, and parse and stage the results of
+    each child as soon as its fort.99 file is complete. Propagating to the next generation then merges the staged
+    results instead of parsing every child. Over-provisioned generations (`num_extra_children`) are closed once
+    `population_size` children have completed, and any generation once its `generation_deadline` has passed.
+    """
+    click.echo("Watching generation {} at: {}".format(generation_number, population_path))
+
+    response = watch_generation(generation_number, training_path, population_path, config_path, timeout,
+                                poll_interval)
+
+    click.echo("{}: {}".format(response.type, response.message))
+    return response.status_code
+
+
+@main.command('status', short_help="Show the status of the children of a generation.")
+@click.option('-g', '--generation_number', type=click.IntRange(min=1), required=True,
+              help="Generation number of the generation to query.")
+@click.option('-p', '--population_path', type=click.Path(), required=True,
+              help="File path for generational genetic algorithm output.")
+@click.option('--children', is_flag=True, default=False,
+              help="Also show the status, cost and error of every child.")
+def status(generation_number, population_path, children):
+    """Show how many children of a generation are written, running, done, failed or cached. Only the generation's
+    manifest is read, so the query does not depend on the number of children's directories.
+    """
+    manifest = get_generation_status(generation_number, population_path)
+    if manifest is None:
+        raise click.ClickException("No manifest found for generation {} at: {}"
+                                   .format(generation_number, population_path))
+
+    click.echo("Generation {}: {} children (updated {})".format(
+        generation_number, manifest['population_size'],
+        time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(manifest['updated_at']))))
+    for child_status, count in manifest['status_counts'].items():
+        click.echo("  {}: {}".format(child_status, count))
+
+    if children:
+        for case_number, child in sorted(manifest['children'].items()):
+            cost = "-" if child.get('cost') is None else "{:.3f}".format(child['cost'])
+            click.echo("child-{}\t{}\t{}\t{}".format(case_number, child['status'], cost, child.get('error') or ""))
+
+
 if __name__ == "__main__":
     sys.exit(main())  # pragma: no cover
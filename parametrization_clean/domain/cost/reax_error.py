@@ -5,6 +5,7 @@
 # Standard library
 
 # 3rd party packages
+import numpy as np
 
 # Local source
 from parametrization_clean.domain.cost.strategy import IErrorStrategy
@@ -16,3 +17,31 @@ class ReaxError(IErrorStrategy):
     def error(reax_val, dft_val, weight, **kwargs) -> float:
         """Calculate ReaxFF error using error = ((reax_pred - true_val)/weight)^2."""
         return ((reax_val - dft_val) / weight) ** 2
+
+    @staticmethod
+    def error_batch(reax, dft, weights, **kwargs) -> np.ndarray:
+        """Total ReaxFF error of every row of `reax` as a single array expression:
+        sum over M of (reax_pred - true_val)^2 * (1/weight^2), i.e., one matrix-vector product over the population.
+
+        Parameters
+        ----------
+        reax: np.ndarray
+            (N, M) matrix (or single (M,) row) of ReaxFF energies.
+        dft: np.ndarray
+            (M,) vector of DFT/reference energies.
+        weights: np.ndarray
+            (M,) vector of weights.
+        inverse_squared_weights: np.ndarray, optional
+            Precomputed (M,) vector of 1/weight^2 (see `RootIndividual.inverse_squared_weights`); derived from
+            `weights` if not given.
+        Returns
+        -------
+        np.ndarray
+            (N,) vector of total errors (0-d array for a single (M,) row).
+        """
+        inverse_squared_weights = kwargs.get('inverse_squared_weights')
+        if inverse_squared_weights is None:
+            inverse_squared_weights = 1.0 / np.square(np.asarray(weights, dtype=np.float64))
+        deviations = np.asarray(reax, dtype=np.float64) - np.asarray(dft, dtype=np.float64)
+        deviations *= deviations
+        return deviations @ inverse_squared_weights
@@ -4,12 +4,15 @@
 in the genetic algorithm.
 New error calculation/objective function strategies can be added as classes,
 so long as they implement the abstraction presented here.
+Strategies only need to implement the scalar `error`; `error_batch` falls back to it, but should be overridden with an
+array expression whenever the error function can be vectorized.
 """
 
 # Standard library
 import abc
 
 # 3rd party packages
+import numpy as np
 
 # Local source
 
@@ -20,3 +23,29 @@ class IErrorStrategy(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def error(reax_val, dft_val, weight, **kwargs) -> float:
         raise NotImplementedError
+
+    @classmethod
+    def error_batch(cls, reax, dft, weights, **kwargs) -> np.ndarray:
+        """Total error (summed over all training set entries) of every individual in a population.
+        Fallback implementation that applies the scalar `error` element-wise.
+
+        Parameters
+        ----------
+        reax: np.ndarray
+            (N, M) matrix of ReaxFF energies; row i contains the M energies of individual i.
+            A single (M,) row is also accepted.
+        dft: np.ndarray
+            (M,) vector of DFT/reference energies.
+        weights: np.ndarray
+            (M,) vector of weights.
+        Returns
+        -------
+        np.ndarray
+            (N,) vector of total errors (0-d array for a single (M,) row).
+        """
+        reax = np.asarray(reax, dtype=np.float64)
+        rows = reax.reshape(-1, reax.shape[-1])
+        total_errors = np.array([sum(cls.error(reax_val, dft_val, weight, **kwargs)
+                                     for reax_val, dft_val, weight in zip(row, dft, weights))
+                                 for row in rows], dtype=np.float64)
+        return total_errors.reshape(reax.shape[:-1])
@@ -5,6 +5,7 @@ from typing import Tuple
 import random
 
 # 3rd party packages
+import numpy as np
 
 # Local source
 from parametrization_clean.domain.crossover.strategy import ICrossoverStrategy
@@ -48,3 +49,22 @@ class DoubleParetoCross(ICrossoverStrategy):
         child1 = Individual(child1_params, root_individual=root_individual)
         child2 = Individual(child2_params, root_individual=root_individual)
         return child1, child2
+
+    @staticmethod
+    def crossover_params(parent1_params: np.ndarray, parent2_params: np.ndarray,
+                         **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+        """Double Pareto crossover of two parameter vectors (see `crossover`). Random numbers are drawn from
+        `random` in the same order as `crossover`, so seeded runs are reproducible.
+        """
+        alpha = kwargs.get('dpx_alpha', 10)
+        beta = kwargs.get('dpx_beta', 1)
+
+        u = np.array([random.uniform(0, 1) for _ in range(len(parent1_params))])
+        upper = u >= 1 / 2
+        modified_beta = np.empty_like(u)
+        modified_beta[upper] = alpha * beta * (1 - (2 * u[upper]) ** (-1 / alpha))
+        modified_beta[~upper] = alpha * beta * ((1 - (2 * u[~upper])) ** (-1 / alpha) - 1)
+
+        params_sum = parent1_params + parent2_params
+        spread = modified_beta * np.abs(parent1_params - parent2_params)
+        return (params_sum + spread) / 2, (params_sum - spread) / 2
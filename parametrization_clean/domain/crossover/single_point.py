@@ -5,7 +5,7 @@ from typing import Tuple
 import random
 
 # 3rd party packages
-
+import numpy as np
 
 # Local source
 from parametrization_clean.domain.crossover.strategy import ICrossoverStrategy
@@ -29,3 +29,12 @@ class SinglePointCross(ICrossoverStrategy):
         child1 = Individual(parent1.params[:choice] + parent2.params[choice:], root_individual=root_individual)
         child2 = Individual(parent2.params[:choice] + parent1.params[choice:], root_individual=root_individual)
         return child1, child2
+
+    @staticmethod
+    def crossover_params(parent1_params: np.ndarray, parent2_params: np.ndarray,
+                         **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+        """Single-point crossover of two parameter vectors."""
+        choice = random.randrange(0, len(parent1_params))
+        child1_params = np.concatenate([parent1_params[:choice], parent2_params[choice:]])
+        child2_params = np.concatenate([parent2_params[:choice], parent1_params[choice:]])
+        return child1_params, child2_params
@@ -12,7 +12,7 @@ import abc
 from typing import Tuple
 
 # 3rd party packages
-
+import numpy as np
 
 # Local source
 from parametrization_clean.domain.individual import Individual
@@ -26,3 +26,13 @@ class ICrossoverStrategy(metaclass=abc.ABCMeta):
     def crossover(parent1: Individual, parent2: Individual, root_individual: RootIndividual,
                   **kwargs) -> Tuple[Individual, Individual]:
         raise NotImplementedError
+
+    @classmethod
+    def crossover_params(cls, parent1_params: np.ndarray, parent2_params: np.ndarray,
+                         **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+        """Crossover of two parameter vectors, e.g., rows of a PopulationMatrix. Strategies should override it with
+        an implementation on arrays; by default, the parameters are wrapped in Individual objects.
+        """
+        child1, child2 = cls.crossover(Individual(parent1_params.tolist()), Individual(parent2_params.tolist()), None,
+                                       **kwargs)
+        return np.asarray(child1.params, dtype=np.float64), np.asarray(child2.params, dtype=np.float64)
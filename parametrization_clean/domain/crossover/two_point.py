@@ -5,7 +5,7 @@ from typing import Tuple
 import random
 
 # 3rd party packages
-
+import numpy as np
 
 # Local source
 from parametrization_clean.domain.crossover.strategy import ICrossoverStrategy
@@ -27,3 +27,13 @@ class TwoPointCross(ICrossoverStrategy):
         child2 = Individual(parent2.params[:smaller_id] + parent1.params[smaller_id:bigger_id]
                             + parent2.params[bigger_id:], root_individual=root_individual)
         return child1, child2
+
+    @staticmethod
+    def crossover_params(parent1_params: np.ndarray, parent2_params: np.ndarray,
+                         **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+        """Two-point crossover of two parameter vectors: the segment between both points is swapped."""
+        smaller_id, bigger_id = sorted(random.sample(range(len(parent1_params)), 2))
+        child1_params, child2_params = parent1_params.copy(), parent2_params.copy()
+        child1_params[smaller_id:bigger_id] = parent2_params[smaller_id:bigger_id]
+        child2_params[smaller_id:bigger_id] = parent1_params[smaller_id:bigger_id]
+        return child1_params, child2_params
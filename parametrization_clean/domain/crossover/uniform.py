@@ -25,3 +25,10 @@ class UniformCross(ICrossoverStrategy):
         child2 = Individual(list(parent1.params * not_sieve + parent2.params * sieve), root_individual=root_individual)
 
         return child1, child2
+
+    @staticmethod
+    def crossover_params(parent1_params: np.ndarray, parent2_params: np.ndarray,
+                         **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+        """Uniform crossover of two parameter vectors."""
+        sieve = np.random.randint(2, size=len(parent1_params)).astype(bool)
+        return np.where(sieve, parent1_params, parent2_params), np.where(sieve, parent2_params, parent1_params)
@@ -4,7 +4,6 @@
 
 # Standard library
 from typing import List
-from copy import deepcopy
 
 # 3rd party packages
 
@@ -12,7 +11,6 @@ from copy import deepcopy
 from parametrization_clean.domain.root_individual import RootIndividual
 from parametrization_clean.domain.cost.strategy import IErrorStrategy
 from parametrization_clean.domain.cost.reax_error import ReaxError
-from parametrization_clean.domain.utils.helpers import set_param
 
 
 class Individual(object):
@@ -21,9 +19,8 @@ class Individual(object):
                  root_individual: RootIndividual = None, error_calculator: IErrorStrategy = ReaxError):
         """Individual/Case in the Genetic Algorithm. Unique based on its own params and corresponding ffield.
         Used as a data storage object.
-        Anything requiring creation of updating parameters also requires updating the ffield dict.
-        The ffield dict is updated by using the reference/root ffield dict and setting the parameters at the given
-        parameter keys.
+        The ffield dict is NOT stored; it is rendered lazily (see `ffield`) from the reference/root ffield dict by
+        setting the parameters at the given parameter keys, so creating an Individual only allocates its params.
 
         Parameters
         ----------
@@ -40,21 +37,36 @@ class Individual(object):
         self.reax_energies = reax_energies
 
         self.error_calculator = error_calculator
-        self.ffield = self.update_ffield(root_individual) if root_individual else None
-        self.cost = self.total_error(root_individual) if root_individual and reax_energies else None
+        self.root_individual = root_individual
+        self._ffield = None
+        evaluated = reax_energies is not None and len(reax_energies) > 0
+        self.cost = self.total_error(root_individual) if root_individual and evaluated else None
+
+    @property
+    def ffield(self):
+        """ffield dict for this Individual's `params`, built from the root ffield on every access
+        (typically only once, when the Individual is written). None if there is no root individual.
+        """
+        if self._ffield is not None:
+            return self._ffield
+        if self.root_individual is None:
+            return None
+        return self.update_ffield(self.root_individual)
+
+    @ffield.setter
+    def ffield(self, ffield):
+        self._ffield = ffield
 
     def total_error(self, root_individual: RootIndividual) -> float:
-        return sum(self.error_calculator.error(reax_val, dft_val, weight) for reax_val, dft_val, weight in
-                   zip(self.reax_energies, root_individual.dft_energies, root_individual.weights))
+        return float(self.error_calculator.error_batch(self.reax_energies, root_individual.dft_energies,
+                                                       root_individual.weights, **root_individual.error_kwargs))
 
     def update_ffield(self, root_individual: RootIndividual):
         """Update Individual's `ffield` based on `params` (to be used after mutation/mating).
-        Uses deepcopy to avoid mutating the original root ffield.
+        Scatters `params` into a copy of the root's flat ffield buffer, so the original root ffield is not mutated.
         """
-        ffield = deepcopy(root_individual.root_ffield)
-        for param, key in zip(self.params, root_individual.param_keys):
-            set_param(key, ffield, param)
-        return ffield
+        param_index = root_individual.param_index
+        return param_index.unflatten(param_index.inject(self.params, root_individual.root_buffer))
 
     @classmethod
     def from_root_individual(cls, root_individual: RootIndividual):
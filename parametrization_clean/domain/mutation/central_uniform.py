@@ -4,7 +4,7 @@
 import random
 
 # 3rd party packages
-
+import numpy as np
 
 # Local source
 from parametrization_clean.domain.mutation.strategy import IMutationStrategy
@@ -29,3 +29,13 @@ class CentralUniformMutate(IMutationStrategy):
             new_param = random.uniform(lower_bound + delta, upper_bound - delta)
             new_params.append(new_param)
         return Individual(new_params, root_individual=root_individual)
+
+    @staticmethod
+    def mutation_params(parent_params: np.ndarray, **kwargs) -> np.ndarray:
+        """Central uniform mutation of a parameter vector (see `mutation`). Random numbers are drawn from `random`
+        in the same order as `mutation`, so seeded runs are reproducible.
+        """
+        param_bounds = np.asarray(kwargs['param_bounds'], dtype=np.float64)
+        delta = (param_bounds[:, 1] - param_bounds[:, 0]) / 4
+        return np.array([random.uniform(lower_bound, upper_bound)
+                         for lower_bound, upper_bound in zip(param_bounds[:, 0] + delta, param_bounds[:, 1] - delta)])
@@ -4,7 +4,7 @@
 import random
 
 # 3rd party packages
-
+import numpy as np
 
 # Local source
 from parametrization_clean.domain.mutation.strategy import IMutationStrategy
@@ -31,3 +31,21 @@ class GaussianMutate(IMutationStrategy):
                 break
             cumulative_probability += probability
         return Individual(new_params, root_individual=root_individual)
+
+    @staticmethod
+    def mutation_params(parent_params: np.ndarray, **kwargs) -> np.ndarray:
+        """Gaussian mutation of a parameter vector (see `mutation`). Random numbers are drawn from `random` in the
+        same order as `mutation`, so seeded runs are reproducible. If `u` falls outside of the cumulative `gauss_frac`
+        probabilities (e.g., they sum to less than 1), the parameters are returned unchanged.
+        """
+        stds = kwargs.get('gauss_std', [0.1])
+        probabilities = kwargs.get('gauss_frac', [1.0])
+        u = random.uniform(0, 1)
+        new_params = parent_params.copy()
+        cumulative_probability = 0
+        for std, probability in zip(stds, probabilities):
+            if cumulative_probability < u <= (cumulative_probability + probability):
+                new_params = parent_params + parent_params * np.array([random.gauss(0, std) for _ in parent_params])
+                break
+            cumulative_probability += probability
+        return new_params
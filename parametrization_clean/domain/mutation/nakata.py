@@ -4,7 +4,7 @@
 import random
 
 # 3rd party packages
-
+import numpy as np
 
 # Local source
 from parametrization_clean.domain.mutation.strategy import IMutationStrategy
@@ -31,3 +31,14 @@ class NakataMutate(IMutationStrategy):
         high = kwargs.get('nakata_rand_higher', 1.0)
         new_params = [param + (scale * random.uniform(low, high) * param) for param in parent.params]
         return Individual(new_params, root_individual=root_individual)
+
+    @staticmethod
+    def mutation_params(parent_params: np.ndarray, **kwargs) -> np.ndarray:
+        """Nakata mutation of a parameter vector (see `mutation`). Random numbers are drawn from `random` in the
+        same order as `mutation`, so seeded runs are reproducible.
+        """
+        scale = kwargs.get('nakata_scale', 0.1)
+        low = kwargs.get('nakata_rand_lower', -1.0)
+        high = kwargs.get('nakata_rand_higher', 1.0)
+        rand_nums = np.array([random.uniform(low, high) for _ in range(len(parent_params))])
+        return parent_params + scale * rand_nums * parent_params
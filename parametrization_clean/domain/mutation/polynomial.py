@@ -4,7 +4,7 @@
 import random
 
 # 3rd party packages
-
+import numpy as np
 
 # Local source
 from parametrization_clean.domain.mutation.strategy import IMutationStrategy
@@ -32,3 +32,17 @@ class PolynomialMutate(IMutationStrategy):
                 param = param + delta_r * param
             new_params.append(param)
         return Individual(new_params, root_individual=root_individual)
+
+    @staticmethod
+    def mutation_params(parent_params: np.ndarray, **kwargs) -> np.ndarray:
+        """Polynomial mutation of a parameter vector (see `mutation`). Random numbers are drawn from `random` in
+        the same order as `mutation`, so seeded runs are reproducible.
+        """
+        eta = kwargs.get('polynomial_eta', 60)
+        poly_degree = 1 / (1 + eta)
+        u = np.array([random.random() for _ in range(len(parent_params))])
+        lower = u <= 0.5
+        delta = np.empty_like(u)
+        delta[lower] = (2 * u[lower]) ** poly_degree - 1
+        delta[~lower] = 1 - (2 * (1 - u[~lower])) ** poly_degree
+        return parent_params + delta * parent_params
@@ -11,7 +11,7 @@ __author__ = "Chad Daksha"
 import abc
 
 # 3rd party packages
-
+import numpy as np
 
 # Local source
 from parametrization_clean.domain.individual import Individual
@@ -24,3 +24,10 @@ class IMutationStrategy(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def mutation(parent: Individual, root_individual: RootIndividual, **kwargs) -> Individual:
         raise NotImplementedError
+
+    @classmethod
+    def mutation_params(cls, parent_params: np.ndarray, **kwargs) -> np.ndarray:
+        """Mutation of a parameter vector, e.g., a row of a PopulationMatrix. Strategies should override it with an
+        implementation on arrays; by default, the parameters are wrapped in an Individual object.
+        """
+        return np.asarray(cls.mutation(Individual(parent_params.tolist()), None, **kwargs).params, dtype=np.float64)
@@ -5,52 +5,78 @@ Uses Keras with TensorFlow backend to build the neural network.
 """
 
 # Standard library
-from typing import List
+from typing import List, Union
 
 # 3rd party packages
+import pandas as pd
 import tensorflow as tf
 
 # Local source
 from parametrization_clean.domain.individual import Individual
 from parametrization_clean.domain.root_individual import RootIndividual
+from parametrization_clean.domain.population_matrix import PopulationMatrix, as_population_matrix
 from parametrization_clean.domain.cost.strategy import IErrorStrategy
-from parametrization_clean.domain.neural_network.extract_data import (individuals_to_features_df,
-                                                                      individuals_to_features_and_outputs_df,
-                                                                      extract_features_and_outputs_from_combined_df)
-from parametrization_clean.domain.neural_network.transform_data import (train_test_split, normalize_features,
+from parametrization_clean.domain.neural_network.extract_data import population_matrix_to_features_df
+from parametrization_clean.domain.neural_network.transform_data import (train_test_split_indices, normalize_features,
                                                                         get_columns_to_remove,
                                                                         remove_problematic_columns)
 
 
 class FeedForwardNet:
 
-    def __init__(self, population: List[Individual], verbosity: int = 2, train_fraction: float = 0.80,
-                 num_epochs: int = 20000):
-        self.population = population
-        self.num_input_nodes = len(population[0].params)
-        self.num_output_nodes = len(population[0].reax_energies)
+    def __init__(self, population: Union[List[Individual], PopulationMatrix], verbosity: int = 2,
+                 train_fraction: float = 0.80, num_epochs: int = 20000):
+        self.population = as_population_matrix(population)
+        self.num_input_nodes = self.population.params.shape[1]
+        self.num_output_nodes = self.population.reax_energies.shape[1]
 
         self.train_fraction = train_fraction
         self.verbosity = verbosity
         self.num_epochs = num_epochs
 
-        x_y_df = individuals_to_features_and_outputs_df(population)
-        train_df, test_df = train_test_split(x_y_df, train_fraction)
-        train_x, self.train_y = extract_features_and_outputs_from_combined_df(train_df, self.num_input_nodes)
-        test_x, self.test_y = extract_features_and_outputs_from_combined_df(test_df, self.num_input_nodes)
-        self.columns_to_remove = get_columns_to_remove(train_x)
-        self.train_x = remove_problematic_columns(train_x, self.columns_to_remove)
-        self.test_x = remove_problematic_columns(test_x, self.columns_to_remove)
-
-        self.train_stats = self.train_x.describe().transpose()
+        # Training/test rows are gathered directly from the population arrays (which can be memory-mapped slices of
+        # the history store), without stacking parameters and energies of the whole population first
+        train_rows, test_rows = train_test_split_indices(len(self.population), train_fraction)
+        params, reax_energies = self.population.params, self.population.reax_energies
+        self.all_train_x, self.train_y = pd.DataFrame(params[train_rows]), pd.DataFrame(reax_energies[train_rows])
+        self.all_test_x, self.test_y = pd.DataFrame(params[test_rows]), pd.DataFrame(reax_energies[test_rows])
+        self.set_input_normalization(get_columns_to_remove(self.all_train_x))
+
+    def set_input_normalization(self, columns_to_remove, train_stats: pd.DataFrame = None):
+        """Remove `columns_to_remove` from the inputs and normalize them with `train_stats` (by default, the statistics
+        of the remaining training inputs).
+        """
+        self.columns_to_remove = columns_to_remove
+        self.train_x = remove_problematic_columns(self.all_train_x, self.columns_to_remove)
+        self.test_x = remove_problematic_columns(self.all_test_x, self.columns_to_remove)
+
+        self.train_stats = self.train_x.describe().transpose() if train_stats is None else train_stats
         self.normalized_train_x = normalize_features(self.train_x, self.train_stats)
         self.normalized_test_x = normalize_features(self.test_x, self.train_stats)
 
-    def execute(self):
-        model = self.build()
+    def execute(self, model=None):
+        """Build and fit a new model. If a previously trained `model` is given (e.g., the model of the previous
+        generation) and its input/output layers match the data, it is fitted further instead (warm start).
+        The input normalization (removed columns and statistics) is stored with the model: a warm-started model keeps
+        the normalization its weights were fitted with, instead of the one of the new training data.
+        """
+        if model is None or not self.is_compatible(model):
+            model = self.build()
+        else:
+            self.set_input_normalization(model.columns_to_remove, model.train_stats)
+        model.columns_to_remove, model.train_stats = self.columns_to_remove, self.train_stats
         history = self.fit(model)
         return model, history
 
+    def is_compatible(self, model) -> bool:
+        """Whether `model` has the input and output layers of the models built for this data, and the input
+        normalization it was fitted with.
+        """
+        has_normalization = isinstance(getattr(model, 'train_stats', None), pd.DataFrame) \
+            and getattr(model, 'columns_to_remove', None) is not None
+        same_layers = model.input_shape[-1] == self.num_input_nodes and model.output_shape[-1] == self.num_output_nodes
+        return has_normalization and same_layers
+
     def build(self):
         model = tf.keras.Sequential(
             [
@@ -79,9 +105,9 @@ class FeedForwardNet:
                             )
         return history
 
-    def predict_outputs(self, model, population: List[Individual]):
+    def predict_outputs(self, model, population: Union[List[Individual], PopulationMatrix]):
         """Given an ANN model and a population, predict the associated outputs with that population."""
-        x_df = individuals_to_features_df(population)
+        x_df = population_matrix_to_features_df(as_population_matrix(population))
         cleaned_x_df = remove_problematic_columns(x_df, self.columns_to_remove)
         normalized_x_df = normalize_features(cleaned_x_df, self.train_stats)
         y_predicted = model.predict(normalized_x_df)
@@ -90,12 +116,10 @@ class FeedForwardNet:
     @staticmethod
     def compute_costs(y_predicted, root_individual: RootIndividual, error_strategy: IErrorStrategy, **kwargs) \
             -> List[float]:
-        dft_energies = root_individual.dft_energies
-        weights = root_individual.weights
-        costs = [sum(error_strategy.error(reax_pred, dft_energy, weight, **kwargs)
-                     for reax_pred, dft_energy, weight in zip(y_pred_row, dft_energies, weights))
-                 for y_pred_row in y_predicted]
-        return costs
+        error_kwargs = dict(root_individual.error_kwargs, **kwargs)
+        costs = error_strategy.error_batch(y_predicted, root_individual.dft_energies, root_individual.weights,
+                                           **error_kwargs)
+        return costs.tolist()
 
 
 def r_square(y_true, y_pred):
@@ -6,10 +6,12 @@
 from typing import List, Tuple
 
 # 3rd party packages
+import numpy as np
 import pandas as pd
 
 # Local source
 from parametrization_clean.domain.individual import Individual
+from parametrization_clean.domain.population_matrix import PopulationMatrix
 
 
 def individuals_to_features_df(population: List[Individual]) -> pd.DataFrame:
@@ -21,6 +23,14 @@ def individuals_to_features_and_outputs_df(population: List[Individual]) -> pd.D
     return pd.DataFrame(data=params_and_reax_predictions)
 
 
+def population_matrix_to_features_df(population: PopulationMatrix) -> pd.DataFrame:
+    return pd.DataFrame(data=population.params)
+
+
+def population_matrix_to_features_and_outputs_df(population: PopulationMatrix) -> pd.DataFrame:
+    return pd.DataFrame(data=np.hstack((population.params, population.reax_energies)))
+
+
 def extract_features_and_outputs_from_combined_df(x_y_df: pd.DataFrame, num_features: int) \
         -> Tuple[pd.DataFrame, pd.DataFrame]:
     x_df = x_y_df.iloc[:, 0:num_features]
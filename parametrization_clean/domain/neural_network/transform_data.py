@@ -6,6 +6,7 @@
 from typing import Tuple
 
 # 3rd party packages
+import numpy as np
 import pandas as pd
 
 # Local source
@@ -18,6 +19,15 @@ def train_test_split(x_y_df: pd.DataFrame, train_fraction: float) -> Tuple[pd.Da
     return train_df, test_df
 
 
+def train_test_split_indices(num_rows: int, train_fraction: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Split rows 0, ..., `num_rows` - 1 into (sorted) training and test row indices, e.g., to gather the training
+    and test sets directly from (memory-mapped) arrays.
+    """
+    shuffled_rows = np.random.permutation(num_rows)
+    num_train_rows = int(round(train_fraction * num_rows))
+    return np.sort(shuffled_rows[:num_train_rows]), np.sort(shuffled_rows[num_train_rows:])
+
+
 def normalize_features(x_df: pd.DataFrame, x_train_stats: pd.DataFrame) -> pd.DataFrame:
     """Normalize the dataset according to training data statistics (obtained from pandas)."""
     return (x_df - x_train_stats['mean']) / x_train_stats['std']
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+
+"""Module with struct-of-arrays container for a whole genetic algorithm population. Instead of a list of Individual
+objects, each holding its own list of parameters, the population is stored as contiguous NumPy arrays:
+an (N, P) parameter matrix, an (N, M) ReaxFF energy matrix, a length-N cost vector and a length-N vector of case
+numbers. Conversion to Individual objects is only required at the boundaries that need them (e.g., writing files).
+"""
+
+# Standard library
+from typing import List, Sequence, Union
+
+# 3rd party packages
+import numpy as np
+
+# Local source
+from parametrization_clean.domain.individual import Individual
+from parametrization_clean.domain.root_individual import RootIndividual
+from parametrization_clean.domain.cost.strategy import IErrorStrategy
+from parametrization_clean.domain.cost.reax_error import ReaxError
+
+
+class PopulationMatrix(object):
+
+    def __init__(self, params, reax_energies=None, costs=None, case_numbers=None):
+        """Population of N individuals with P parameters and M ReaxFF energies each, stored column-wise.
+        Floating point inputs are stored without copying when possible; anything else is converted to float64.
+
+        Parameters
+        ----------
+        params: np.ndarray
+            (N, P) matrix; row i contains the parameters of individual i.
+        reax_energies: np.ndarray, optional
+            (N, M) matrix; row i contains the ReaxFF energies (output from fort.99) of individual i.
+            Rows of individuals that have not been evaluated are NaN.
+        costs: np.ndarray, optional
+            Length-N vector of costs. Unknown costs are NaN.
+        case_numbers: np.ndarray, optional
+            Length-N vector mapping each row to its case (child) number. Defaults to 0, 1, ..., N - 1.
+        """
+        self.params = _as_float_matrix(params)
+        num_individuals = self.params.shape[0]
+
+        self.reax_energies = None if reax_energies is None else _as_float_matrix(reax_energies)
+        self.costs = np.full(num_individuals, np.nan) if costs is None else np.asarray(costs, dtype=np.float64)
+        if case_numbers is None:
+            case_numbers = np.arange(num_individuals)
+        self.case_numbers = np.asarray(case_numbers, dtype=np.int64)
+
+    def __len__(self):
+        return self.params.shape[0]
+
+    def __iter__(self):
+        """Iterate over the population as (ffield-less) Individual objects; mainly a convenience for reporting."""
+        return iter(self.to_individuals())
+
+    @property
+    def num_params(self) -> int:
+        return self.params.shape[1]
+
+    @classmethod
+    def from_individuals(cls, population: List[Individual], case_numbers: Sequence[int] = None):
+        """Constructor from a list of Individual objects. Individuals without ReaxFF energies or costs are
+        stored as NaN rows/entries.
+        """
+        params = np.array([individual.params for individual in population], dtype=np.float64)
+        if not len(population):
+            params = params.reshape(0, 0)
+
+        evaluated = [individual.reax_energies for individual in population if individual.reax_energies is not None]
+        reax_energies = None
+        if evaluated:
+            reax_energies = np.full((len(population), len(evaluated[0])), np.nan)
+            for row, individual in enumerate(population):
+                if individual.reax_energies is not None:
+                    reax_energies[row] = individual.reax_energies
+
+        costs = [np.nan if individual.cost is None else individual.cost for individual in population]
+        return cls(params, reax_energies, costs, case_numbers)
+
+    @classmethod
+    def concatenate(cls, matrices: List['PopulationMatrix']):
+        """Stack several populations on top of each other, e.g., several generations."""
+        params = np.concatenate([matrix.params for matrix in matrices])
+        costs = np.concatenate([matrix.costs for matrix in matrices])
+        case_numbers = np.concatenate([matrix.case_numbers for matrix in matrices])
+
+        num_energies = [matrix.reax_energies.shape[1] for matrix in matrices if matrix.reax_energies is not None]
+        reax_energies = None
+        if num_energies:
+            reax_energies = np.concatenate([matrix.reax_energies if matrix.reax_energies is not None
+                                            else np.full((len(matrix), num_energies[0]), np.nan)
+                                            for matrix in matrices])
+        return cls(params, reax_energies, costs, case_numbers)
+
+    def take(self, indices: Union[slice, Sequence[int], np.ndarray]) -> 'PopulationMatrix':
+        """Subset of the population. Slices return views on the underlying arrays; index arrays return copies."""
+        reax_energies = None if self.reax_energies is None else self.reax_energies[indices]
+        return PopulationMatrix(self.params[indices], reax_energies, self.costs[indices], self.case_numbers[indices])
+
+    def sorted_indices(self) -> np.ndarray:
+        """Indices that sort the population by cost, best (lowest) first. Unknown costs are placed last."""
+        return np.argsort(self.costs, kind='stable')
+
+    def best_index(self) -> int:
+        return int(self.sorted_indices()[0])
+
+    def set_evaluations(self, reax_energies, costs, rows: Union[slice, Sequence[int], np.ndarray] = None):
+        """Store (N, M) ReaxFF energies (measured or predicted) and their corresponding length-N costs.
+        If `rows` is given, only the evaluations of these rows are replaced, in place.
+        """
+        if rows is None:
+            self.reax_energies = np.asarray(reax_energies, dtype=np.float64)
+            self.costs = np.asarray(costs, dtype=np.float64)
+            return
+        reax_energies = np.asarray(reax_energies, dtype=np.float64)
+        if self.reax_energies is None:
+            self.reax_energies = np.full((len(self), reax_energies.shape[-1]), np.nan)
+        self.reax_energies[rows] = reax_energies
+        self.costs[rows] = costs
+
+    def compute_costs(self, root_individual: RootIndividual, error_calculator: IErrorStrategy = ReaxError) \
+            -> np.ndarray:
+        """Compute (and store) the cost of every individual from its ReaxFF energies."""
+        self.costs = np.asarray(error_calculator.error_batch(self.reax_energies, root_individual.dft_energies,
+                                                             root_individual.weights, **root_individual.error_kwargs),
+                                dtype=np.float64)
+        return self.costs
+
+    def to_individuals(self, root_individual: RootIndividual = None, error_calculator: IErrorStrategy = ReaxError) \
+            -> List[Individual]:
+        """Convert to a list of Individual objects. The stored costs are carried over rather than recomputed."""
+        population = []
+        for row in range(len(self)):
+            individual = Individual(self.params[row].tolist(), root_individual=root_individual,
+                                    error_calculator=error_calculator)
+            if self.reax_energies is not None:
+                individual.reax_energies = self.reax_energies[row].tolist()
+            if not np.isnan(self.costs[row]):
+                individual.cost = float(self.costs[row])
+            population.append(individual)
+        return population
+
+
+def as_population_matrix(population: Union[PopulationMatrix, List[Individual]]) -> PopulationMatrix:
+    """Return `population` unchanged if it already is a PopulationMatrix, otherwise convert the list of
+    Individual objects.
+    """
+    if isinstance(population, PopulationMatrix):
+        return population
+    return PopulationMatrix.from_individuals(population)
+
+
+def _as_float_matrix(values) -> np.ndarray:
+    matrix = np.asarray(values)
+    if matrix.dtype.kind != 'f':
+        matrix = matrix.astype(np.float64)
+    if matrix.ndim == 1 and not matrix.size:
+        matrix = matrix.reshape(0, 0)
+    return matrix
@@ -8,9 +8,10 @@ from typing import List, Dict
 
 
 # 3rd party packages
+import numpy as np
 
 # Local source
-from parametrization_clean.domain.utils.helpers import get_param
+from parametrization_clean.domain.utils.param_index import ParamIndex
 
 
 class Borg(object):
@@ -27,30 +28,41 @@ class RootIndividual(Borg):
                  root_ffield: Dict[int, List], param_keys: List[List[int]]):
         """Root individual to store data from reference training set that needs to be stored only once.
         For example, the weights of the error, DFT energies, parameter bounds only need to be stored once.
-        Input structures are converted to tuples to prevent mutation.
+        DFT energies and weights are stored as contiguous, read-only float64 arrays (to prevent mutation and so that
+        error strategies can use them without conversion), together with the precomputed 1/weight^2 vector.
 
         Parameters
         ----------
         dft_energies: List[float]
-            Stored as a tuple containing DFT energies; used to compute error.
+            Stored as a read-only array containing DFT energies; used to compute error.
         weights: List[float]
-            Stored as a tuple containing weights, used to compute error.
+            Stored as a read-only array containing weights, used to compute error.
         root_ffield: Dict[int, List]
             Dictionary mapping ReaxFF force field section number to parameters contained in that section.
         param_keys: List[List[int]]
             List of keys mapping to values in the ffield object.
         """
         super().__init__()
-        self.dft_energies = tuple(dft_energies)
-        self.weights = tuple(weights)
+        self.dft_energies = _read_only_array(dft_energies)
+        self.weights = _read_only_array(weights)
+        self.inverse_squared_weights = _read_only_array(1.0 / np.square(self.weights))
         self.root_ffield = root_ffield
         self.param_keys = param_keys
 
+        # Flat buffer holding every ffield section, with the offsets of the optimized parameters precompiled
+        self.param_index = ParamIndex(param_keys, root_ffield)
+        self.root_buffer = self.param_index.flatten(root_ffield)
+
         # Root parameters from the reference training set
         self.root_params = self.extract_params()
 
     def extract_params(self) -> List[float]:
-        return [get_param(key, self.root_ffield) for key in self.param_keys]
+        return self.param_index.extract(self.root_buffer).tolist()
+
+    @property
+    def error_kwargs(self) -> Dict[str, np.ndarray]:
+        """Precomputed arrays that can be forwarded to `IErrorStrategy.error_batch`."""
+        return {'inverse_squared_weights': self.inverse_squared_weights}
 
 
 class FirstGenerationRootIndividual(RootIndividual):
@@ -67,3 +79,9 @@ class FirstGenerationRootIndividual(RootIndividual):
             List of keys mapping to values in the ffield object.
         """
         super().__init__(dft_energies=[], weights=[], root_ffield=root_ffield, param_keys=param_keys)
+
+
+def _read_only_array(values) -> np.ndarray:
+    array = np.array(values, dtype=np.float64)
+    array.setflags(write=False)
+    return array
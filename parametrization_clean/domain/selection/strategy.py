@@ -9,6 +9,7 @@ import abc
 from typing import List
 
 # 3rd party packages
+import numpy as np
 
 # Local source
 from parametrization_clean.domain.individual import Individual
@@ -20,3 +21,16 @@ class ISelectionStrategy(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def selection(population: List[Individual], **kwargs) -> Individual:
         raise NotImplementedError
+
+    @classmethod
+    def selection_index(cls, costs: np.ndarray, **kwargs) -> int:
+        """Row (index into `costs`) of the individual selected among a population given by its costs, e.g., the rows
+        of a PopulationMatrix. Strategies should override it; by default, the costs are wrapped in Individual objects.
+        """
+        population = []
+        for cost in costs:
+            individual = Individual([])
+            individual.cost = float(cost)
+            population.append(individual)
+        selected = cls.selection(population, **kwargs)
+        return next(row for row, individual in enumerate(population) if individual is selected)
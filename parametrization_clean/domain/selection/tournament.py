@@ -5,7 +5,7 @@ from typing import List
 import random
 
 # 3rd party packages
-
+import numpy as np
 
 # Local source
 from parametrization_clean.domain.selection.strategy import ISelectionStrategy
@@ -22,3 +22,10 @@ class TournamentSelect(ISelectionStrategy):
         tournament_size = kwargs.get('tournament_size', 2)
         selected = random.sample(population, tournament_size)
         return min(selected)
+
+    @staticmethod
+    def selection_index(costs: np.ndarray, **kwargs) -> int:
+        """Select `tournament_size` rows at random and return the row with the lowest cost."""
+        tournament_size = kwargs.get('tournament_size', 2)
+        selected = random.sample(range(len(costs)), tournament_size)
+        return min(selected, key=costs.__getitem__)
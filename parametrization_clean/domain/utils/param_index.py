@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+"""Module with a precompiled index mapping parameter keys to offsets in a flat ffield buffer.
+All ffield sections are laid out back to back (in section order, row-major) in a single contiguous float64 buffer,
+so that extracting or injecting all optimized parameters is a single NumPy fancy-indexing operation instead of
+one dict/list lookup per parameter key.
+"""
+
+# Standard library
+from typing import List, Dict
+
+# 3rd party packages
+import numpy as np
+
+# Local source
+
+
+class ParamIndex(object):
+    ARRAY = "array"
+    ROWS = "rows"
+    SCALARS = "scalars"
+
+    def __init__(self, param_keys: List[List[int]], ffield: Dict[int, List]):
+        """Compile the layout of `ffield` and the buffer offsets of every key in `param_keys`.
+        Built once (e.g., from the reference/root ffield); every ffield with the same layout
+        (same number of atoms, bonds, etc.) can then be flattened/unflattened with it.
+
+        Parameters
+        ----------
+        param_keys: List[List[int]]
+            List of keys mapping to values in the ffield object: [section # | line/row # | parameter #].
+        ffield: Dict[int, List]
+            ffield[section number] = [parameters corresponding to section]. Sections can either be NumPy arrays
+            or (possibly ragged) lists of rows; a row can also be a single number.
+        """
+        self.param_keys = param_keys
+
+        # section number -> (start offset, row offsets, row lengths, section kind, array shape)
+        self.layout = {}
+        offset = 0
+        for section in sorted(ffield):
+            rows = ffield[section]
+            if isinstance(rows, np.ndarray):
+                kind, shape = self.ARRAY, rows.shape
+                row_lengths = np.full(shape[0], int(np.prod(shape[1:])), dtype=np.intp)
+            else:
+                kind = self.SCALARS if all(np.ndim(row) == 0 for row in rows) else self.ROWS
+                shape = None
+                row_lengths = np.array([np.size(row) for row in rows], dtype=np.intp)
+            row_offsets = offset + np.cumsum(row_lengths) - row_lengths
+            self.layout[section] = (offset, row_offsets, row_lengths, kind, shape)
+            offset += int(row_lengths.sum())
+        self.size = offset
+
+        self.offsets = np.array([self.offset(key) for key in param_keys], dtype=np.intp)
+
+    def offset(self, key: List[int]) -> int:
+        """Buffer offset of a single [section # | line/row # | parameter #] key (rows and parameters start at 1)."""
+        _, row_offsets, row_lengths, _, _ = self.layout[key[0]]
+        row = key[1] - 1
+        column = key[2] - 1
+        if not 0 <= column < row_lengths[row]:
+            raise IndexError("Parameter key {} is outside of the ffield section layout.".format(key))
+        return int(row_offsets[row] + column)
+
+    def flatten(self, ffield: Dict[int, List]) -> np.ndarray:
+        """Copy all sections of `ffield` into one contiguous float64 buffer."""
+        buffer = np.empty(self.size, dtype=np.float64)
+        for section, (start, row_offsets, row_lengths, kind, _) in self.layout.items():
+            rows = ffield[section]
+            end = start + int(row_lengths.sum())
+            if kind == self.ROWS:
+                buffer[start:end] = [value for row in rows for value in row]
+            else:
+                buffer[start:end] = np.ravel(rows)
+        return buffer
+
+    def unflatten(self, buffer: np.ndarray) -> Dict[int, List]:
+        """Rebuild an ffield dict from a buffer. Array sections are returned as (reshaped) views on `buffer`;
+        list sections are returned as lists of rows, matching the structure given at construction.
+        """
+        ffield = {}
+        for section, (start, row_offsets, row_lengths, kind, shape) in self.layout.items():
+            end = start + int(row_lengths.sum())
+            if kind == self.ARRAY:
+                ffield[section] = buffer[start:end].reshape(shape)
+            elif kind == self.SCALARS:
+                ffield[section] = buffer[start:end].tolist()
+            else:
+                values = buffer[start:end].tolist()
+                rows = []
+                position = 0
+                for row_length in row_lengths:
+                    rows.append(values[position:position + row_length])
+                    position += row_length
+                ffield[section] = rows
+        return ffield
+
+    def extract(self, buffer: np.ndarray) -> np.ndarray:
+        """Gather the optimized parameters from a buffer of shape (B,), or from a stack of buffers (N, B)."""
+        return buffer[..., self.offsets]
+
+    def inject(self, params, buffer: np.ndarray) -> np.ndarray:
+        """Return a copy of `buffer` with the optimized parameters scattered into their offsets."""
+        new_buffer = np.array(buffer, dtype=np.float64)
+        new_buffer[..., self.offsets] = params
+        return new_buffer
@@ -36,6 +36,7 @@ HIGHLY RECOMMENDED TO SET, AT THE VERY LEAST, THE POPULATION SIZE OF THE GENETIC
 """
 
 # Standard library
+import os
 
 # 3rd party packages
 
@@ -53,6 +54,8 @@ from parametrization_clean.use_case.port.settings_repository import (IStrategySe
                                                                      ISelectionSettings,
                                                                      IAdaptationSettings,
                                                                      INeuralNetSettings,
+                                                                     IRepositorySettings,
+                                                                     IRunnerSettings,
                                                                      IAllSettings)
 
 
@@ -67,6 +70,8 @@ class DefaultSettings(IAllSettings):
         self.selection_settings = DefaultSelectionSettings()
         self.adaptation_settings = DefaultAdaptationSettings()
         self.neural_net_settings = DefaultNeuralNetSettings()
+        self.repository_settings = DefaultRepositorySettings()
+        self.runner_settings = DefaultRunnerSettings()
 
 
 class DefaultStrategySettings(IStrategySettings):
@@ -91,6 +96,9 @@ class DefaultGeneticAlgorithmSettings(IGeneticAlgorithmSettings):
         self.use_elitism = True
         self.use_adaptation = False
         self.use_neural_network = False
+        # Children written per generation on top of `population_size`; the generation is closed as soon as
+        # `population_size` children have completed, so the slowest (straggling) children are not waited for
+        self.num_extra_children = 0
 
 
 class DefaultMutationSettings(IMutationSettings):
@@ -151,3 +159,41 @@ class DefaultNeuralNetSettings(INeuralNetSettings):
         self.num_populations_to_train_on = 1
         self.num_nested_ga_iterations = 1
         self.minimum_validation_r_squared = 0.95
+
+
+class DefaultRepositorySettings(IRepositorySettings):
+
+    def __init__(self):
+        super().__init__()
+        # Store parsed ffield/fort.99 files as .npz sidecars next to the source files (opt-in)
+        self.use_parse_cache = False
+        # Number of worker processes parsing children's files when reading a generation (1 = sequential)
+        self.num_read_workers = 1
+        # Number of threads writing children's directories concurrently in write_population (1 = sequential)
+        self.num_write_workers = 8
+        # How invariant training set files are placed in children's directories: copy, hardlink, symlink or reflink
+        self.file_materialization = "copy"
+        # Data type of the (memory-mapped) history store used to train the ANN: float64 or float32 (half the size)
+        self.history_dtype = "float64"
+        # Reuse the results of children whose (written) parameters were already evaluated, e.g., elites, instead of
+        # running ReaxFF again (opt-in: results are reused for identical ffield files only)
+        self.use_evaluation_cache = False
+
+
+class DefaultRunnerSettings(IRunnerSettings):
+
+    def __init__(self):
+        super().__init__()
+        # Command running a ReaxFF optimization in a child's directory, used by the built-in local runner
+        self.reax_command = "reac"
+        # Number of ReaxFF optimizations run concurrently by the local runner
+        self.num_run_workers = os.cpu_count() or 1
+        # Wall-clock time limit (seconds) of one ReaxFF optimization; null = no limit
+        self.run_timeout = 1800
+        # Number of times a crashed ReaxFF optimization (non-zero exit status or no fort.99) is restarted
+        self.max_retries = 1
+        # Wall-clock time limit (seconds) of a whole generation, after which it is closed and the children that have
+        # not completed are recorded as failed; null = no limit
+        self.generation_deadline = None
+        # Replace children that time out by fresh individuals (bred from the parents) and run those instead
+        self.reseed_stragglers = False
@@ -48,6 +48,8 @@ class UserSettings(DefaultSettings):
         self.set_selection_settings(all_settings_dict.get('selection_settings', {}))
         self.set_adaptation_settings(all_settings_dict.get('adaptation_settings', {}))
         self.set_neural_net_settings(all_settings_dict.get('neural_net_settings', {}))
+        self.set_repository_settings(all_settings_dict.get('repository_settings', {}))
+        self.set_runner_settings(all_settings_dict.get('runner_settings', {}))
 
     def set_strategy_settings(self, strategy_settings_dict):
         for key, value in strategy_settings_dict.items():
@@ -78,6 +80,12 @@ class UserSettings(DefaultSettings):
     def set_neural_net_settings(self, neural_net_settings_dict):
         self.set_attributes_from_json(self.neural_net_settings, neural_net_settings_dict)
 
+    def set_repository_settings(self, repository_settings_dict):
+        self.set_attributes_from_json(self.repository_settings, repository_settings_dict)
+
+    def set_runner_settings(self, runner_settings_dict):
+        self.set_attributes_from_json(self.runner_settings, runner_settings_dict)
+
     @staticmethod
     def set_attributes_from_json(config_object, json_dict):
         """Extract and set class attributes from JSON dictionary object."""
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+
+"""Module with an in-process stand-in for ReaxFF: energies with the shape of fort.99 (one per training set row) are
+synthesized from the parameters of every individual through a random linear or quadratic model of each row. Used to
+run, benchmark and profile the whole GA/ANN loop without running any ReaxFF optimization.
+
+With normalized parameter deviations d = (params - root_params) / (|root_params| + 1), row j of an individual's
+energies is
+    linear:     e_j = b_j + sum_k A_kj d_k
+    quadratic:  e_j = b_j + sum_k A_kj d_k + sum_k B_kj d_k^2, with B_kj >= 0.
+The reference ("DFT") energies are the energies of a random optimum close to the root parameters, so the cost
+landscape has a known minimum the GA can converge to.
+"""
+
+# Standard library
+from typing import List, Optional, Union
+import threading
+
+# 3rd party packages
+import numpy as np
+
+# Local source
+from parametrization_clean.domain.individual import Individual
+from parametrization_clean.domain.root_individual import RootIndividual
+from parametrization_clean.domain.population_matrix import PopulationMatrix, as_population_matrix
+from parametrization_clean.domain.cost.strategy import IErrorStrategy
+from parametrization_clean.domain.cost.reax_error import ReaxError
+from parametrization_clean.use_case.port.evaluator import IEvaluator
+from parametrization_clean.use_case.port.population_repository import IPopulationRepository
+
+ANALYTIC_MODELS = ("linear", "quadratic")
+
+
+class AnalyticEvaluator(IEvaluator):
+
+    def __init__(self, root_params: List[float], num_energies: int, model: str = "quadratic", seed: int = 0,
+                 optimum_scale: float = 0.05, noise: float = 0.0, error_strategy: IErrorStrategy = ReaxError,
+                 population_repository: Optional[IPopulationRepository] = None):
+        """Random analytic model of `num_energies` training set rows of the parameters `root_params`.
+
+        Parameters
+        ----------
+        root_params: List[float]
+            Parameters of the reference force field, around which the model is centered.
+        num_energies: int
+            Number of energies (training set rows) of every individual.
+        model: str, default = "quadratic"
+            "linear" or "quadratic" model of each row.
+        seed: int, default = 0
+            Seed of the random model (coefficients, optimum, weights) and of the noise.
+        optimum_scale: float, default = 0.05
+            Relative standard deviation of the optimum parameters around the root parameters.
+        noise: float, default = 0.0
+            Standard deviation of Gaussian noise added to every synthesized energy.
+        error_strategy: IErrorStrategy, default = ReaxError
+            Error used to compute the cost of every individual.
+        population_repository: IPopulationRepository, optional
+            Repository to which every evaluated generation is written (e.g., to serve the ANN training history).
+        """
+        if model not in ANALYTIC_MODELS:
+            raise ValueError("Unknown analytic model '{}'; expected one of {}."
+                             .format(model, ", ".join(ANALYTIC_MODELS)))
+        random_generator = np.random.default_rng(seed)
+        self.root_params = np.asarray(root_params, dtype=np.float64)
+        self.scale = np.abs(self.root_params) + 1.0
+        num_params = len(self.root_params)
+
+        self.offsets = random_generator.normal(0.0, 10.0, num_energies)
+        self.linear_coefficients = random_generator.normal(0.0, 1.0, (num_params, num_energies)) / np.sqrt(num_params)
+        self.quadratic_coefficients = None
+        if model == "quadratic":
+            self.quadratic_coefficients = np.abs(random_generator.normal(0.0, 1.0, (num_params, num_energies)))
+
+        self.optimum_params = self.root_params * (1.0 + optimum_scale * random_generator.standard_normal(num_params))
+        self.noise = noise
+        self.dft_energies = self.energies(self.optimum_params[np.newaxis])[0]
+        self.weights = random_generator.uniform(0.5, 2.0, num_energies)
+        self.inverse_squared_weights = 1.0 / np.square(self.weights)
+        self.noise_generator = random_generator
+        # The noise generator is shared by concurrent evaluations of single individuals
+        self.noise_lock = threading.Lock()
+
+        self.error_strategy = error_strategy
+        self.population_repository = population_repository
+
+    def root_individual(self, root_ffield, param_keys) -> RootIndividual:
+        """Root individual of the force field `root_ffield`, with the synthesized reference energies and weights."""
+        return RootIndividual(self.dft_energies.tolist(), self.weights.tolist(), root_ffield, param_keys)
+
+    def energies(self, params: np.ndarray) -> np.ndarray:
+        """(N, M) synthesized energies of the (N, P) parameters `params` (without noise)."""
+        deviations = (np.asarray(params, dtype=np.float64) - self.root_params) / self.scale
+        energies = self.offsets + deviations @ self.linear_coefficients
+        if self.quadratic_coefficients is not None:
+            energies += np.square(deviations) @ self.quadratic_coefficients
+        return energies
+
+    def evaluate(self, population: Union[List[Individual], PopulationMatrix], generation_number: int) \
+            -> PopulationMatrix:
+        population = as_population_matrix(population)
+        reax_energies = self.energies(population.params)
+        if self.noise:
+            reax_energies += self.noise_generator.normal(0.0, self.noise, reax_energies.shape)
+        costs = self.error_strategy.error_batch(reax_energies, self.dft_energies, self.weights,
+                                                inverse_squared_weights=self.inverse_squared_weights)
+
+        evaluated_population = PopulationMatrix(population.params, reax_energies, costs)
+        if self.population_repository is not None:
+            self.population_repository.write_population(evaluated_population, generation_number)
+        return evaluated_population
+
+    def evaluate_individual(self, individual: Individual, case_number: int) -> Optional[Individual]:
+        reax_energies = self.energies(np.asarray(individual.params, dtype=np.float64)[np.newaxis])[0]
+        if self.noise:
+            with self.noise_lock:
+                reax_energies += self.noise_generator.normal(0.0, self.noise, reax_energies.shape)
+        cost = self.error_strategy.error_batch(reax_energies, self.dft_energies, self.weights,
+                                               inverse_squared_weights=self.inverse_squared_weights)
+
+        evaluated_individual = Individual(list(individual.params), root_individual=individual.root_individual,
+                                          error_calculator=self.error_strategy)
+        evaluated_individual.reax_energies = reax_energies.tolist()
+        evaluated_individual.cost = float(cost)
+        return evaluated_individual
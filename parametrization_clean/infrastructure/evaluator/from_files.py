@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+
+"""Module with the evaluator backed by the population file repository and ReaxFF: the individuals of a generation are
+written to their children's directories, their ReaxFF optimizations are run by the local runner, and the results
+(staged as soon as each child succeeds) are read back from the generation's directory.
+
+If the generation is over-provisioned (`ga_settings.num_extra_children`), it is closed as soon as
+`ga_settings.population_size` children have completed, and children that have not completed by then are recorded as
+late failures. Likewise, once `generation_deadline` seconds have passed. With a `reseed` function, children whose
+optimizations time out are replaced by fresh individuals, which are run instead.
+
+Single individuals (steady-state GA) are written to `steady-state/child-<case number>` in the population path instead,
+and their results are read back as soon as their own optimization completes.
+"""
+
+# Standard library
+from typing import Callable, Dict, List, Optional, Union
+import os
+import threading
+
+# 3rd party packages
+
+# Local source
+from parametrization_clean.domain.individual import Individual
+from parametrization_clean.domain.cost.reax_error import ReaxError
+from parametrization_clean.domain.population_matrix import PopulationMatrix
+from parametrization_clean.use_case.port.evaluator import IEvaluator
+from parametrization_clean.infrastructure.repository.from_files import PopulationFileRepository
+from parametrization_clean.infrastructure.repository.generation_manifest import GenerationManifest, RUNNING, FAILED
+from parametrization_clean.infrastructure.utils.local_runner import LocalReaxRunner, is_late
+from parametrization_clean.infrastructure.utils.reax_reader import ReaxReader
+from parametrization_clean.infrastructure.utils.reax_converter import Fort99Extractor
+from parametrization_clean.infrastructure.exception.exception import EvaluationError
+
+
+class FileReaxEvaluator(IEvaluator):
+    STEADY_STATE_FOLDER_NAME = "steady-state"
+
+    def __init__(self, population_repository: PopulationFileRepository, local_runner: LocalReaxRunner,
+                 generation_deadline: Optional[float] = None,
+                 reseed: Optional[Callable[[int], Optional[Individual]]] = None):
+        """Evaluate the children of `population_repository` with `local_runner`. Generations are closed once
+        `generation_deadline` seconds have passed (no limit by default). `reseed(generation_number)` returns a fresh
+        individual replacing a child of the generation whose optimization timed out (children are not reseeded by
+        default).
+        """
+        self.population_repository = population_repository
+        self.local_runner = local_runner
+        self.generation_deadline = generation_deadline
+        self.reseed = reseed
+        # Reseeding functions are not assumed to be thread-safe
+        self.__reseed_lock = threading.Lock()
+
+    def evaluate(self, population: Union[List[Individual], PopulationMatrix], generation_number: int) \
+            -> PopulationMatrix:
+        response = self.population_repository.write_population(population, generation_number)
+        if not response:
+            raise EvaluationError(response.message)
+        self.run_generation(generation_number)
+        # Results are read as the previous generation of the next one, i.e., with the reference (DFT) data
+        self.population_repository.set_generation_number(generation_number + 1)
+        return self.population_repository.compact_generation(generation_number)
+
+    def run_generation(self, generation_number: int) -> Dict[int, Optional[str]]:
+        """Run the ReaxFF optimizations of the (already written) children of generation `generation_number`, stage
+        the results of each child as soon as its optimization succeeds, and track the status of the children in the
+        generation's manifest. Children whose results were reused from the evaluation cache are not run.
+        Children that had not completed when the generation was closed are marked late in the manifest.
+
+        Returns
+        -------
+        Dict[int, Optional[str]]
+            Reason why each child failed, by case number (None if its optimization succeeded).
+        """
+        generation_dir_path = os.path.join(self.population_repository.population_path,
+                                           PopulationFileRepository.GENERATION_FOLDER_PREFIX + str(generation_number))
+        cached_case_numbers = set(self.population_repository.cached_case_numbers(generation_number))
+        case_numbers = [case_number for case_number in range(self.population_repository.num_children)
+                        if case_number not in cached_case_numbers]
+        # Over-provisioned generation -> closed once `population_size` children have completed
+        num_required = None
+        if self.population_repository.num_children > self.population_repository.population_size:
+            num_required = max(0, self.population_repository.population_size - len(cached_case_numbers))
+        child_dirs = [os.path.join(generation_dir_path, PopulationFileRepository.INDIVIDUAL_FOLDER_PREFIX + str(i))
+                      for i in case_numbers]
+        generation_manifest = GenerationManifest(generation_dir_path)
+
+        errors = self.local_runner.run(
+            child_dirs,
+            on_start=lambda case_number, _: generation_manifest.update({case_number: {'status': RUNNING,
+                                                                                      'error': None}}),
+            on_complete=lambda case_number, _: self.population_repository.stage_child(generation_number, case_number),
+            case_numbers=case_numbers, num_required=num_required, deadline=self.generation_deadline,
+            on_timeout=None if self.reseed is None
+            else lambda case_number, _: self.__reseed_child(generation_number, case_number))
+        late_errors = {case_number: error for case_number, error in errors.items() if is_late(error)}
+        generation_manifest.update({case_number: {'status': FAILED, 'error': error}
+                                    for case_number, error in errors.items()
+                                    if error is not None and case_number not in late_errors})
+        self.population_repository.mark_late(generation_number, late_errors)
+        return errors
+
+    def __reseed_child(self, generation_number: int, case_number: int) -> bool:
+        """Replace child `case_number` of a generation by a fresh individual; returns whether it was replaced."""
+        with self.__reseed_lock:
+            individual = self.reseed(generation_number)
+        if individual is None:
+            return False
+        return bool(self.population_repository.rewrite_child(individual, generation_number, case_number))
+
+    def evaluate_individual(self, individual: Individual, case_number: int) -> Optional[Individual]:
+        """Write `individual` to its own child directory, run its ReaxFF optimization and read its results back.
+        Individuals whose (written) parameters are in the evaluation cache are not run. The cost is computed from the
+        reference energies and weights of the child's own fort.99, so no previous generation is needed.
+        """
+        population_repository = self.population_repository
+        evaluation_cache = population_repository.evaluation_cache
+        params = population_repository.ffield_template.quantize(individual.params)
+        if evaluation_cache is not None:
+            cached_result = evaluation_cache.get(params)
+            if cached_result is not None and cached_result[1] is not None:
+                return _evaluated_individual(individual, params, *cached_result)
+
+        steady_state_path = os.path.join(population_repository.population_path, self.STEADY_STATE_FOLDER_NAME)
+        os.makedirs(steady_state_path, exist_ok=True)
+        child_dir = os.path.join(steady_state_path,
+                                 PopulationFileRepository.INDIVIDUAL_FOLDER_PREFIX + str(case_number))
+        if not population_repository.write_individual(individual, child_dir=child_dir):
+            return None
+        if self.local_runner.run_child(case_number, child_dir) is not None:
+            return None
+        try:
+            fort99_extractor = Fort99Extractor(ReaxReader(child_dir).read_fort99_array())
+        except (OSError, ValueError):
+            return None
+
+        reax_energies = fort99_extractor.get_reax_energies()
+        cost = float(ReaxError.error_batch(reax_energies, fort99_extractor.get_dft_energies(),
+                                           fort99_extractor.get_weights()))
+        if evaluation_cache is not None:
+            evaluation_cache.put(params, reax_energies, cost)
+        return _evaluated_individual(individual, params, reax_energies, cost)
+
+
+def _evaluated_individual(individual: Individual, params, reax_energies, cost: float) -> Individual:
+    """Copy of `individual` with the parameters as written to its ffield, and its ReaxFF energies and cost."""
+    evaluated_individual = Individual(params.tolist(), root_individual=individual.root_individual)
+    evaluated_individual.reax_energies = reax_energies.tolist()
+    evaluated_individual.cost = cost
+    return evaluated_individual
@@ -18,3 +18,7 @@ class ConfigurationError(ApplicationError):
     """Error with user configuration file provided."""
     pass
 
+
+class EvaluationError(ApplicationError):
+    """Error evaluating a population (e.g., its individuals could not be written)."""
+    pass
@@ -17,6 +17,7 @@ import os
 # 3rd party packages
 
 # Local source
+from parametrization_clean.domain.population_matrix import as_population_matrix
 
 
 class DataWriter:
@@ -33,14 +34,18 @@ class DataWriter:
             out_file.write(formatted_data_string)
 
     @staticmethod
-    def write_summary(population, expected_population_size, successfully_retrieved_case_numbers, file_path):
-        """Generate report for a given generation at location `file_path`."""
-        best_child = sorted(population)[0]
+    def write_summary(population, expected_population_size, successfully_retrieved_case_numbers, file_path,
+                      num_late=0):
+        """Generate report for a given generation at location `file_path`.
+        `population` can either be a list of Individual objects or a PopulationMatrix. `num_late` failed cases had not
+        completed when the generation was closed.
+        """
+        population = as_population_matrix(population)
+        best_child_idx = population.best_index()
 
         num_retrieved = len(population)
         num_failed = expected_population_size - num_retrieved
 
-        best_child_idx = population.index(best_child)
         with open(file_path, 'w') as out_file:
             out_file.write("---------- GENERATION SUMMARY ----------\n")
             out_file.write("Number of successful cases: {:.3f} ({:.2f}%)\n"
@@ -48,9 +53,10 @@ class DataWriter:
             out_file.write("Number of failed cases: {:.3f} ({:.2f}%)\n"
                            .format(num_failed, 100 * num_failed / expected_population_size))
             out_file.write("Best Cost/Fitness Real ReaxFF Error (from Master GA): {:.3f}\n"
-                           .format(best_child.cost))
+                           .format(population.costs[best_child_idx]))
             out_file.write("Corresponding best Master GA case: case-{}\n".
                            format(successfully_retrieved_case_numbers[best_child_idx]))
+            out_file.write("Number of late cases (generation closed before they completed): {}\n".format(num_late))
 
     @staticmethod
     def write_outputs(previous_population, successfully_retrieved_case_numbers, population_repository, user_settings,
@@ -60,14 +66,17 @@ class DataWriter:
         """
         previous_generation_number = generation_number - 1
         population_path = population_repository.population_path
-        expected_population_size = user_settings.ga_settings.population_size
+        # Over-provisioned children are expected too; the ones that were late count as failed
+        expected_population_size = user_settings.ga_settings.population_size + \
+            user_settings.ga_settings.num_extra_children
         if history:
             history_dict = history.history
 
         summary_file_path = os.path.join(population_path, 'generation-' + str(previous_generation_number),
                                          '00-gen-summary.txt')
         DataWriter.write_summary(previous_population, expected_population_size,
-                                 successfully_retrieved_case_numbers, summary_file_path)
+                                 successfully_retrieved_case_numbers, summary_file_path,
+                                 len(population_repository.late_case_numbers(previous_generation_number)))
 
         generation_vs_error_file_path = os.path.join(population_path, '00-generation-vs-error.txt')
         neural_network_file_path = os.path.join(population_path, "00-ann-summary")
@@ -80,7 +89,8 @@ class DataWriter:
             DataWriter.create_or_append("Generation #\t{}\n"
                                         .format(list(history_dict.keys())), neural_network_file_path)
 
-        best_previous_error = sorted(previous_population)[0].cost
+        previous_population = as_population_matrix(previous_population)
+        best_previous_error = previous_population.costs[previous_population.best_index()]
         DataWriter.create_or_append("{},{:.3f}\n".format(previous_generation_number, best_previous_error),
                                     generation_vs_error_file_path)
 
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+
+"""Module with a persistent cache of evaluated individuals, so individuals whose parameters were already evaluated by
+ReaxFF (elites copied into the next generation, children that skipped both crossover and mutation, duplicates) are not
+evaluated again.
+
+Entries are keyed by a hash of the parameters quantized exactly as they are written to the ffield files (see
+`FfieldTemplate.quantize`): two individuals with the same key produce identical ffield files, hence identical ReaxFF
+results. The key also covers a fingerprint of the training set (see `training_set_fingerprint`), so results are never
+reused for a different training set.
+
+Each entry (parameters, ReaxFF energies and cost) is stored in its own small .npz file (`<key>.npz`, fanned out into
+sub-directories by the first two characters of the key), written atomically, so concurrent writers of a campaign never
+see partial entries.
+"""
+
+# Standard library
+from typing import Iterable, Optional, Tuple
+import hashlib
+import os
+import tempfile
+import zipfile
+
+# 3rd party packages
+import numpy as np
+
+# Local source
+from parametrization_clean.domain.population_matrix import PopulationMatrix
+from parametrization_clean.infrastructure.utils.ffield_template import FfieldTemplate
+
+
+class EvaluationCache(object):
+
+    def __init__(self, cache_path: str, namespace: str = ""):
+        """Cache stored in the directory `cache_path` (created on the first store); `namespace` (e.g., the training
+        set fingerprint) is part of every key.
+        """
+        self.cache_path = cache_path
+        self.namespace = namespace
+
+    def key(self, params) -> str:
+        """Key of the parameters `params`, once quantized to the precision of the ffield files."""
+        # Adding zero turns -0.0 into 0.0, which are written identically
+        quantized_params = np.ascontiguousarray(FfieldTemplate.quantize(params), dtype=np.float64) + 0.0
+        key_hash = hashlib.sha1(self.namespace.encode())
+        key_hash.update(quantized_params.tobytes())
+        return key_hash.hexdigest()
+
+    def get(self, params) -> Optional[Tuple[np.ndarray, Optional[float]]]:
+        """(ReaxFF energies, cost or None) stored for `params`, or None if they have not been evaluated."""
+        try:
+            with np.load(self.__entry_path(self.key(params)), allow_pickle=False) as entry:
+                if not np.array_equal(entry['params'], FfieldTemplate.quantize(params)):
+                    return None
+                cost = float(entry['cost'])
+                return entry['reax_energies'], cost if np.isfinite(cost) else None
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            return None
+
+    def put(self, params, reax_energies, cost: Optional[float] = None) -> bool:
+        """Store the ReaxFF energies (and cost) of `params`, unless they are already stored.
+        Returns False if the entry could not be stored.
+        """
+        entry_path = self.__entry_path(self.key(params))
+        if os.path.isfile(entry_path):
+            return True
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path), suffix=".tmp")
+        except OSError:
+            return False
+        try:
+            with os.fdopen(file_descriptor, 'wb') as out_file:
+                np.savez(out_file, params=FfieldTemplate.quantize(params),
+                         reax_energies=np.asarray(reax_energies, dtype=np.float64),
+                         cost=np.float64(np.nan if cost is None else cost))
+            os.replace(temp_path, entry_path)
+        except OSError:
+            return False
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return True
+
+    def put_population(self, population: PopulationMatrix) -> int:
+        """Store every evaluated individual of `population`; returns the number of individuals stored."""
+        if population.reax_energies is None:
+            return 0
+        num_stored = 0
+        for params, reax_energies, cost in zip(population.params, population.reax_energies, population.costs):
+            if np.all(np.isfinite(reax_energies)) and self.put(params, reax_energies, float(cost)):
+                num_stored += 1
+        return num_stored
+
+    def __entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_path, key[:2], key + ".npz")
+
+
+def training_set_fingerprint(training_set_path: str, file_names: Iterable[str]) -> str:
+    """Hash of the size and modification time of the training set files `file_names` (files that do not exist are
+    skipped). Training files (e.g., geo) can be hundreds of MB, so their content is not read.
+    """
+    fingerprint = hashlib.sha1()
+    for file_name in file_names:
+        try:
+            file_stat = os.stat(os.path.join(training_set_path, file_name))
+        except OSError:
+            continue
+        fingerprint.update("{}:{}:{};".format(file_name, file_stat.st_size, file_stat.st_mtime_ns).encode())
+    return fingerprint.hexdigest()
@@ -9,33 +9,89 @@ method, Successive One Parameter Parabolic Extrapolation (SOPPE).
 
 The user has the choice of specifying parameter bounds or leaving them empty in the `params` ReaxFF file.
 
+Once a generation is completed, it can be compacted into a single columnar archive (`generation-archive.npz` in the
+generation directory) holding the parameter matrix, ReaxFF energies, costs, case numbers and failure flags. Reading a
+generation prefers the archive when it exists, so loading history is one file read per generation instead of parsing
+every child's ffield and fort.99.
+
+Writing a generation also stores the parameter matrix of its children (`generation-params.npz`), quantized exactly as
+written to the ffield files. Reading a generation that has not been compacted uses that matrix, so only the fort.99
+file of each child has to be parsed. Children's ffield files are only parsed if the matrix is missing or does not cover
+the generation (e.g., populations written by other tools).
+
+The root individual is built once per repository (and generation number). The reference DFT energies and weights are
+also stored in binary form (`reference-data.npz` in the reference files directory) next to the cached reference fort.99,
+so later generations do not parse any text to build the root individual.
+
+While a generation runs, the results of every child can be staged as soon as its fort.99 is complete (`stage_child`,
+see `completion_watcher`): parameters and ReaxFF energies are stored in `staged-result.npz` in the child's directory,
+keyed by the size and modification time of its fort.99. Reading the generation then merges the staged results instead
+of parsing the children's files again; staged results whose fort.99 has changed since are ignored.
+
+Compacted generations are also appended to a memory-mapped history store (`history` directory in the population path,
+see `history_store`), from which the ANN training data of any number of previous generations is served as slices.
+
+Compacted generations also feed a persistent evaluation cache (`evaluation-cache` directory in the population path, see
+`evaluation_cache`). When a generation (other than the first) is written, children whose quantized parameters were
+already evaluated, e.g., elites, get the cached results (`cached-result.npz` in the child's directory) and are marked
+"cached" in the generation's manifest, so they are not run again.
+
+Generations can be over-provisioned: `ga_settings.num_extra_children` children are written on top of
+`ga_settings.population_size`, and the generation is closed as soon as `population_size` of them have completed (or its
+deadline has passed). Children that had not completed by then are marked "late" in the manifest (`mark_late`) and
+count as failed, even if their ReaxFF optimizations complete afterwards.
+
 """
 
 # Standard library
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from itertools import repeat
 import os
 import shutil
+import tempfile
+import threading
+import zipfile
 
 # 3rd party packages
+import numpy as np
 
 # Local source
 from parametrization_clean.domain.individual import Individual
+from parametrization_clean.domain.population_matrix import PopulationMatrix
 from parametrization_clean.domain.root_individual import RootIndividual, FirstGenerationRootIndividual
 from parametrization_clean.domain.cost.reax_error import ReaxError
-from parametrization_clean.domain.utils.helpers import get_param
+from parametrization_clean.domain.utils.param_index import ParamIndex
 from parametrization_clean.use_case.port.population_repository import IPopulationRepository
 from parametrization_clean.use_case.port.settings_repository import IAllSettings
-from parametrization_clean.infrastructure.utils.reax_reader import ReaxReader, write_ffield
+from parametrization_clean.infrastructure.repository.history_store import HistoryStore, HISTORY_DTYPES
+from parametrization_clean.infrastructure.repository.generation_manifest import (GenerationManifest, WRITTEN, DONE,
+                                                                                 FAILED, CACHED)
+from parametrization_clean.infrastructure.repository.evaluation_cache import EvaluationCache, training_set_fingerprint
+from parametrization_clean.infrastructure.utils.reax_reader import ReaxReader
+from parametrization_clean.infrastructure.utils.ffield_template import FfieldTemplate
+from parametrization_clean.infrastructure.utils.file_materializer import materialize, MATERIALIZATION_MODES
+from parametrization_clean.infrastructure.exception.exception import ConfigurationError
 from parametrization_clean.infrastructure.utils.reax_converter import Fort99Extractor
 from parametrization_clean.infrastructure.utils.response_object import (ResponseSuccess, ResponseWarning,
                                                                         ResponseFailure)
 
+STAGED_RESULT_NAME = "staged-result.npz"
+CACHED_RESULT_NAME = "cached-result.npz"
+
 
 class PopulationFileRepository(IPopulationRepository):
     GENERATION_FOLDER_PREFIX = "generation-"
     INDIVIDUAL_FOLDER_PREFIX = "child-"
     REFERENCE_FOLDER_PREFIX = "reference-files"
+    GENERATION_ARCHIVE_NAME = "generation-archive.npz"
+    GENERATION_PARAMS_NAME = "generation-params.npz"
+    REFERENCE_DATA_NAME = "reference-data.npz"
+    HISTORY_FOLDER_NAME = "history"
+    EVALUATION_CACHE_FOLDER_NAME = "evaluation-cache"
+    # Training set files that are identical for every child
+    INVARIANT_TRAINING_FILES = ('control', 'geo', 'params', 'trainset.in')
 
     def __init__(self, training_set_path, population_path, settings_repository: IAllSettings,
                  current_generation_number):
@@ -43,10 +99,24 @@ class PopulationFileRepository(IPopulationRepository):
         self.population_path = Path(population_path)
         self.reference_path = os.path.join(population_path, self.REFERENCE_FOLDER_PREFIX)
 
-        self.training_reax_reader = ReaxReader(training_set_path)
-        self.population_reax_reader = ReaxReader(population_path)
+        self.use_parse_cache = settings_repository.repository_settings.use_parse_cache
+        self.num_read_workers = settings_repository.repository_settings.num_read_workers
+        self.num_write_workers = settings_repository.repository_settings.num_write_workers
+        self.file_materialization = settings_repository.repository_settings.file_materialization
+        if self.file_materialization not in MATERIALIZATION_MODES:
+            raise ConfigurationError("Invalid file_materialization '{}'; expected one of {}."
+                                     .format(self.file_materialization, ", ".join(MATERIALIZATION_MODES)))
+        history_dtype = settings_repository.repository_settings.history_dtype
+        if history_dtype not in HISTORY_DTYPES:
+            raise ConfigurationError("Invalid history_dtype '{}'; expected one of {}."
+                                     .format(history_dtype, ", ".join(HISTORY_DTYPES)))
+        self.history_store = HistoryStore(os.path.join(population_path, self.HISTORY_FOLDER_NAME), history_dtype)
+        # Reader for the training set files only; other directories (children, reference files) get their own
+        # reader for every read, so that no reader state is shared/mutated between reads
+        self.training_reax_reader = ReaxReader(training_set_path, use_cache=self.use_parse_cache)
 
         self.population_size = settings_repository.ga_settings.population_size
+        self.num_extra_children = settings_repository.ga_settings.num_extra_children
         self.current_generation_number = current_generation_number
 
         # SETTING CONFIG's PARAMETER BOUNDS HERE FOR NOW
@@ -56,62 +126,189 @@ class PopulationFileRepository(IPopulationRepository):
         if not os.path.isdir(population_path):
             os.mkdir(population_path)
 
-        _, self.atom_types = self.training_reax_reader.read_ffield()
+        training_ffield, self.atom_types = self.training_reax_reader.read_ffield()
+        self.param_index = ParamIndex(self.param_keys, training_ffield)
+        # Training ffield and root individual are invariant for the lifetime of the repository -> built once
+        self.__training_ffield = training_ffield
+        self.__root_individual = None
+        self.__root_individual_stage = None
+        # Children's ffield files are rendered from the training ffield, compiled once
+        self.ffield_template = FfieldTemplate(os.path.join(training_set_path, 'ffield'), self.param_keys)
+
+        # Serializes updates of the parameter matrix of a generation by `rewrite_child`
+        self.__params_lock = threading.Lock()
+
+        self.evaluation_cache = None
+        if settings_repository.repository_settings.use_evaluation_cache:
+            self.evaluation_cache = EvaluationCache(
+                os.path.join(population_path, self.EVALUATION_CACHE_FOLDER_NAME),
+                training_set_fingerprint(training_set_path, self.INVARIANT_TRAINING_FILES + ('ffield',)))
+
+    @property
+    def num_children(self) -> int:
+        """Number of children written per generation, including the extra (over-provisioned) ones."""
+        return self.population_size + self.num_extra_children
 
     def get_root_individual(self) -> RootIndividual:
-        root_ffield, _ = self.training_reax_reader.read_ffield()
+        # The root individual only differs between the first generation and all later ones (same reference data)
+        # -> memoized per stage, so a repository driving several generations builds it at most twice
+        root_individual_stage = min(self.current_generation_number, 2)
+        if self.__root_individual is not None and self.__root_individual_stage == root_individual_stage:
+            return self.__root_individual
 
+        root_ffield = self.__training_ffield
         if self.current_generation_number == 1:
             root_individual = FirstGenerationRootIndividual(root_ffield, self.param_keys)
         else:
             if self.current_generation_number == 2:
                 fort99_data, child_dir = self.__find_valid_initial_fort99()
                 self.__cache_reference_fort99(child_dir)
+                dft_energies, weights = self.__cache_reference_data(fort99_data)
             else:
-                fort99_data = self.__read_reference_fort99()
-
-            fort99_extractor = Fort99Extractor(fort99_data)
-            dft_energies = fort99_extractor.get_dft_energies()
-            weights = fort99_extractor.get_weights()
+                dft_energies, weights = self.__read_reference_data()
 
             root_individual = RootIndividual(dft_energies, weights, root_ffield, self.param_keys)
 
+        self.__root_individual = root_individual
+        self.__root_individual_stage = root_individual_stage
         return root_individual
 
     def get_population(self, generation_number: int) -> Tuple[List[Individual], List[int]]:
-        generation_dir_path = os.path.join(self.population_path, self.GENERATION_FOLDER_PREFIX + str(generation_number))
-        root_individual = self.get_root_individual()
-
-        population = []
-        successfully_retrieved_case_numbers = []
-        for case_number in range(self.population_size):
-            child_dir = os.path.join(generation_dir_path, self.INDIVIDUAL_FOLDER_PREFIX + str(case_number))
-            self.population_reax_reader.dir_path = child_dir
-
+        population_matrix = self.get_population_matrix(generation_number)
+        population = population_matrix.to_individuals(self.get_root_individual(), error_calculator=ReaxError)
+        return population, population_matrix.case_numbers.tolist()
+
+    def get_population_matrix(self, generation_number: int) -> PopulationMatrix:
+        """Read a generation from its archive if it has been compacted, otherwise from its child directories."""
+        archive_path = self.__generation_archive_path(generation_number)
+        if os.path.isfile(archive_path):
             try:
-                child_fort99_data = self.population_reax_reader.read_fort99()
-                child_ffield, _ = self.population_reax_reader.read_ffield()
-                child_params = [get_param(key, child_ffield) for key in self.param_keys]
-
-                fort99_extractor = Fort99Extractor(child_fort99_data)
-                child_reax_energies = fort99_extractor.get_reax_energies()
+                return self.__read_generation_archive(archive_path)
+            except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+                # Unreadable archive -> fall back to the child directories
+                pass
+        population, _ = self.__read_generation_files(generation_number)
+        return population
 
-                # noinspection PyTypeChecker
-                child = Individual(child_params, child_reax_energies, root_individual, error_calculator=ReaxError)
+    def compact_generation(self, generation_number: int) -> PopulationMatrix:
+        """Consolidate a completed generation into a single columnar archive in its generation directory,
+        so later reads (e.g., ANN training on previous populations) do not parse every child's files again.
+        Failure flags mark the cases whose results could not be retrieved.
 
-                population.append(child)
-                successfully_retrieved_case_numbers.append(case_number)
+        Returns
+        -------
+        PopulationMatrix
+            Successfully retrieved individuals of the generation.
+        """
+        population, failures = self.__read_generation_files(generation_number)
+        self.__update_manifest(generation_number, population, failures)
+        failed = np.ones(self.num_children, dtype=bool)
+        failed[population.case_numbers] = False
+
+        arrays = {'params': population.params, 'costs': population.costs, 'case_numbers': population.case_numbers,
+                  'failed': failed}
+        if population.reax_energies is not None:
+            arrays['reax_energies'] = population.reax_energies
+
+        self.__save_npz(self.__generation_archive_path(generation_number), arrays)
+        self.history_store.append(generation_number, population.params, population.reax_energies)
+        if self.evaluation_cache is not None:
+            self.evaluation_cache.put_population(population)
+        return population
 
-            except FileNotFoundError:
-                # 'fort.99' file does not exist
-                print("fort.99 not found in '{}'...continuing to next case".format(child_dir))
-                continue
-            except ValueError:
-                # Invalid number of columns in fort.99 -> skip and continue to next case
-                # TODO: Log
-                continue
+    def __read_generation_files(self, generation_number: int) -> Tuple[PopulationMatrix, Dict[int, str]]:
+        """Read a generation from its child directories.
+        Returns the successfully retrieved individuals, and the errors of the other children by case number.
+        """
+        generation_dir_path = os.path.join(self.population_path, self.GENERATION_FOLDER_PREFIX + str(generation_number))
+        root_individual = self.get_root_individual()
+        expected_num_energies = len(root_individual.dft_energies)
+
+        # Late children count as failed, whether or not they completed after the generation was closed
+        late_case_numbers = set(self.late_case_numbers(generation_number))
+        case_numbers = [case_number for case_number in range(self.num_children) if case_number not in late_case_numbers]
+        child_dirs = [os.path.join(generation_dir_path, self.INDIVIDUAL_FOLDER_PREFIX + str(case_number))
+                      for case_number in case_numbers]
+        # Parameters written with the generation -> children's ffield files do not have to be parsed
+        written_params = self.__read_written_params(generation_number)
+        if written_params is not None and len(written_params) >= self.num_children:
+            child_params = list(written_params[case_numbers])
+        else:
+            child_params = repeat(None)
+        read_arguments = (child_dirs, repeat(self.param_index), repeat(expected_num_energies),
+                          repeat(self.use_parse_cache), child_params)
+        if self.num_read_workers > 1 and len(child_dirs) > 1:
+            # Children are parsed in worker processes; results are returned in case order
+            chunk_size = max(1, len(child_dirs) // (4 * self.num_read_workers))
+            with ProcessPoolExecutor(max_workers=self.num_read_workers) as executor:
+                results = list(executor.map(read_child_status, *read_arguments, chunksize=chunk_size))
+        else:
+            results = list(map(read_child_status, *read_arguments))
 
-        return population, successfully_retrieved_case_numbers
+        params = []
+        reax_energies = []
+        successfully_retrieved_case_numbers = []
+        failures = {}
+        for case_number, (result, error) in zip(case_numbers, results):
+            if result is not None:
+                params.append(result[0])
+                reax_energies.append(result[1])
+                successfully_retrieved_case_numbers.append(case_number)
+            else:
+                failures[case_number] = error
+
+        params = np.array(params, dtype=np.float64).reshape(len(params), len(self.param_keys))
+        population = PopulationMatrix(params,
+                                      np.array(reax_energies, dtype=np.float64).reshape(len(params), -1)
+                                      if reax_energies else None,
+                                      case_numbers=successfully_retrieved_case_numbers)
+        if reax_energies:
+            # noinspection PyTypeChecker
+            population.compute_costs(root_individual, ReaxError)
+        return population, failures
+
+    def __update_manifest(self, generation_number: int, population: PopulationMatrix, failures: Dict[int, str]):
+        """Record the outcome of every child of an ingested generation in its manifest, if it has one (plain reads
+        leave the manifest alone, so they never write to the generation directory).
+        """
+        generation_dir_path = os.path.join(self.population_path, self.GENERATION_FOLDER_PREFIX + str(generation_number))
+        generation_manifest = GenerationManifest(generation_dir_path)
+        if generation_manifest.exists():
+            cached_case_numbers = set(self.cached_case_numbers(generation_number))
+            children = {case_number: {'status': FAILED, 'error': error} for case_number, error in failures.items()}
+            children.update({int(case_number): {'status': CACHED if case_number in cached_case_numbers else DONE,
+                                                'cost': _finite_or_none(cost), 'error': None}
+                             for case_number, cost in zip(population.case_numbers.tolist(), population.costs.tolist())})
+            generation_manifest.update(children)
+
+    def cached_case_numbers(self, generation_number: int) -> List[int]:
+        """Case numbers of the children of a generation whose results were reused from the evaluation cache, i.e., that
+        must not be run (read from the generation's manifest).
+        """
+        generation_dir_path = os.path.join(self.population_path, self.GENERATION_FOLDER_PREFIX + str(generation_number))
+        manifest = GenerationManifest(generation_dir_path).read()
+        if manifest is None:
+            return []
+        return sorted(case_number for case_number, child in manifest['children'].items()
+                      if child.get('status') == CACHED)
+
+    def late_case_numbers(self, generation_number: int) -> List[int]:
+        """Case numbers of the children of a generation that had not completed when the generation was closed (read
+        from the generation's manifest).
+        """
+        generation_dir_path = os.path.join(self.population_path, self.GENERATION_FOLDER_PREFIX + str(generation_number))
+        manifest = GenerationManifest(generation_dir_path).read()
+        if manifest is None:
+            return []
+        return sorted(case_number for case_number, child in manifest['children'].items() if child.get('late'))
+
+    def mark_late(self, generation_number: int, errors: Dict[int, str]):
+        """Record the children of a generation that had not completed when the generation was closed as failed (and
+        "late"), with the reason in `errors` by case number. Their results are ignored from then on.
+        """
+        generation_dir_path = os.path.join(self.population_path, self.GENERATION_FOLDER_PREFIX + str(generation_number))
+        GenerationManifest(generation_dir_path).update({case_number: {'status': FAILED, 'error': error, 'late': True}
+                                                        for case_number, error in errors.items()})
 
     def get_previous_n_populations(self, num_populations: int) -> List[Individual]:
         """Read previous N populations before the current generation number.
@@ -120,12 +317,58 @@ class PopulationFileRepository(IPopulationRepository):
         lower_bound = max(1, self.current_generation_number - num_populations)
         return self.read_population_range(lower_bound=lower_bound, upper_bound=self.current_generation_number)
 
+    def stage_child(self, generation_number: int, case_number: int) -> bool:
+        """Parse the results of a completed child and stage them in its directory, so reading the generation does not
+        parse the child's files again.
+
+        Returns
+        -------
+        bool
+            True if the child's results were staged, False if they could not be retrieved (yet).
+        """
+        child_dir = os.path.join(self.population_path, self.GENERATION_FOLDER_PREFIX + str(generation_number),
+                                 self.INDIVIDUAL_FOLDER_PREFIX + str(case_number))
+        written_params = self.__read_written_params(generation_number)
+        params = written_params[case_number] if written_params is not None and case_number < len(written_params) \
+            else None
+        # The number of energies is checked when the generation is read (the reference may not be known yet)
+        result = read_child(child_dir, self.param_index, 0, self.use_parse_cache, params)
+        if result is None or not stage_child_result(child_dir, *result):
+            return False
+
+        root_individual = self.get_root_individual()
+        cost = None
+        if len(root_individual.dft_energies) and len(root_individual.dft_energies) == len(result[1]):
+            cost = float(ReaxError.error_batch(np.asarray(result[1], dtype=np.float64), root_individual.dft_energies,
+                                               root_individual.weights, **root_individual.error_kwargs))
+        GenerationManifest(os.path.dirname(child_dir)).update({case_number: {'status': DONE,
+                                                                             'cost': _finite_or_none(cost),
+                                                                             'error': None}})
+        return True
+
+    def get_history(self, num_populations: int) -> PopulationMatrix:
+        """Evaluated individuals of the previous N populations, served as (memory-mapped) slices of the history store
+        if it holds all of them, otherwise read generation by generation.
+        """
+        lower_bound = max(1, self.current_generation_number - num_populations)
+        history = self.history_store.get_generations(lower_bound, self.current_generation_number)
+        if history is None:
+            generation_numbers = range(lower_bound, self.current_generation_number)
+            if not generation_numbers:
+                return PopulationMatrix(np.empty((0, len(self.param_keys))))
+            history = PopulationMatrix.concatenate([population for _, population in
+                                                    self.iter_population_range(lower_bound,
+                                                                               self.current_generation_number)])
+        return history
+
     def write_individual(self, individual: Individual, **kwargs):
         """Write a `case` in the population to `child_dir`.
 
         NOTE: If `child_dir` does not exist, it is created.
-        NOTE: control, exe, geo, params, trainset.in files are copied from training set directory to `child_dir`.
+        NOTE: control, geo, params, trainset.in files are copied (or linked, see `file_materialization`) from training
+        set directory to `child_dir`.
         NOTE: '0' is written to `iopt` in `child_dir` due to ReaxFF requirement.
+        NOTE: ffield is rendered from the training set ffield template with the individual's `params`.
         """
         child_dir = kwargs.get('child_dir', None)
         if not child_dir:
@@ -136,17 +379,19 @@ class PopulationFileRepository(IPopulationRepository):
             os.mkdir(child_dir)
             files_overwritten = False
 
-        shutil.copy(os.path.join(self.training_set_path, 'control'), child_dir)
-        shutil.copy(os.path.join(self.training_set_path, 'geo'), child_dir)
-        shutil.copy(os.path.join(self.training_set_path, 'params'), child_dir)
-        shutil.copy(os.path.join(self.training_set_path, 'trainset.in'), child_dir)
+        # Results staged (or cached) for a previous occupant of the directory are stale
+        for result_name in (STAGED_RESULT_NAME, CACHED_RESULT_NAME):
+            if os.path.isfile(os.path.join(child_dir, result_name)):
+                os.remove(os.path.join(child_dir, result_name))
+
+        for file_name in self.INVARIANT_TRAINING_FILES:
+            materialize(os.path.join(self.training_set_path, file_name), child_dir, self.file_materialization)
 
         with open(os.path.join(child_dir, 'iopt'), 'w') as out_file:
             out_file.write('0')
 
         try:
-            write_ffield(os.path.join(self.training_set_path, 'ffield'), os.path.join(child_dir, 'ffield'),
-                         individual.ffield, self.atom_types)
+            self.ffield_template.write(os.path.join(child_dir, 'ffield'), individual.params)
         except (OSError, IOError):
             return ResponseFailure.build_resource_error(
                 message="I/O problem with creating child directory at {}".format(child_dir))
@@ -160,8 +405,12 @@ class PopulationFileRepository(IPopulationRepository):
         else:
             return ResponseSuccess(message="Child successfully written at {}.".format(child_dir))
 
-    def write_population(self, population: List[Individual], generation_number):
-        """Write a `population` of individuals to the population generation path."""
+    def write_population(self, population: Union[List[Individual], PopulationMatrix], generation_number):
+        """Write a `population` of individuals to the population generation path, along with the (quantized)
+        parameter matrix of the generation.
+        """
+        if isinstance(population, PopulationMatrix):
+            population = population.to_individuals(self.get_root_individual())
         generation_dir_path = os.path.join(self.population_path, self.GENERATION_FOLDER_PREFIX + str(generation_number))
 
         files_overwritten = True
@@ -169,38 +418,189 @@ class PopulationFileRepository(IPopulationRepository):
             os.mkdir(generation_dir_path)
             files_overwritten = False
 
-        responses = []
-        for i, individual in enumerate(population):
-            child_dir = os.path.join(generation_dir_path, self.INDIVIDUAL_FOLDER_PREFIX + str(i))
-            responses.append(self.write_individual(individual, child_dir=child_dir))
+        # Children are being (re)written, so an existing archive/parameter matrix of this generation is stale
+        for stale_path in (self.__generation_archive_path(generation_number),
+                           self.__generation_params_path(generation_number)):
+            if os.path.isfile(stale_path):
+                os.remove(stale_path)
+
+        # Children are independent -> written concurrently (file operations are latency bound on parallel file systems)
+        child_dirs = [os.path.join(generation_dir_path, self.INDIVIDUAL_FOLDER_PREFIX + str(i))
+                      for i in range(len(population))]
+        if self.num_write_workers > 1 and len(population) > 1:
+            with ThreadPoolExecutor(max_workers=self.num_write_workers) as executor:
+                responses = list(executor.map(self.__write_child, population, child_dirs))
+        else:
+            responses = [self.__write_child(individual, child_dir)
+                         for individual, child_dir in zip(population, child_dirs)]
+
+        params = np.array([individual.params for individual in population], dtype=np.float64)
+        params = self.ffield_template.quantize(params.reshape(len(population), len(self.param_keys)))
+        cached_children = self.__serve_from_cache(params, child_dirs, responses, generation_number)
+        self.__create_manifest(generation_dir_path, generation_number, responses, cached_children)
 
+        # Stored only after the children, so the matrix never describes ffield files that were not (re)written
         if any(responses):
-            if files_overwritten:
-                return ResponseWarning(message="Population generation directory {} overwritten."
-                                       .format(generation_dir_path))
-            else:
-                return ResponseSuccess(message="Generation successfully written at {}"
-                                       .format(generation_dir_path))
-        else:
+            self.__save_npz(self.__generation_params_path(generation_number), {'params': params})
+        return self.__population_response(generation_dir_path, child_dirs, responses, files_overwritten,
+                                          cached_children)
+
+    @staticmethod
+    def __create_manifest(generation_dir_path: str, generation_number: int, responses: list,
+                          cached_children: Dict[int, Optional[float]]):
+        """Create the manifest of a newly written generation, from the responses of writing its children."""
+        children = {case_number: {'status': WRITTEN, 'error': None} if response
+                    else {'status': FAILED, 'error': response.message}
+                    for case_number, response in enumerate(responses)}
+        children.update({case_number: {'status': CACHED, 'cost': _finite_or_none(cost), 'error': None}
+                         for case_number, cost in cached_children.items()})
+        GenerationManifest(generation_dir_path).create(generation_number, children)
+
+    @staticmethod
+    def __population_response(generation_dir_path: str, child_dirs: List[str], responses: list,
+                              files_overwritten: bool, cached_children: Dict[int, Optional[float]]):
+        """Response of `write_population`, from the responses of writing the children."""
+        failures = "\n".join("{}: {}".format(child_dir, response.message)
+                             for child_dir, response in zip(child_dirs, responses) if not response)
+        if not any(responses):
             return ResponseFailure.build_resource_error(
-                message="No children in population directory {} were written successfully."
-                .format(generation_dir_path))
+                message="No children in population directory {} were written successfully.{}"
+                .format(generation_dir_path, "\n" + failures if failures else ""))
+        if failures:
+            return ResponseWarning(message="{} of {} children in population directory {} were not written:\n{}"
+                                   .format(sum(not response for response in responses), len(responses),
+                                           generation_dir_path, failures))
+        if files_overwritten:
+            return ResponseWarning(message="Population generation directory {} overwritten."
+                                   .format(generation_dir_path))
+        if cached_children:
+            return ResponseSuccess(message="Generation successfully written at {} ({} of {} children reuse cached "
+                                   "results)".format(generation_dir_path, len(cached_children), len(responses)))
+        return ResponseSuccess(message="Generation successfully written at {}".format(generation_dir_path))
+
+    def rewrite_child(self, individual: Individual, generation_number: int, case_number: int):
+        """Replace child `case_number` of an already written generation by `individual` (e.g., to reseed a child whose
+        ReaxFF optimization timed out): rewrite the child's directory and its row of the generation's parameter matrix.
+        """
+        generation_dir_path = os.path.join(self.population_path, self.GENERATION_FOLDER_PREFIX + str(generation_number))
+        child_dir = os.path.join(generation_dir_path, self.INDIVIDUAL_FOLDER_PREFIX + str(case_number))
+        response = self.__write_child(individual, child_dir)
+        if not response:
+            return response
+
+        with self.__params_lock:
+            written_params = self.__read_written_params(generation_number)
+            if written_params is not None and case_number < len(written_params):
+                written_params[case_number] = self.ffield_template.quantize(individual.params)
+                self.__save_npz(self.__generation_params_path(generation_number), {'params': written_params})
+        GenerationManifest(generation_dir_path).update({case_number: {'status': WRITTEN, 'cost': None,
+                                                                      'error': None}})
+        return ResponseSuccess(message="Child successfully rewritten at {}.".format(child_dir))
+
+    def __write_child(self, individual: Individual, child_dir: str):
+        """Write a single child, turning unexpected I/O errors into a failure response for that child."""
+        try:
+            return self.write_individual(individual, child_dir=child_dir)
+        except (OSError, IOError) as error:
+            return ResponseFailure.build_resource_error(message=error)
+
+    def __serve_from_cache(self, params: np.ndarray, child_dirs: List[str], responses: list,
+                           generation_number: int) -> Dict[int, Optional[float]]:
+        """Store the cached results of every written child that was already evaluated in its directory.
+        Returns the cost of these children (None if unknown), by case number.
+        """
+        cached_children = {}
+        # The first generation is always run: its results also provide the reference (DFT) data
+        if self.evaluation_cache is None or generation_number <= 1:
+            return cached_children
+        for case_number, (child_params, child_dir, response) in enumerate(zip(params, child_dirs, responses)):
+            if not response:
+                continue
+            cached_result = self.evaluation_cache.get(child_params)
+            if cached_result is not None and store_cached_result(child_dir, child_params, cached_result[0]):
+                cached_children[case_number] = cached_result[1]
+        return cached_children
 
     def read_population_range(self, lower_bound: int, upper_bound: int) -> List[Individual]:
         """Read population of Individuals from `_generation_path` for generations between
         [lower_bound, upper_bound) (lower bound inclusive, upper bound exclusive).
         """
+        root_individual = self.get_root_individual()
         population = []
-        for generation_number in range(lower_bound, upper_bound):
-            generation_population, _ = self.get_population(generation_number)
-            population.extend(generation_population)
+        for _, generation_population in self.iter_population_range(lower_bound, upper_bound):
+            population.extend(generation_population.to_individuals(root_individual, error_calculator=ReaxError))
         return population
 
-    def __read_reference_fort99(self) -> List:
-        self.training_reax_reader.dir_path = self.reference_path
-        fort99_data = self.training_reax_reader.read_fort99()
-        self.training_reax_reader.dir_path = self.training_set_path
-        return fort99_data
+    def __generation_archive_path(self, generation_number: int) -> str:
+        return os.path.join(self.population_path, self.GENERATION_FOLDER_PREFIX + str(generation_number),
+                            self.GENERATION_ARCHIVE_NAME)
+
+    def __generation_params_path(self, generation_number: int) -> str:
+        return os.path.join(self.population_path, self.GENERATION_FOLDER_PREFIX + str(generation_number),
+                            self.GENERATION_PARAMS_NAME)
+
+    def __read_written_params(self, generation_number: int) -> Optional[np.ndarray]:
+        """Parameter matrix stored by `write_population` for a generation, or None if missing or unreadable."""
+        try:
+            with np.load(self.__generation_params_path(generation_number), allow_pickle=False) as params_file:
+                params = params_file['params']
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            return None
+        if params.ndim != 2 or params.shape[1] != len(self.param_keys):
+            return None
+        return params
+
+    @staticmethod
+    def __save_npz(file_path: str, arrays: dict):
+        """Atomically write `arrays` to the .npz file at `file_path`."""
+        file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, 'wb') as out_file:
+                np.savez(out_file, **arrays)
+            os.replace(temp_path, file_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    @staticmethod
+    def __read_generation_archive(archive_path: str) -> PopulationMatrix:
+        with np.load(archive_path, allow_pickle=False) as archive:
+            reax_energies = archive['reax_energies'] if 'reax_energies' in archive.files else None
+            return PopulationMatrix(archive['params'], reax_energies, archive['costs'], archive['case_numbers'])
+
+    def __read_reference_fort99(self) -> np.ndarray:
+        return ReaxReader(self.reference_path, use_cache=self.use_parse_cache).read_fort99_array()
+
+    def __read_reference_data(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Reference (DFT energies, weights) from the binary reference data, if it is at least as recent as the
+        reference fort.99, otherwise from the reference fort.99 (storing the binary reference data for next time).
+        """
+        reference_data_path = os.path.join(self.reference_path, self.REFERENCE_DATA_NAME)
+        reference_fort99_path = os.path.join(self.reference_path, "fort.99")
+        try:
+            if not os.path.isfile(reference_fort99_path) or \
+                    os.stat(reference_data_path).st_mtime_ns >= os.stat(reference_fort99_path).st_mtime_ns:
+                with np.load(reference_data_path, allow_pickle=False) as reference_data:
+                    return reference_data['dft_energies'], reference_data['weights']
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            # Missing or unreadable binary reference data -> parse the reference fort.99
+            pass
+        return self.__cache_reference_data(self.__read_reference_fort99())
+
+    def __cache_reference_data(self, fort99_data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Store the reference DFT energies and weights of `fort99_data` in binary form in the reference directory."""
+        fort99_extractor = Fort99Extractor(fort99_data)
+        dft_energies = np.asarray(fort99_extractor.get_dft_energies(), dtype=np.float64)
+        weights = np.asarray(fort99_extractor.get_weights(), dtype=np.float64)
+
+        if os.path.isdir(self.reference_path):
+            try:
+                self.__save_npz(os.path.join(self.reference_path, self.REFERENCE_DATA_NAME),
+                                {'dft_energies': dft_energies, 'weights': weights})
+            except OSError:
+                # Best effort: the reference fort.99 can still be parsed next time
+                pass
+        return dft_energies, weights
 
     def __cache_reference_fort99(self, child_dir: str):
         """Takes the fort.99 file found in Generation 1 in the specified child's directory
@@ -212,20 +612,18 @@ class PopulationFileRepository(IPopulationRepository):
         reference_fort99_path = os.path.join(self.reference_path, "fort.99")
         shutil.copy(os.path.join(child_dir, 'fort.99'), reference_fort99_path)
 
-    def __find_valid_initial_fort99(self) -> Tuple[List, str]:
+    def __find_valid_initial_fort99(self) -> Tuple[np.ndarray, str]:
         """Go through Generation 1 and look until a completed child/case with a valid fort.99 file has been found.
         Upon finding the child, retrieve the fort99 data for that child.
         """
         generation_dir_path = os.path.join(self.population_path, self.GENERATION_FOLDER_PREFIX + "1")
 
         child_dir = ""
-        fort99_data = []
-        for case_number in range(self.population_size):
+        fort99_data = np.empty((0, 3))
+        for case_number in range(self.num_children):
             child_dir = os.path.join(generation_dir_path, self.INDIVIDUAL_FOLDER_PREFIX + str(case_number))
-            self.training_reax_reader.dir_path = child_dir
-
             try:
-                fort99_data = self.training_reax_reader.read_fort99()
+                fort99_data = ReaxReader(child_dir, use_cache=self.use_parse_cache).read_fort99_array()
                 break
             except FileNotFoundError:
                 continue
@@ -234,3 +632,129 @@ class PopulationFileRepository(IPopulationRepository):
                 continue
 
         return fort99_data, child_dir
+
+
+def read_child(child_dir: str, param_index: ParamIndex, expected_num_energies: int, use_cache: bool = False,
+               params: Optional[np.ndarray] = None) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Read a single child directory: optimized parameters (from its ffield) and ReaxFF energies (from its fort.99).
+    Stateless (a new reader is created for the directory), so it can be used from threads or worker processes.
+
+    Parameters
+    ----------
+    params: np.ndarray, optional
+        Parameters of the child as written by the repository; if given, the child's ffield is not parsed.
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray] or None
+        (parameters, ReaxFF energies), or None if the child's results could not be retrieved.
+    """
+    result, _ = read_child_status(child_dir, param_index, expected_num_energies, use_cache, params)
+    return result
+
+
+def read_child_status(child_dir: str, param_index: ParamIndex, expected_num_energies: int, use_cache: bool = False,
+                      params: Optional[np.ndarray] = None) \
+        -> Tuple[Optional[Tuple[np.ndarray, np.ndarray]], Optional[str]]:
+    """Same as `read_child`, along with the reason why the child's results could not be retrieved (None if they
+    were retrieved).
+    """
+    for stored_result in (read_cached_result(child_dir), read_staged_result(child_dir)):
+        if stored_result is not None and (not expected_num_energies or len(stored_result[1]) == expected_num_energies):
+            return stored_result, None
+
+    reax_reader = ReaxReader(child_dir, use_cache=use_cache)
+    try:
+        child_fort99_data = reax_reader.read_fort99_array()
+        if params is None:
+            child_ffield, _ = reax_reader.read_ffield()
+            params = param_index.extract(param_index.flatten(child_ffield))
+
+        fort99_extractor = Fort99Extractor(child_fort99_data)
+        child_reax_energies = fort99_extractor.get_reax_energies()
+        if expected_num_energies and len(child_reax_energies) != expected_num_energies:
+            raise ValueError("Number of fort.99 rows in '{}' does not match the reference fort.99."
+                             .format(child_dir))
+    except FileNotFoundError as error:
+        # 'fort.99' file does not exist
+        print("fort.99 not found in '{}'...continuing to next case".format(child_dir))
+        return None, "{}: {}".format(error.__class__.__name__, error)
+    except ValueError as error:
+        # Invalid number of columns in fort.99 -> skip and continue to next case
+        # TODO: Log
+        return None, "{}: {}".format(error.__class__.__name__, error)
+
+    return (params, child_reax_energies), None
+
+
+def stage_child_result(child_dir: str, params: np.ndarray, reax_energies: np.ndarray) -> bool:
+    """Atomically store the parsed results of a child in its directory, keyed by the current state of its fort.99.
+    Returns False if the results could not be stored.
+    """
+    try:
+        stat_result = os.stat(os.path.join(child_dir, 'fort.99'))
+        file_descriptor, temp_path = tempfile.mkstemp(dir=child_dir, suffix=".tmp")
+    except OSError:
+        return False
+    try:
+        with os.fdopen(file_descriptor, 'wb') as out_file:
+            np.savez(out_file, params=np.asarray(params, dtype=np.float64),
+                     reax_energies=np.asarray(reax_energies, dtype=np.float64),
+                     fort99_key=np.array([stat_result.st_size, stat_result.st_mtime_ns], dtype=np.int64))
+        os.replace(temp_path, os.path.join(child_dir, STAGED_RESULT_NAME))
+    except OSError:
+        return False
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return True
+
+
+def read_staged_result(child_dir: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """(parameters, ReaxFF energies) staged in `child_dir`, or None if there are none or the child's fort.99 has
+    changed since they were staged.
+    """
+    try:
+        stat_result = os.stat(os.path.join(child_dir, 'fort.99'))
+        with np.load(os.path.join(child_dir, STAGED_RESULT_NAME), allow_pickle=False) as staged_result:
+            if staged_result['fort99_key'].tolist() != [stat_result.st_size, stat_result.st_mtime_ns]:
+                return None
+            return staged_result['params'], staged_result['reax_energies']
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+
+
+def store_cached_result(child_dir: str, params: np.ndarray, reax_energies: np.ndarray) -> bool:
+    """Atomically store results reused from the evaluation cache in a child's directory (the child is not run).
+    Returns False if the results could not be stored.
+    """
+    try:
+        file_descriptor, temp_path = tempfile.mkstemp(dir=child_dir, suffix=".tmp")
+    except OSError:
+        return False
+    try:
+        with os.fdopen(file_descriptor, 'wb') as out_file:
+            np.savez(out_file, params=np.asarray(params, dtype=np.float64),
+                     reax_energies=np.asarray(reax_energies, dtype=np.float64))
+        os.replace(temp_path, os.path.join(child_dir, CACHED_RESULT_NAME))
+    except OSError:
+        return False
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return True
+
+
+def read_cached_result(child_dir: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """(parameters, ReaxFF energies) reused from the evaluation cache for `child_dir`, or None if there are none."""
+    try:
+        with np.load(os.path.join(child_dir, CACHED_RESULT_NAME), allow_pickle=False) as cached_result:
+            return cached_result['params'], cached_result['reax_energies']
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+
+
+def _finite_or_none(value: Optional[float]) -> Optional[float]:
+    """`value` if it is a finite number, otherwise None (e.g., NaN costs cannot be stored as JSON)."""
+    if value is None or not np.isfinite(value):
+        return None
+    return float(value)
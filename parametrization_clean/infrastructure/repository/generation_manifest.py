@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+"""Module with the manifest of a generation: a small JSON file (`manifest.json` in the generation directory) with the
+status of every child, so progress can be queried without walking the children's directories or parsing any fort.99.
+
+Each child (keyed by its case number) has a status:
+    - "written": input files written, ReaxFF optimization not known to have started.
+    - "running": ReaxFF optimization started.
+    - "done": results retrieved; `cost` holds the total error if it could be computed.
+    - "failed": input files could not be written or results could not be retrieved; `error` holds the reason.
+    - "cached": results reused from the evaluation cache (see `evaluation_cache`); the child must not be run.
+      `cost` holds the total error if it is known.
+Children that had not completed when their generation was closed (see `local_runner`) are "failed" and flagged with
+`late`. Each child also has timestamps (seconds since the epoch) of when it was written (`written_at`) and when its
+status last changed (`updated_at`).
+
+Updates are read-modify-write cycles of the whole file, serialized between processes with an advisory lock (where
+available) and made visible atomically by replacing the file.
+"""
+
+# Standard library
+from contextlib import contextmanager
+from typing import Dict, Optional
+import json
+import os
+import tempfile
+import time
+
+# 3rd party packages
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Local source
+
+WRITTEN = "written"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CACHED = "cached"
+CHILD_STATUSES = (WRITTEN, RUNNING, DONE, FAILED, CACHED)
+
+
+class GenerationManifest(object):
+    MANIFEST_NAME = "manifest.json"
+    LOCK_NAME = ".manifest.lock"
+
+    def __init__(self, generation_dir_path: str):
+        self.generation_dir_path = generation_dir_path
+        self.manifest_path = os.path.join(generation_dir_path, self.MANIFEST_NAME)
+
+    def exists(self) -> bool:
+        return os.path.isfile(self.manifest_path)
+
+    def read(self) -> Optional[dict]:
+        """Content of the manifest ({'generation_number', 'population_size', 'updated_at', 'children'}), with
+        children keyed by case number, or None if there is no (readable) manifest.
+        """
+        try:
+            with open(self.manifest_path, 'r') as in_file:
+                manifest = json.load(in_file)
+        except (OSError, ValueError):
+            return None
+        manifest['children'] = {int(case_number): child for case_number, child in manifest['children'].items()}
+        return manifest
+
+    def create(self, generation_number: int, children: Dict[int, dict]):
+        """Start a new manifest for a (re)written generation; `children` maps case numbers to their entries."""
+        now = time.time()
+        with self.__lock():
+            self.__write({'generation_number': generation_number, 'population_size': len(children),
+                          'updated_at': now,
+                          'children': {case_number: dict({'written_at': now, 'updated_at': now}, **child)
+                                       for case_number, child in children.items()}})
+
+    def update(self, children: Dict[int, dict]):
+        """Merge the entries of `children` into the existing manifest (no-op if there is no manifest)."""
+        if not children or not self.exists():
+            return
+        now = time.time()
+        with self.__lock():
+            manifest = self.read()
+            if manifest is None:
+                return
+            for case_number, child in children.items():
+                manifest['children'].setdefault(case_number, {}).update(child, updated_at=now)
+            manifest['updated_at'] = now
+            self.__write(manifest)
+
+    def summary(self) -> Optional[Dict[str, int]]:
+        """Number of children per status, or None if there is no manifest."""
+        manifest = self.read()
+        if manifest is None:
+            return None
+        return count_statuses(manifest['children'])
+
+    @contextmanager
+    def __lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.generation_dir_path, self.LOCK_NAME), 'a') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def __write(self, manifest: dict):
+        manifest = dict(manifest, children={str(case_number): child
+                                            for case_number, child in sorted(manifest['children'].items())})
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.generation_dir_path, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, 'w') as out_file:
+                json.dump(manifest, out_file)
+            os.replace(temp_path, self.manifest_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+
+def count_statuses(children: Dict[int, dict]) -> Dict[str, int]:
+    """Number of `children` (manifest entries) per status."""
+    counts = dict.fromkeys(CHILD_STATUSES, 0)
+    for child in children.values():
+        status = child.get('status', WRITTEN)
+        counts[status] = counts.get(status, 0) + 1
+    return counts
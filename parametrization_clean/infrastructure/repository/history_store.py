@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+
+"""Append-only, memory-mapped store with the parameters and ReaxFF energies of every evaluated individual, used as
+training data for the surrogate (ANN) model. Rows are stored generation by generation in two raw binary files
+(`params.bin`, (N, P) and `reax_energies.bin`, (N, M)), described by a small JSON index (`index.json`) mapping each
+generation to its range of rows. Reading any number of generations memory-maps the files and returns slices of them,
+so the history never has to fit in memory and no Individual objects are created.
+
+Data can be stored as float64 (default) or float32, which halves the size of the store. The data type of a store is
+fixed when it is created.
+
+NOTE: rows are appended before the index is (atomically) updated, so an interrupted append never leaves the index
+pointing to incomplete rows; rows that are not in the index are discarded on the next append.
+"""
+
+# Standard library
+from typing import List, Optional
+import json
+import os
+import tempfile
+
+# 3rd party packages
+import numpy as np
+
+# Local source
+from parametrization_clean.domain.population_matrix import PopulationMatrix
+
+HISTORY_DTYPES = ("float64", "float32")
+
+
+class HistoryStore(object):
+    INDEX_NAME = "index.json"
+    PARAMS_NAME = "params.bin"
+    REAX_ENERGIES_NAME = "reax_energies.bin"
+
+    def __init__(self, dir_path: str, dtype: str = "float64"):
+        """Open the history store in `dir_path`; the directory is only created on the first append.
+
+        Parameters
+        ----------
+        dir_path: str
+            Directory of the store.
+        dtype: str, default = "float64"
+            Data type of a new store, "float64" or "float32". Existing stores keep the data type they were created with.
+        """
+        if dtype not in HISTORY_DTYPES:
+            raise ValueError("Unknown history data type '{}'; expected one of {}."
+                             .format(dtype, ", ".join(HISTORY_DTYPES)))
+        self.dir_path = dir_path
+        self.__index = self.__read_index() or {'dtype': dtype, 'num_params': None, 'num_energies': None,
+                                               'generations': []}
+
+    def __len__(self):
+        generations = self.__index['generations']
+        return generations[-1][2] if generations else 0
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(self.__index['dtype'])
+
+    @property
+    def generation_numbers(self) -> List[int]:
+        return [generation_number for generation_number, _, _ in self.__index['generations']]
+
+    @property
+    def params(self) -> np.ndarray:
+        """(N, P) memory-mapped (read-only) parameters of all stored individuals."""
+        return self.__map(self.PARAMS_NAME, self.__index['num_params'])
+
+    @property
+    def reax_energies(self) -> np.ndarray:
+        """(N, M) memory-mapped (read-only) ReaxFF energies of all stored individuals."""
+        return self.__map(self.REAX_ENERGIES_NAME, self.__index['num_energies'])
+
+    def get_generations(self, lower_bound: int, upper_bound: int) -> Optional[PopulationMatrix]:
+        """Individuals of the generations between [lower_bound, upper_bound) (lower bound inclusive, upper bound
+        exclusive), as a PopulationMatrix of (zero-copy) slices of the store.
+        Returns None if any generation of the range is missing from the store.
+        """
+        rows = {generation_number: (start, stop) for generation_number, start, stop in self.__index['generations']}
+        requested_generations = range(lower_bound, upper_bound)
+        if not requested_generations or any(generation_number not in rows for generation_number in
+                                            requested_generations):
+            return None
+        # Generations are appended in increasing order -> rows of a range of generations are contiguous
+        start, stop = rows[lower_bound][0], rows[upper_bound - 1][1]
+        return PopulationMatrix(self.params[start:stop], self.reax_energies[start:stop])
+
+    def append(self, generation_number: int, params, reax_energies):
+        """Append the individuals of a generation. If the generation is already stored, it is replaced, and all
+        generations stored after it are discarded (they were derived from the replaced data).
+        """
+        params = np.asarray(params, dtype=self.dtype)
+        if reax_energies is None or not len(params):
+            # Nothing evaluated in the generation -> recorded with an empty range of rows
+            params = np.empty((0, 0), dtype=self.dtype)
+            reax_energies = np.empty((0, 0), dtype=self.dtype)
+        reax_energies = np.asarray(reax_energies, dtype=self.dtype)
+        if len(reax_energies) != len(params):
+            raise ValueError("Number of rows of parameters and ReaxFF energies do not match ({} != {})."
+                             .format(len(params), len(reax_energies)))
+
+        index = dict(self.__index)
+        generations = [generation for generation in index['generations'] if generation[0] < generation_number]
+        if len(params):
+            for key, num_columns in (('num_params', params.shape[1]), ('num_energies', reax_energies.shape[1])):
+                if generations and index[key] is not None and index[key] != num_columns:
+                    raise ValueError("History store {} holds {} columns for {}, got {}."
+                                     .format(self.dir_path, index[key], key, num_columns))
+                index[key] = num_columns
+
+        start = generations[-1][2] if generations else 0
+        if not os.path.isdir(self.dir_path):
+            os.makedirs(self.dir_path)
+        for file_name, array, key in ((self.PARAMS_NAME, params, 'num_params'),
+                                      (self.REAX_ENERGIES_NAME, reax_energies, 'num_energies')):
+            with open(os.path.join(self.dir_path, file_name), 'ab') as out_file:
+                # Rows after the kept generations (replaced generations or interrupted appends) are discarded
+                out_file.truncate(start * (index[key] or 0) * self.dtype.itemsize)
+                out_file.write(np.ascontiguousarray(array).tobytes())
+
+        index['generations'] = generations + [[generation_number, start, start + len(params)]]
+        self.__write_index(index)
+        self.__index = index
+
+    def __map(self, file_name: str, num_columns: Optional[int]) -> np.ndarray:
+        num_rows = len(self)
+        if not num_rows:
+            return np.empty((0, num_columns or 0), dtype=self.dtype)
+        return np.memmap(os.path.join(self.dir_path, file_name), dtype=self.dtype, mode='r',
+                         shape=(num_rows, num_columns))
+
+    def __read_index(self) -> Optional[dict]:
+        try:
+            with open(os.path.join(self.dir_path, self.INDEX_NAME), 'r') as in_file:
+                return json.load(in_file)
+        except (OSError, ValueError):
+            return None
+
+    def __write_index(self, index: dict):
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.dir_path, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, 'w') as out_file:
+                json.dump(index, out_file)
+            os.replace(temp_path, os.path.join(self.dir_path, self.INDEX_NAME))
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+
+"""Module with a population repository that keeps every generation in memory, as PopulationMatrix objects, instead of
+writing children's directories. Used with in-process evaluators (e.g., `AnalyticEvaluator`) to run the genetic
+algorithm without any file I/O.
+"""
+
+# Standard library
+from typing import Dict, List, Tuple, Union
+
+# 3rd party packages
+import numpy as np
+
+# Local source
+from parametrization_clean.domain.root_individual import RootIndividual
+from parametrization_clean.domain.individual import Individual
+from parametrization_clean.domain.population_matrix import PopulationMatrix, as_population_matrix
+from parametrization_clean.use_case.port.population_repository import IPopulationRepository
+from parametrization_clean.infrastructure.utils.response_object import ResponseSuccess
+
+
+class InMemoryPopulationRepository(IPopulationRepository):
+
+    def __init__(self, root_individual: RootIndividual, current_generation_number: int = 1):
+        self.root_individual = root_individual
+        self.current_generation_number = current_generation_number
+        self.populations: Dict[int, PopulationMatrix] = {}
+
+    def get_root_individual(self) -> RootIndividual:
+        return self.root_individual
+
+    def get_population(self, generation_number: int) -> Tuple[List[Individual], List[int]]:
+        population_matrix = self.get_population_matrix(generation_number)
+        return population_matrix.to_individuals(self.root_individual), population_matrix.case_numbers.tolist()
+
+    def get_population_matrix(self, generation_number: int) -> PopulationMatrix:
+        """Stored population of a generation; empty if the generation was never written."""
+        population = self.populations.get(generation_number)
+        if population is None:
+            return PopulationMatrix(np.empty((0, len(self.root_individual.root_params))))
+        return population
+
+    def get_previous_n_populations(self, num_populations: int) -> List[Individual]:
+        lower_bound = max(1, self.current_generation_number - num_populations)
+        population = []
+        for _, population_matrix in self.iter_population_range(lower_bound, self.current_generation_number):
+            population.extend(population_matrix.to_individuals(self.root_individual))
+        return population
+
+    def get_history(self, num_populations: int) -> PopulationMatrix:
+        """Evaluated individuals of the previous N populations, concatenated without building Individual objects."""
+        lower_bound = max(1, self.current_generation_number - num_populations)
+        evaluated_populations = [population for _, population in
+                                 self.iter_population_range(lower_bound, self.current_generation_number)
+                                 if population.reax_energies is not None and len(population)]
+        if not evaluated_populations:
+            return PopulationMatrix(np.empty((0, len(self.root_individual.root_params))))
+        return PopulationMatrix.concatenate(evaluated_populations)
+
+    def write_individual(self, individual: Individual, **kwargs):
+        # Individuals are only stored as part of a generation
+        return ResponseSuccess(message="Individual kept in memory.")
+
+    def write_population(self, population: Union[List[Individual], PopulationMatrix], generation_number):
+        """Store the population of a generation (replacing any previously stored population of that generation)."""
+        self.populations[generation_number] = as_population_matrix(population)
+        return ResponseSuccess(message="Generation {} stored in memory.".format(generation_number))
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+
+"""Module to watch the children of a generation while their ReaxFF optimizations run, and to hand over every child
+as soon as its fort.99 file is complete (e.g., to parse and stage its results), instead of waiting for the whole
+generation to finish.
+
+On Linux, file events are received through inotify if the optional `inotify_simple` package is installed. Events are
+not delivered for files written on other nodes of a shared/parallel file system, so the children's directories are
+also polled (one stat per pending child), with an interval that grows geometrically while nothing completes.
+Without inotify, polling is the only mechanism.
+"""
+
+# Standard library
+from typing import Callable, Dict, List, Optional, Set, Tuple
+import os
+import time
+
+# 3rd party packages
+try:
+    import inotify_simple
+except ImportError:
+    inotify_simple = None
+
+# Local source
+
+COMPLETION_FILE_NAME = "fort.99"
+
+
+class CompletionWatcher(object):
+
+    def __init__(self, child_dirs: List[str], poll_interval: float = 1.0, max_poll_interval: float = 30.0,
+                 backoff: float = 2.0, settle_time: float = 1.0, use_inotify: bool = True):
+        """Watch `child_dirs`; child i (case number i) is complete once `child_dirs[i]`/fort.99 is complete.
+
+        Parameters
+        ----------
+        child_dirs: List[str]
+            Directories of the children, in case number order.
+        poll_interval: float, default = 1.0
+            Initial interval between polls (seconds); the interval is reset whenever a child completes.
+        max_poll_interval: float, default = 30.0
+            Largest interval between polls (seconds).
+        backoff: float, default = 2.0
+            Factor by which the polling interval grows while no child completes.
+        settle_time: float, default = 1.0
+            When polling, a fort.99 file is considered written once its size and modification time have not changed
+            between two polls, or once it has not been modified for `settle_time` seconds.
+        use_inotify: bool, default = True
+            Whether to receive file events through inotify, if available.
+        """
+        self.child_dirs = list(child_dirs)
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max(poll_interval, max_poll_interval)
+        self.backoff = backoff
+        self.settle_time = settle_time
+        self.use_inotify = use_inotify and inotify_simple is not None
+
+    def watch(self, on_complete: Callable[[int, str], bool], timeout: Optional[float] = None,
+              num_required: Optional[int] = None) -> List[int]:
+        """Call `on_complete(case_number, child_dir)` for every child whose fort.99 file is complete, until all
+        children (or `num_required` of them) have completed or `timeout` seconds have elapsed. `on_complete` returns
+        False if the child's results could not be used yet (e.g., fort.99 still being written); the child is then
+        checked again later.
+
+        Returns
+        -------
+        List[int]
+            Case numbers of the completed children, in order of completion.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pending = set(range(len(self.child_dirs)))
+        completed = []
+        num_required = len(self.child_dirs) if num_required is None else min(num_required, len(self.child_dirs))
+        last_stats = {}  # type: Dict[int, Tuple[int, int]]
+
+        inotify, watch_descriptors = self.__start_inotify() if self.use_inotify else (None, {})
+        try:
+            interval = self.poll_interval
+            signalled = set()  # type: Set[int]
+            while len(completed) < num_required:
+                progressed = self.__poll(on_complete, pending, signalled, last_stats, completed, num_required)
+                if len(completed) >= num_required:
+                    break
+                interval = self.poll_interval if progressed else min(interval * self.backoff, self.max_poll_interval)
+                interval = _bounded_interval(interval, deadline)
+                if interval is None:
+                    break
+                signalled = self.__wait(inotify, watch_descriptors, interval) & pending
+                if signalled:
+                    interval = self.poll_interval
+        finally:
+            if inotify is not None:
+                inotify.close()
+
+        return completed
+
+    def __poll(self, on_complete: Callable[[int, str], bool], pending: Set[int], signalled: Set[int],
+               last_stats: Dict[int, Tuple[int, int]], completed: List[int], num_required: int) -> bool:
+        """Check every pending child once, handing over the completed ones (moved from `pending` to `completed`) until
+        `num_required` children have completed. Returns whether any child completed.
+        """
+        progressed = False
+        for case_number in sorted(pending):
+            stat_key = _completion_file_stat(self.child_dirs[case_number])
+            if stat_key is None:
+                continue
+            unchanged = last_stats.get(case_number) == stat_key
+            settled = case_number in signalled or unchanged or self.__is_settled(stat_key)
+            last_stats[case_number] = stat_key
+            if settled and on_complete(case_number, self.child_dirs[case_number]):
+                pending.discard(case_number)
+                completed.append(case_number)
+                progressed = True
+                if len(completed) >= num_required:
+                    break
+        return progressed
+
+    def __is_settled(self, stat_key: Tuple[int, int]) -> bool:
+        """Whether a fort.99 file has not been modified for `settle_time` seconds."""
+        return time.time() - stat_key[1] / 1e9 >= self.settle_time
+
+    def __start_inotify(self):
+        inotify = inotify_simple.INotify()
+        watch_flags = inotify_simple.flags.CLOSE_WRITE | inotify_simple.flags.MOVED_TO
+        watch_descriptors = {}
+        for case_number, child_dir in enumerate(self.child_dirs):
+            try:
+                watch_descriptors[inotify.add_watch(child_dir, watch_flags)] = case_number
+            except OSError:
+                # e.g., directory does not exist (yet) -> this child is only polled
+                continue
+        return inotify, watch_descriptors
+
+    @staticmethod
+    def __wait(inotify, watch_descriptors: Dict[int, int], interval: float) -> Set[int]:
+        """Wait `interval` seconds, or until fort.99 files are written if inotify is used; return the case numbers
+        whose fort.99 files were written.
+        """
+        if inotify is None:
+            time.sleep(interval)
+            return set()
+        events = inotify.read(timeout=int(interval * 1000))
+        return {watch_descriptors[event.wd] for event in events
+                if event.name == COMPLETION_FILE_NAME and event.wd in watch_descriptors}
+
+
+def _bounded_interval(interval: float, deadline: Optional[float]) -> Optional[float]:
+    """`interval`, shortened so it ends by `deadline` (a `time.monotonic()` value), or None if the deadline has
+    passed.
+    """
+    if deadline is None:
+        return interval
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        return None
+    return min(interval, remaining)
+
+
+def _completion_file_stat(child_dir: str) -> Optional[Tuple[int, int]]:
+    """(size, modification time in ns) of the child's fort.99 file, or None if it does not exist (or is empty)."""
+    try:
+        stat_result = os.stat(os.path.join(child_dir, COMPLETION_FILE_NAME))
+    except OSError:
+        return None
+    if not stat_result.st_size:
+        return None
+    return stat_result.st_size, stat_result.st_mtime_ns
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+
+"""Module with a precompiled template of a reference ffield file, used to write the ffield of new individuals.
+Only the optimized parameters differ between the reference ffield and a child's ffield, so the reference file is
+compiled once into a single format string: the text is kept verbatim, and every optimized parameter is replaced with a
+fixed-width slot spanning the original token (and the whitespace preceding it). Rendering a child is then one
+`str.format` call with the child's parameters.
+"""
+
+# Standard library
+from typing import Dict, List, Tuple
+import re
+
+# 3rd party packages
+import numpy as np
+
+# Local source
+
+TOKEN_PATTERN = re.compile(r"\S+")
+DECIMALS = 4
+
+
+class FfieldTemplate(object):
+
+    def __init__(self, ffield_path: str, param_keys: List[List[int]]):
+        """Compile the ffield file at `ffield_path` into a template with one slot per parameter key.
+
+        Parameters
+        ----------
+        ffield_path: str
+            File path of the reference ffield file.
+        param_keys: List[List[int]]
+            List of keys mapping to values in the ffield object: [section # | line/row # | parameter #].
+        """
+        with open(ffield_path, 'r') as in_file:
+            text = in_file.read()
+
+        spans = _parameter_spans(text)
+        slots = []
+        for param_number, key in enumerate(param_keys):
+            try:
+                slots.append((spans[tuple(key)], param_number))
+            except KeyError:
+                raise ValueError("Parameter key {} does not exist in ffield file {}.".format(key, ffield_path))
+        slots.sort()
+
+        template = []
+        string_template = []
+        slot_widths = np.zeros(len(param_keys), dtype=np.int64)
+        capacities = np.zeros(len(param_keys), dtype=np.int64)
+        position = 0
+        for (slot_start, slot_end, separated), param_number in slots:
+            literal = text[position:slot_start].replace("{", "{{").replace("}", "}}")
+            template.append(literal + "{" + "{}:>{}.{}f".format(param_number, slot_end - slot_start, DECIMALS) + "}")
+            string_template.append(literal + "{" + str(param_number) + "}")
+            slot_widths[param_number] = slot_end - slot_start
+            # One character of the slot has to stay blank if it separates the value from a preceding token
+            capacities[param_number] = slot_end - slot_start - int(separated)
+            position = slot_end
+        literal = text[position:].replace("{", "{{").replace("}", "}}")
+        self.template = "".join(template) + literal
+        self.string_template = "".join(string_template) + literal
+        self.slot_widths = slot_widths
+
+        # Largest/smallest values whose %.4f representation fits into each slot
+        self.upper_limits = 10.0 ** (capacities - DECIMALS - 1) - 0.5 * 10.0 ** -DECIMALS
+        self.lower_limits = -(10.0 ** (capacities - DECIMALS - 2) - 0.5 * 10.0 ** -DECIMALS)
+
+    def render(self, params) -> str:
+        """Text of the ffield file with `params` filled into the parameter slots."""
+        params = np.asarray(params, dtype=np.float64)
+        overflow = (params >= self.upper_limits) | (params <= self.lower_limits)
+        if not overflow.any():
+            return self.template.format(*params.tolist())
+
+        # Values too wide for their slot are still written, separated from the preceding token by a single space
+        formatted_params = ["{:>{w}.{p}f}".format(param, w=width, p=DECIMALS) if not too_wide
+                            else " {:.{p}f}".format(param, p=DECIMALS)
+                            for param, width, too_wide in zip(params.tolist(), self.slot_widths.tolist(),
+                                                              overflow.tolist())]
+        return self.string_template.format(*formatted_params)
+
+    @staticmethod
+    def quantize(params) -> np.ndarray:
+        """Values of `params` exactly as they appear in a rendered ffield file (same shape as `params`)."""
+        params = np.asarray(params, dtype=np.float64)
+        return np.array(["{:.{p}f}".format(param, p=DECIMALS) for param in params.ravel().tolist()],
+                        dtype=np.float64).reshape(params.shape)
+
+    def write(self, output_path: str, params):
+        with open(output_path, 'w') as out_file:
+            out_file.write(self.render(params))
+
+
+def _parameter_spans(text: str) -> Dict[Tuple[int, int, int], Tuple[int, int, bool]]:
+    """Map every (section #, line/row #, parameter #) key of the ffield `text` to the span of its slot:
+    (start offset, end offset, whether the slot follows another token on the same line).
+    The section layout follows `reax_reader.parse_ffield`.
+    """
+    lines = text.splitlines(keepends=True)
+    line_offsets = np.cumsum([0] + [len(line) for line in lines]).tolist()
+
+    def row_tokens(first_line: int, num_lines: int) -> List[Tuple[int, int, bool]]:
+        tokens = []
+        for line_number in range(first_line, first_line + num_lines):
+            line_start = line_offsets[line_number]
+            previous_end = 0
+            for match in TOKEN_PATTERN.finditer(lines[line_number]):
+                tokens.append((line_start + previous_end, line_start + match.end(), previous_end > 0))
+                previous_end = match.end()
+        return tokens
+
+    spans = {}
+
+    # 1st section - General Info; only the first column of each line is a value
+    num_general = int(lines[1].split(None, 1)[0])
+    position = 2
+    for row in range(num_general):
+        spans[(1, row + 1, 1)] = row_tokens(position + row, 1)[0]
+    position += num_general
+
+    # 2nd and 3rd sections - Atom and Bond Info:
+    # (comment lines after the count line, lines per entry, leading atom type tokens)
+    # 4th-7th sections - Off Diagonal, Angular, Torsion Terms and Hydrogen Bonds
+    section_layouts = ((2, 3, 4, 1), (3, 1, 2, 2), (4, 0, 1, 2), (5, 0, 1, 3), (6, 0, 1, 4), (7, 0, 1, 3))
+    for section, num_comment_lines, lines_per_row, num_atom_type_tokens in section_layouts:
+        num_rows = int(lines[position].split(None, 1)[0])
+        position += 1 + num_comment_lines
+        for row in range(num_rows):
+            tokens = row_tokens(position, lines_per_row)[num_atom_type_tokens:]
+            for param_number, span in enumerate(tokens):
+                spans[(section, row + 1, param_number + 1)] = span
+            position += lines_per_row
+
+    return spans
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+"""Module to materialize invariant training set files (control, geo, params, trainset.in) in a child directory.
+Instead of copying the data for every child of every generation, the files can be hard linked, symbolically linked or
+reflinked (copy-on-write clone, on file systems that support it), which only costs a metadata operation.
+Copying is used whenever the requested mode is not supported (e.g., hard links across file systems).
+
+NOTE: linked files share their data with the training set, so they must never be modified in place in a child
+directory. Destinations are always unlinked before being materialized, so rewriting a child never writes through a link.
+"""
+
+# Standard library
+import os
+import shutil
+
+# 3rd party packages
+
+# Local source
+
+COPY = "copy"
+HARDLINK = "hardlink"
+SYMLINK = "symlink"
+REFLINK = "reflink"
+MATERIALIZATION_MODES = (COPY, HARDLINK, SYMLINK, REFLINK)
+
+# Linux ioctl request to clone a file's extents: _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+
+def materialize(source_path: str, destination_dir: str, mode: str = COPY) -> str:
+    """Make the file at `source_path` available in `destination_dir` (same file name) using `mode`, falling back to
+    a copy if the mode is not supported.
+
+    Parameters
+    ----------
+    source_path: str
+        File path of the source (training set) file.
+    destination_dir: str
+        Directory where the file is materialized.
+    mode: str, default = "copy"
+        One of "copy", "hardlink", "symlink" or "reflink".
+    Returns
+    -------
+    str
+        Path of the materialized file.
+    """
+    if mode not in MATERIALIZATION_MODES:
+        raise ValueError("Unknown file materialization mode '{}'; expected one of {}."
+                         .format(mode, ", ".join(MATERIALIZATION_MODES)))
+    if not os.path.isfile(source_path):
+        raise FileNotFoundError("Training set file {} does not exist.".format(source_path))
+
+    destination_path = os.path.join(destination_dir, os.path.basename(source_path))
+    _remove(destination_path)
+
+    if mode != COPY:
+        try:
+            if mode == HARDLINK:
+                os.link(source_path, destination_path)
+            elif mode == SYMLINK:
+                os.symlink(os.path.abspath(source_path), destination_path)
+            else:
+                _reflink(source_path, destination_path)
+            if os.path.isfile(destination_path):
+                return destination_path
+        except (OSError, ImportError):
+            pass
+        # Mode not supported here (or dangling link) -> copy instead
+        _remove(destination_path)
+
+    shutil.copyfile(source_path, destination_path)
+    shutil.copymode(source_path, destination_path)
+    return destination_path
+
+
+def _reflink(source_path: str, destination_path: str):
+    import fcntl
+
+    with open(source_path, 'rb') as in_file, open(destination_path, 'wb') as out_file:
+        fcntl.ioctl(out_file.fileno(), FICLONE, in_file.fileno())
+
+
+def _remove(path: str):
+    if os.path.lexists(path):
+        os.remove(path)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+
+"""Module to run the ReaxFF optimizations of a generation's children on the local machine (workstation or single
+node), instead of submitting one job per child to a scheduler.
+
+The configured command (e.g., the ReaxFF executable `reac`, or any stand-in command) is run in every child's
+directory through a bounded pool, so at most `num_workers` optimizations run at the same time. An optimization that
+exceeds its wall-clock time limit is killed (along with any process it started); an optimization that crashes
+(non-zero exit status, or no fort.99 written) is restarted up to `max_retries` times. The output of every run is
+appended to `reaxff.out`/`reaxff.err` in the child's directory.
+
+A run can be closed early, so a generation does not wait for its slowest (straggling) children: once `num_required`
+children have succeeded, or once the deadline of the whole run has passed, optimizations that have not started are
+skipped and running ones are killed. Their errors are prefixed with `LATE_ERROR` (see `is_late`).
+"""
+
+# Standard library
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import Callable, Dict, List, Optional, Tuple
+import os
+import signal
+import subprocess
+import threading
+import time
+
+# 3rd party packages
+
+# Local source
+
+COMPLETION_FILE_NAME = "fort.99"
+# Prefix of the errors of children that had not completed when their run was closed
+LATE_ERROR = "GenerationClosed"
+# Interval (seconds) at which running optimizations check whether their run was closed
+CLOSE_POLL_INTERVAL = 0.1
+
+
+class LocalReaxRunner(object):
+    OUTPUT_NAME = "reaxff.out"
+    ERROR_NAME = "reaxff.err"
+
+    def __init__(self, command: str = "reac", num_workers: int = 1, timeout: Optional[float] = None,
+                 max_retries: int = 1):
+        """Run `command` (through the shell) in the directories of children.
+
+        Parameters
+        ----------
+        command: str, default = "reac"
+            Command running a ReaxFF optimization in the current directory.
+        num_workers: int, default = 1
+            Largest number of optimizations running at the same time.
+        timeout: float, optional
+            Wall-clock time limit of one optimization, in seconds. No limit by default.
+        max_retries: int, default = 1
+            Number of times a crashed optimization is restarted. Optimizations that time out are not restarted.
+        """
+        self.command = command
+        self.num_workers = max(1, num_workers)
+        self.timeout = timeout
+        self.max_retries = max(0, max_retries)
+
+    def run(self, child_dirs: List[str], on_start: Optional[Callable[[int, str], None]] = None,
+            on_complete: Optional[Callable[[int, str], bool]] = None,
+            case_numbers: Optional[List[int]] = None, num_required: Optional[int] = None,
+            deadline: Optional[float] = None,
+            on_timeout: Optional[Callable[[int, str], bool]] = None) -> Dict[int, Optional[str]]:
+        """Run the optimizations of all `child_dirs` (child i = case number `case_numbers[i]`, i by default) and wait
+        for them to finish.
+        `on_start(case_number, child_dir)` is called whenever an optimization (re)starts, and
+        `on_complete(case_number, child_dir)` as soon as one succeeds, e.g., to ingest its results; it returns False
+        if the results could not be used.
+
+        Parameters
+        ----------
+        num_required: int, optional
+            Number of succeeded children after which the run is closed. All children are waited for by default.
+        deadline: float, optional
+            Wall-clock time limit of the whole run, in seconds, after which it is closed. No limit by default.
+        on_timeout: Callable[[int, str], bool], optional
+            Called with (case_number, child_dir) when an optimization times out; if it returns True (e.g., the child
+            was rewritten with new parameters), the optimization is restarted, within the `max_retries` restarts.
+
+        Returns
+        -------
+        Dict[int, Optional[str]]
+            Reason why each child failed, by case number (None if its optimization succeeded).
+        """
+        if not child_dirs:
+            return {}
+        if case_numbers is None:
+            case_numbers = list(range(len(child_dirs)))
+        closure = _RunClosure(num_required, deadline) if num_required is not None or deadline is not None else None
+        with ThreadPoolExecutor(max_workers=min(self.num_workers, len(child_dirs))) as executor:
+            errors = list(executor.map(self.__run_child, case_numbers, child_dirs, repeat(on_start),
+                                       repeat(on_complete), repeat(on_timeout), repeat(closure)))
+        return dict(zip(case_numbers, errors))
+
+    def run_child(self, case_number: int, child_dir: str, on_start: Optional[Callable[[int, str], None]] = None,
+                  on_complete: Optional[Callable[[int, str], bool]] = None,
+                  on_timeout: Optional[Callable[[int, str], bool]] = None) -> Optional[str]:
+        """Run the optimization of one child, restarting it if it crashes; see `run`.
+        Returns the reason why the child failed, or None if it succeeded.
+        """
+        return self.__run_child(case_number, child_dir, on_start, on_complete, on_timeout)
+
+    def __run_child(self, case_number: int, child_dir: str, on_start: Optional[Callable[[int, str], None]] = None,
+                    on_complete: Optional[Callable[[int, str], bool]] = None,
+                    on_timeout: Optional[Callable[[int, str], bool]] = None,
+                    closure: Optional['_RunClosure'] = None) -> Optional[str]:
+        error = None
+        for _ in range(1 + self.max_retries):
+            if closure is not None and closure.is_closed():
+                return closure.late_error(child_dir)
+            if on_start is not None:
+                on_start(case_number, child_dir)
+            error, can_retry, timed_out = self.__run_once(child_dir, closure)
+            if error is None:
+                if on_complete is not None and not on_complete(case_number, child_dir):
+                    return "Results of '{}' could not be retrieved.".format(child_dir)
+                if closure is not None:
+                    closure.add_success()
+                return None
+            if timed_out and on_timeout is not None and on_timeout(case_number, child_dir):
+                continue
+            if not can_retry:
+                break
+        return error
+
+    def __run_once(self, child_dir: str, closure: Optional['_RunClosure'] = None) \
+            -> Tuple[Optional[str], bool, bool]:
+        """Run the optimization once; returns (reason of the failure or None, whether the failure is a crash,
+        whether the optimization timed out).
+        """
+        fort99_path = os.path.join(child_dir, COMPLETION_FILE_NAME)
+        try:
+            # Results of a previous (crashed) run must not be mistaken for results of this run
+            if os.path.exists(fort99_path):
+                os.remove(fort99_path)
+            with open(os.path.join(child_dir, self.OUTPUT_NAME), 'ab') as out_file, \
+                    open(os.path.join(child_dir, self.ERROR_NAME), 'ab') as err_file:
+                # New session -> the whole process group can be killed on timeout
+                process = subprocess.Popen(self.command, shell=True, cwd=child_dir, stdout=out_file,
+                                           stderr=err_file, start_new_session=True)
+                return_code = self.__wait(process, closure)
+                if return_code is None:
+                    _kill(process)
+                    if closure is not None and closure.is_closed():
+                        # Partial results of a killed optimization must not be read as results
+                        if os.path.exists(fort99_path):
+                            os.remove(fort99_path)
+                        return closure.late_error(child_dir), False, False
+                    return ("TimeoutExpired: ReaxFF optimization in '{}' exceeded {} seconds."
+                            .format(child_dir, self.timeout), False, True)
+        except OSError as error:
+            # e.g., child directory does not exist -> restarting does not help
+            return "{}: {}".format(error.__class__.__name__, error), False, False
+
+        if return_code:
+            return "ReaxFF optimization in '{}' exited with status {}.".format(child_dir, return_code), True, False
+        if not os.path.isfile(fort99_path):
+            return ("ReaxFF optimization in '{}' did not write {}.".format(child_dir, COMPLETION_FILE_NAME),
+                    True, False)
+        return None, False, False
+
+    def __wait(self, process: subprocess.Popen, closure: Optional['_RunClosure'] = None) -> Optional[int]:
+        """Return code of `process`, or None if it timed out or its run was closed (the process is left running)."""
+        if closure is None:
+            try:
+                return process.wait(timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                return None
+
+        end_time = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            wait_time = CLOSE_POLL_INTERVAL if end_time is None \
+                else min(CLOSE_POLL_INTERVAL, max(0.0, end_time - time.monotonic()))
+            try:
+                return process.wait(timeout=wait_time)
+            except subprocess.TimeoutExpired:
+                if closure.is_closed() or (end_time is not None and time.monotonic() >= end_time):
+                    return None
+
+
+class _RunClosure(object):
+    """Tracks whether a run is closed: once `num_required` children have succeeded, or once `deadline` seconds have
+    passed since the run started.
+    """
+
+    def __init__(self, num_required: Optional[int] = None, deadline: Optional[float] = None):
+        self.num_required = num_required
+        self.deadline = deadline
+        self.end_time = None if deadline is None else time.monotonic() + deadline
+        self.num_succeeded = 0
+        self.lock = threading.Lock()
+
+    def add_success(self):
+        with self.lock:
+            self.num_succeeded += 1
+
+    def is_closed(self) -> bool:
+        with self.lock:
+            if self.num_required is not None and self.num_succeeded >= self.num_required:
+                return True
+        return self.end_time is not None and time.monotonic() >= self.end_time
+
+    def late_error(self, child_dir: str) -> str:
+        with self.lock:
+            if self.num_required is not None and self.num_succeeded >= self.num_required:
+                reason = "{} children had completed".format(self.num_succeeded)
+            else:
+                reason = "its deadline of {} seconds passed".format(self.deadline)
+        return "{}: generation closed before the ReaxFF optimization in '{}' completed ({}).".format(
+            LATE_ERROR, child_dir, reason)
+
+
+def is_late(error: Optional[str]) -> bool:
+    """Whether `error` (as returned by `LocalReaxRunner.run`) is the error of a child whose run was closed before it
+    completed.
+    """
+    return error is not None and error.startswith(LATE_ERROR + ":")
+
+
+def _kill(process: subprocess.Popen):
+    """Kill `process` and every process of its session, and reap it."""
+    try:
+        if hasattr(os, 'killpg'):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:  # pragma: no cover
+            process.kill()
+    except OSError:
+        # Already exited
+        pass
+    process.wait()
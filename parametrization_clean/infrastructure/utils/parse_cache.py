@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+"""Module with an opt-in parse cache for ReaxFF files (ffield, fort.99). Parsed data is stored as a binary .npz sidecar
+next to each source file, e.g., `.ffield.<size>-<mtime_ns>.npz` for `ffield`. Since the sidecar name encodes the size
+and modification time of the source file, a lookup only needs a single stat of the source file; whenever the source
+file is rewritten, its key changes and the stale sidecar is simply never read again (and is removed on the next store).
+"""
+
+# Standard library
+from typing import Dict, Optional
+import glob
+import os
+import tempfile
+import zipfile
+
+# 3rd party packages
+import numpy as np
+
+# Local source
+
+SIDECAR_SUFFIX = ".npz"
+
+
+def sidecar_path(source_path: str) -> str:
+    """Path of the sidecar holding the parsed content of `source_path` in its current state (size, mtime).
+    Raises FileNotFoundError if `source_path` does not exist.
+    """
+    stat_result = os.stat(source_path)
+    directory, file_name = os.path.split(source_path)
+    return os.path.join(directory, ".{}.{}-{}{}".format(file_name, stat_result.st_size, stat_result.st_mtime_ns,
+                                                        SIDECAR_SUFFIX))
+
+
+def load(cache_path: str) -> Optional[Dict[str, np.ndarray]]:
+    """Arrays stored at `cache_path` (see `sidecar_path`), or None on a cache miss or an unreadable sidecar."""
+    try:
+        with np.load(cache_path, allow_pickle=False) as npz_file:
+            return {key: npz_file[key] for key in npz_file.files}
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+
+
+def store(cache_path: str, arrays: Dict[str, np.ndarray]):
+    """Atomically write `arrays` to `cache_path` and remove stale sidecars of the same source file.
+    The cache is best effort: failing to write it (e.g., read-only directory) is not an error.
+    """
+    directory, file_name = os.path.split(cache_path)
+    try:
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=file_name, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(file_descriptor, 'wb') as out_file:
+            np.savez(out_file, **arrays)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return
+
+    source_name = file_name[1:file_name.rindex('.', 0, -len(SIDECAR_SUFFIX))]
+    stale_pattern = glob.escape("." + source_name) + ".*-*" + SIDECAR_SUFFIX
+    for stale_path in glob.glob(os.path.join(glob.escape(directory), stale_pattern)):
+        if stale_path != cache_path:
+            try:
+                os.remove(stale_path)
+            except OSError:
+                pass
+
+
+def encode_sections(prefix: str, sections: Dict[int, object]) -> Dict[str, np.ndarray]:
+    """Convert a dict of sections (ffield or atom types) into flat arrays that can be stored without pickling.
+    Sections can be NumPy arrays, lists of (possibly ragged) rows, or lists of scalars.
+    """
+    arrays = {}
+    for section, values in sections.items():
+        key = "{}.{}".format(prefix, section)
+        if isinstance(values, np.ndarray):
+            arrays[key] = values
+        elif values and isinstance(values[0], (list, tuple)):
+            arrays[key + ".rows"] = np.array([value for row in values for value in row])
+            arrays[key + ".lengths"] = np.array([len(row) for row in values], dtype=np.int64)
+        else:
+            arrays[key + ".list"] = np.array(values)
+    return arrays
+
+
+def decode_sections(prefix: str, arrays: Dict[str, np.ndarray]) -> Dict[int, object]:
+    """Inverse of `encode_sections`."""
+    sections = {}
+    for key, array in arrays.items():
+        key_prefix, section, kind = (key.split(".") + [""])[0:3]
+        if key_prefix != prefix:
+            continue
+        if kind == "rows":
+            values = array.tolist()
+            rows = []
+            position = 0
+            for row_length in arrays["{}.{}.lengths".format(prefix, section)].tolist():
+                rows.append(values[position:position + row_length])
+                position += row_length
+            sections[int(section)] = rows
+        elif kind == "list":
+            sections[int(section)] = array.tolist()
+        elif not kind:
+            sections[int(section)] = array
+    return dict(sorted(sections.items()))
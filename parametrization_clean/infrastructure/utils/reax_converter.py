@@ -5,6 +5,7 @@
 # Standard library
 
 # 3rd party packages
+import numpy as np
 
 # Local source
 
@@ -12,13 +13,17 @@
 class Fort99Extractor:
 
     def __init__(self, fort99_data):
-        self.data = fort99_data
+        """Column access to fort.99 data: [ffield value | QM/Lit value | Weight].
+        An (M, 3) float64 array (see `ReaxReader.read_fort99_array`) is used as is, so every getter returns a view
+        on it without copying; lists of rows are converted once.
+        """
+        self.data = np.asarray(fort99_data, dtype=np.float64).reshape(-1, 3)
 
-    def get_reax_energies(self):
-        return [row[0] for row in self.data]
+    def get_reax_energies(self) -> np.ndarray:
+        return self.data[:, 0]
 
-    def get_dft_energies(self):
-        return [row[1] for row in self.data]
+    def get_dft_energies(self) -> np.ndarray:
+        return self.data[:, 1]
 
-    def get_weights(self):
-        return [row[2] for row in self.data]
+    def get_weights(self) -> np.ndarray:
+        return self.data[:, 2]
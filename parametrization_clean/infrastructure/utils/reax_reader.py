@@ -5,7 +5,7 @@ ffield, fort.99, params.
 """
 
 # Standard library
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
 import os
 import re
 import textwrap
@@ -14,19 +14,27 @@ import textwrap
 import numpy as np
 
 # Local source
+from parametrization_clean.infrastructure.utils import parse_cache
+
+# All numbers with %.4f formatting
+FORT99_NUMBER_PATTERN = re.compile(r"[-+]?\d*\.\d{4}")
 
 
 class ReaxReader(object):
 
-    def __init__(self, dir_path):
+    def __init__(self, dir_path, use_cache: bool = False):
         """
 
         Parameters
         ----------
         dir_path: str
             Directory path containing ffield, fort.99, params files.
+        use_cache: bool, default = False
+            If True, parsed ffield and fort.99 files are cached as .npz sidecars next to the source files
+            (see `parse_cache`); a file is only parsed again once it changes.
         """
         self.dir_path = dir_path
+        self.use_cache = use_cache
 
     def read_ffield(self) -> Tuple[Dict, Dict]:
         """Read ffield file into dictionary, mapping each section to corresponding rows.
@@ -41,71 +49,27 @@ class ReaxReader(object):
         atom_types: Dict[int, List]
             atom_types[section number] = [atom types for each section]
         """
-        ffield = {}
-        atom_types = {}
+        ffield_path = os.path.join(self.dir_path, 'ffield')
+        cache_path = self.__cache_lookup(ffield_path)
+        if cache_path:
+            arrays = parse_cache.load(cache_path)
+            if arrays is not None:
+                return parse_cache.decode_sections('ffield', arrays), parse_cache.decode_sections('atom_types', arrays)
 
         # --- Begin Reading FFIELD File ---
-        with open(os.path.join(self.dir_path, 'ffield'), 'r') as in_file:
-            # Reading 1st section - General Info
-            in_file.readline()
-            num_general = int(in_file.readline().split().pop(0))
-            ffield[1] = read_array(file=in_file, max_rows=num_general, columns=(0,))
-
-            # Reading 2nd section - Atom Info
-            ffield[2] = []
-            atom_types[2] = []
-            # Skipping lines
-            num_atoms = int(in_file.readline().split().pop(0))
-            for i in range(3):
-                in_file.readline()
-            for i in range(num_atoms):
-                temp = []
-                for j in range(4):
-                    temp = temp + in_file.readline().split()
-                atom_types[2].append(temp.pop(0))  # First value is atom type; ex: 'C', 'S', 'N', etc.
-                ffield[2].append([float(param) for param in temp])  # Conversion from str to float
-
-            # Reading 3rd section - Bond Info
-            ffield[3] = []
-            atom_types[3] = []
-            num_bonds = int(in_file.readline().split().pop(0))
-            in_file.readline()
-            for i in range(num_bonds):
-                temp = []
-                for j in range(2):
-                    temp = temp + in_file.readline().split()
-                atom_types[3].append([temp.pop(0), temp.pop(0)])  # First two values are atom types
-                ffield[3].append([float(param) for param in temp])
-
-            # Reading 4th section - Off Diagonal Terms
-            num_offdiag = int(in_file.readline().split().pop(0))
-            ffield[4] = read_array(file=in_file, max_rows=num_offdiag)
-            atom_types[4] = ffield[4][:, [0, 1]]  # First two columns are atom types
-            ffield[4] = ffield[4][:, 2:]
-
-            # Reading 5th section - Angular Terms
-            num_angles = int(in_file.readline().split().pop(0))
-            ffield[5] = read_array(file=in_file, max_rows=num_angles)
-            atom_types[5] = ffield[5][:, [0, 1, 2]]  # First three columns are atom types
-            ffield[5] = ffield[5][:, 3:]
-
-            # Reading 6th section - Torsion Terms
-            num_torsions = int(in_file.readline().split().pop(0))
-            ffield[6] = read_array(file=in_file, max_rows=num_torsions)
-            atom_types[6] = ffield[6][:, [0, 1, 2, 3]]  # First four columns are atom types
-            ffield[6] = ffield[6][:, 4:]
-
-            # Reading 7th section - Hydrogen Bonds
-            num_hbonds = int(in_file.readline().split().pop(0))
-            ffield[7] = read_array(file=in_file, max_rows=num_hbonds)
-            atom_types[7] = ffield[7][:, [0, 1, 2]]  # First three columns are atom types
-            ffield[7] = ffield[7][:, 3:]
-
+        # The file is read once; all sections are then tokenized from the in-memory lines
+        with open(ffield_path, 'r') as in_file:
+            lines = in_file.read().splitlines()
+        ffield, atom_types = parse_ffield(lines)
+
+        if cache_path:
+            parse_cache.store(cache_path, {**parse_cache.encode_sections('ffield', ffield),
+                                           **parse_cache.encode_sections('atom_types', atom_types)})
         return ffield, atom_types
 
     def read_fort99(self) -> List:
         """Read fort.99 output created from simulation. Store output in list; primarily useful for
-        error and total error.
+        error and total error. List version of `read_fort99_array`.
 
         ASSUMES fort99 file name is 'fort.99'.
 
@@ -114,22 +78,46 @@ class ReaxReader(object):
         results: List
             List with columns of [ffield value | QM/Lit value | Weight].
         """
-        results = []
+        return self.read_fort99_array().tolist()
 
-        with open(os.path.join(self.dir_path, 'fort.99'), 'r') as in_file:
-            in_file.readline()
-            for line in in_file:
-                if not line.strip():
-                    # Skip empty lines
-                    continue
-                else:
-                    # Extracting all floating points from the line (that are not right next to strings)
-                    # All numbers with %.4f formatting are extracted.
-                    numbers = re.findall(r"[-+]?\d*\.\d{4}", line)
+    def read_fort99_array(self) -> np.ndarray:
+        """Read fort.99 output created from simulation straight into an (M, 3) float64 array.
 
-                    # First three values are reaxFF value, true value, and weight
-                    results.append([float(string) for string in numbers[0:3]])
+        fort.99 rows end with five fixed-width (12 character) numeric columns:
+        [ffield value | QM/Lit value | Weight | Error | Total error]. The first three are sliced out of every line
+        and converted with a single NumPy call. Lines that do not follow the fixed-width layout fall back to
+        extracting all numbers with %.4f formatting.
 
+        ASSUMES fort99 file name is 'fort.99'.
+
+        Returns
+        -------
+        results: np.ndarray
+            (M, 3) array with columns of [ffield value | QM/Lit value | Weight].
+        """
+        fort99_path = os.path.join(self.dir_path, 'fort.99')
+        cache_path = self.__cache_lookup(fort99_path)
+        if cache_path:
+            arrays = parse_cache.load(cache_path)
+            if arrays is not None:
+                return arrays['fort99']
+
+        with open(fort99_path, 'r') as in_file:
+            in_file.readline()
+            # Skip empty lines
+            lines = [line for line in (line.rstrip() for line in in_file) if line]
+
+        try:
+            fields = [field for line in lines for field in (line[-60:-48], line[-48:-36], line[-36:-24])]
+            results = np.array(fields, dtype=np.float64)
+        except ValueError:
+            # Extracting all floating points from the line (that are not right next to strings)
+            # First three values are reaxFF value, true value, and weight
+            results = np.array([re.findall(FORT99_NUMBER_PATTERN, line)[0:3] for line in lines], dtype=np.float64)
+        results = results.reshape(len(lines), 3)
+
+        if cache_path:
+            parse_cache.store(cache_path, {'fort99': results})
         return results
 
     def read_params(self) -> Tuple[List, List, List]:
@@ -177,6 +165,91 @@ class ReaxReader(object):
 
         return param_keys, param_increments, param_bounds
 
+    def __cache_lookup(self, source_path: str) -> Optional[str]:
+        """Sidecar path for `source_path` if caching is enabled (stat of the source file taken BEFORE it is parsed,
+        so that a file changing while being parsed is never cached under its new state).
+        """
+        if not self.use_cache:
+            return None
+        return parse_cache.sidecar_path(source_path)
+
+
+def parse_ffield(lines: List[str]) -> Tuple[Dict, Dict]:
+    """Single-pass parser for the lines of an ffield file. Each section is tokenized once: multi-line atom and bond
+    entries are joined before splitting, and the fixed-width sections (general info, off diagonal, angle, torsion and
+    hydrogen bond terms) are converted to float arrays in one step each.
+
+    Parameters
+    ----------
+    lines: List[str]
+        Lines of the ffield file (without line endings).
+
+    Returns
+    -------
+    ffield: Dict[int, List]
+        ffield[section number] = [parameters corresponding to section]
+    atom_types: Dict[int, List]
+        atom_types[section number] = [atom types for each section]
+    """
+    ffield = {}
+    atom_types = {}
+
+    # Reading 1st section - General Info
+    # First line is a comment; only the first column of each general parameter line is a value
+    num_general = _read_section_size(lines[1])
+    position = 2
+    ffield[1] = np.array([line.split(None, 1)[0] for line in lines[position:position + num_general]],
+                         dtype=np.float64)
+    position += num_general
+
+    # Reading 2nd section - Atom Info
+    # Count line followed by 3 comment lines; each atom spans 4 lines
+    num_atoms = _read_section_size(lines[position])
+    position += 4
+    atom_rows = _join_rows(lines, position, num_atoms, lines_per_row=4)
+    position += 4 * num_atoms
+    atom_types[2] = [row[0] for row in atom_rows]  # First value is atom type; ex: 'C', 'S', 'N', etc.
+    ffield[2] = [[float(param) for param in row[1:]] for row in atom_rows]
+
+    # Reading 3rd section - Bond Info
+    # Count line followed by 1 comment line; each bond spans 2 lines
+    num_bonds = _read_section_size(lines[position])
+    position += 2
+    bond_rows = _join_rows(lines, position, num_bonds, lines_per_row=2)
+    position += 2 * num_bonds
+    atom_types[3] = [row[0:2] for row in bond_rows]  # First two values are atom types
+    ffield[3] = [[float(param) for param in row[2:]] for row in bond_rows]
+
+    # Reading 4th-7th sections - Off Diagonal, Angular, Torsion Terms and Hydrogen Bonds
+    # The first columns of each row are atom types; the rest are parameters
+    for section, num_atom_type_columns in ((4, 2), (5, 3), (6, 4), (7, 3)):
+        num_rows = _read_section_size(lines[position])
+        position += 1
+        table = _read_table(lines[position:position + num_rows])
+        position += num_rows
+        atom_types[section] = table[:, :num_atom_type_columns]
+        ffield[section] = table[:, num_atom_type_columns:]
+
+    return ffield, atom_types
+
+
+def _read_section_size(line: str) -> int:
+    return int(line.split(None, 1)[0])
+
+
+def _join_rows(lines: List[str], start: int, num_rows: int, lines_per_row: int) -> List[List[str]]:
+    """Tokens of `num_rows` entries that each span `lines_per_row` consecutive lines, starting at `start`."""
+    return [" ".join(lines[row_start:row_start + lines_per_row]).split()
+            for row_start in range(start, start + num_rows * lines_per_row, lines_per_row)]
+
+
+def _read_table(lines: List[str]) -> np.ndarray:
+    """Convert equally sized rows of numbers into a 2D float array with a single conversion."""
+    if not lines:
+        return np.empty((0, 0), dtype=np.float64)
+    tokens = " ".join(lines).split()
+    return np.array(tokens, dtype=np.float64).reshape(len(lines), -1)
+
 
 def write_ffield(parent_path: str, output_path: str, ffield: Dict[int, List], atom_types: Dict[int, List]):
     """Using the formatted ffield at `parent_path`, write the provided `ffield` to `output_path`.
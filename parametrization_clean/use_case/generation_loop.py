@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+
+"""Runs the whole generational genetic algorithm (optionally with the nested ANN) in a single loop: initialize the
+first population, then alternately evaluate a generation through an evaluator and propagate the evaluated population
+to the next generation. How individuals are evaluated (ReaxFF optimizations through files, an in-process analytic
+stand-in, ...) is left to the evaluator port.
+"""
+
+# Standard library
+from typing import Callable, Optional, Tuple
+
+# 3rd party packages
+
+# Local source
+from parametrization_clean.domain.individual import Individual
+from parametrization_clean.domain.population_matrix import PopulationMatrix, as_population_matrix
+from parametrization_clean.use_case.port.evaluator import IEvaluator
+from parametrization_clean.use_case.port.settings_repository import IAllSettings
+from parametrization_clean.use_case.port.population_repository import IPopulationRepository
+from parametrization_clean.use_case.population_initializer import PopulationInitializer
+from parametrization_clean.use_case.population_propagator import PopulationPropagator
+
+
+class GenerationLoop(object):
+
+    def __init__(self, settings_repository: IAllSettings, population_repository: IPopulationRepository,
+                 evaluator: IEvaluator):
+        self.settings_repository = settings_repository
+        self.population_repository = population_repository
+        self.evaluator = evaluator
+        self.use_neural_network = settings_repository.ga_settings.use_neural_network
+        self.num_populations_to_train_on = settings_repository.neural_net_settings.num_populations_to_train_on
+        # ANN of the last nested GA run, trained further by the next one
+        self.model = None
+
+    def initialize(self) -> PopulationMatrix:
+        """Individuals of the first generation."""
+        self.population_repository.set_generation_number(1)
+        population_initializer = PopulationInitializer(self.population_repository, self.settings_repository)
+        return as_population_matrix(population_initializer.execute())
+
+    def propagate(self, parents: PopulationMatrix, generation_number: int) -> Tuple[PopulationMatrix, Optional[object]]:
+        """Individuals of generation `generation_number`, propagated from the evaluated individuals of the previous
+        generation by either the standalone GA or the GA + nested ANN. Returns the individuals and the training
+        history of the ANN (None if the ANN was not used).
+        """
+        self.population_repository.set_generation_number(generation_number)
+        previous_generation_number = generation_number - 1
+        if self.use_neural_network and previous_generation_number >= self.num_populations_to_train_on:
+            from parametrization_clean.use_case.nested_ga_with_ann import GeneticNeuralNetPropagator
+            population_propagator = GeneticNeuralNetPropagator(self.settings_repository, self.population_repository,
+                                                               self.model)
+            next_population, self.model, history = population_propagator.execute(parents)
+            return as_population_matrix(next_population), history
+
+        population_propagator = PopulationPropagator(self.settings_repository, self.population_repository)
+        return as_population_matrix(population_propagator.execute(parents)), None
+
+    def reseed(self, parents: Optional[PopulationMatrix] = None) -> Individual:
+        """Fresh individual replacing a child whose evaluation timed out: the initialization strategy applied to a
+        parent picked by the selection strategy among the evaluated `parents`, or to the root individual for the
+        first generation (no parents).
+        """
+        root_individual = self.population_repository.get_root_individual()
+        if parents is None or not len(parents):
+            parent = Individual.from_root_individual(root_individual)
+        else:
+            population_propagator = PopulationPropagator(self.settings_repository, self.population_repository)
+            parent = population_propagator.select(as_population_matrix(parents).to_individuals())
+        strategy = self.settings_repository.strategy_settings.initialization_strategy
+        return strategy.mutation(parent, root_individual, **vars(self.settings_repository.mutation_settings))
+
+    def run(self, num_generations: int,
+            on_generation: Optional[Callable[[int, PopulationMatrix, Optional[object]], None]] = None) \
+            -> PopulationMatrix:
+        """Run generations 1 to `num_generations`. After each generation is evaluated,
+        `on_generation(generation_number, evaluated_population, history)` is called, where `history` is the training
+        history of the ANN that propagated the generation (None if the ANN was not used).
+
+        Returns
+        -------
+        PopulationMatrix
+            Evaluated individuals of the last generation.
+        """
+        evaluated_population = None
+        for generation_number in range(1, num_generations + 1):
+            if generation_number == 1:
+                population, history = self.initialize(), None
+            else:
+                population, history = self.propagate(evaluated_population, generation_number)
+            evaluated_population = self.evaluator.evaluate(population, generation_number)
+            if on_generation is not None:
+                on_generation(generation_number, evaluated_population, history)
+        return evaluated_population
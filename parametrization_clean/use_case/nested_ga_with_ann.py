@@ -5,12 +5,13 @@ without performing any ReaxFF optimizations. Requires TensorFlow 2.0.
 """
 
 # Standard library
-from typing import List
+from typing import List, Union
 
 # 3rd party packages
 
 # Local source
 from parametrization_clean.domain.individual import Individual
+from parametrization_clean.domain.population_matrix import PopulationMatrix, as_population_matrix
 from parametrization_clean.domain.neural_network.ann import FeedForwardNet
 from parametrization_clean.use_case.port.settings_repository import IAllSettings
 from parametrization_clean.use_case.port.population_repository import IPopulationRepository
@@ -19,27 +20,32 @@ from parametrization_clean.use_case.population_propagator import PopulationPropa
 
 class GeneticNeuralNetPropagator:
 
-    def __init__(self, settings_repository: IAllSettings, population_repository: IPopulationRepository):
+    def __init__(self, settings_repository: IAllSettings, population_repository: IPopulationRepository, model=None):
+        """Nested GA propagator; `model` is an optional, previously trained ANN (e.g., the model of the previous
+        generation when generations run in the same process), which is trained further instead of a new model.
+        """
         self.neural_net_settings = settings_repository.neural_net_settings
         self.population_repository = population_repository
 
-        training_population = population_repository.get_previous_n_populations(
-            self.neural_net_settings.num_populations_to_train_on)
+        training_population = population_repository.get_history(self.neural_net_settings.num_populations_to_train_on)
         self.neural_net = FeedForwardNet(training_population,
                                          self.neural_net_settings.verbosity,
                                          self.neural_net_settings.train_fraction,
                                          self.neural_net_settings.num_epochs)
 
+        self.model = model
+
         self.population_propagator = PopulationPropagator(settings_repository, population_repository)
         self.root_individual = self.population_repository.get_root_individual()
         self.error_strategy = settings_repository.strategy_settings.error_strategy
         self.population_size = settings_repository.ga_settings.population_size
 
     def train_neural_net(self):
-        model, history = self.neural_net.execute()
+        model, history = self.neural_net.execute(self.model)
+        self.model = model
         return model, history
 
-    def execute(self, parents: List[Individual]):
+    def execute(self, parents: Union[List[Individual], PopulationMatrix]):
         model, history = self.train_neural_net()
         if self.final_ann_accuracy_is_poor(history):
             final_generation = self.run_without_ann(parents, model)
@@ -63,27 +69,35 @@ class GeneticNeuralNetPropagator:
             accuracy_is_poor = True
         return accuracy_is_poor
 
-    def propagate_first(self, parents: List[Individual], model):
+    def propagate_first(self, parents: Union[List[Individual], PopulationMatrix], model) -> PopulationMatrix:
         """First propagation/iteration in nested genetic algorithm. Preserve best two parents from master GA."""
-        next_generation = self.population_propagator.execute(parents)
-        # Update costs for all except top 2 individuals
-        y_predicted = self.neural_net.predict_outputs(model, next_generation[2:])
-        self.update_costs(next_generation[2:], y_predicted)
-
-        best_master_parents = next_generation[0:2]
+        next_generation = self.propagate_and_predict(as_population_matrix(parents), model)
+        best_master_parents = next_generation.take(slice(0, 2))
         return next_generation, best_master_parents
 
-    def propagate_remaining(self, population: List[Individual], model) -> List[Individual]:
+    def propagate_remaining(self, population: Union[List[Individual], PopulationMatrix], model) \
+            -> PopulationMatrix:
         """Run remaining nested genetic algorithm iterations. Preserve best two parents from master GA."""
-        next_generation = population
+        next_generation = as_population_matrix(population)
         for i in range(self.neural_net_settings.num_nested_ga_iterations):
-            next_generation = self.population_propagator.execute(next_generation)
-            y_predicted = self.neural_net.predict_outputs(model, next_generation[2:])
-            self.update_costs(next_generation[2:], y_predicted)
+            next_generation = self.propagate_and_predict(next_generation, model)
+        return next_generation
+
+    def propagate_and_predict(self, population: PopulationMatrix, model) -> PopulationMatrix:
+        """Propagate `population` one step, then predict energies and costs for all except the top 2 individuals."""
+        next_generation = self.population_propagator.execute(population)
+        # Children are evaluated in place, without splitting and stacking the population again
+        children_rows = slice(2, None)
+        y_predicted = self.neural_net.predict_outputs(model, next_generation.take(children_rows))
+        self.update_costs(next_generation, y_predicted, rows=children_rows)
         return next_generation
 
-    def update_costs(self, population: List[Individual], y_predicted):
+    def update_costs(self, population: Union[List[Individual], PopulationMatrix], y_predicted, rows: slice = None):
+        """Store the predicted energies and costs of `population` (of its `rows` only, if given for a matrix)."""
         costs = self.neural_net.compute_costs(y_predicted, self.root_individual, self.error_strategy)
+        if isinstance(population, PopulationMatrix):
+            population.set_evaluations(y_predicted, costs, rows=rows)
+            return
         for individual, y_pred_row, cost in zip(population, y_predicted, costs):
             individual.reax_energies = y_pred_row
             individual.cost = cost
@@ -26,11 +26,13 @@ class PopulationInitializer(object):
         self.population_repository = population_repository
         self.strategy = settings_repository.strategy_settings.initialization_strategy
         self.population_size = settings_repository.ga_settings.population_size
+        # Extra (over-provisioned) children are initialized like the others
+        self.num_children = self.population_size + settings_repository.ga_settings.num_extra_children
         self.mutation_settings_dict = vars(settings_repository.mutation_settings)
 
     def execute(self) -> List[Individual]:
         root_individual = self.population_repository.get_root_individual()
         individual = Individual.from_root_individual(root_individual)
         population = [self.strategy.mutation(individual, root_individual, **self.mutation_settings_dict)
-                      for _ in range(self.population_size)]
+                      for _ in range(self.num_children)]
         return population
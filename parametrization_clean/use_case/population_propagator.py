@@ -6,14 +6,16 @@ from the previous generation) to generate better offspring/children (individuals
 """
 
 # Standard library
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
 import random
 import statistics
 
 # 3rd party packages
+import numpy as np
 
 # Local source
 from parametrization_clean.domain.individual import Individual
+from parametrization_clean.domain.population_matrix import PopulationMatrix
 from parametrization_clean.use_case.port.settings_repository import IAllSettings
 from parametrization_clean.use_case.port.population_repository import IPopulationRepository
 
@@ -22,6 +24,8 @@ class PopulationPropagator:
 
     def __init__(self, settings_repository: IAllSettings, population_repository: IPopulationRepository):
         self.ga_settings = settings_repository.ga_settings
+        # Children per generation, including the extra (over-provisioned) ones
+        self.num_children = self.ga_settings.population_size + self.ga_settings.num_extra_children
 
         self.crossover_rate = self.ga_settings.crossover_rate
         self.mutation_rates = [self.ga_settings.mutation_rate, self.ga_settings.mutation_rate]
@@ -39,12 +43,18 @@ class PopulationPropagator:
 
         self.root_individual = population_repository.get_root_individual()
 
-    def execute(self, parents: List[Individual]) -> List[Individual]:
-        """Create next generation using parents."""
+    def execute(self, parents: Union[List[Individual], PopulationMatrix]) \
+            -> Union[List[Individual], PopulationMatrix]:
+        """Create next generation using parents. If the parents are given as a PopulationMatrix, the children
+        are also returned as a PopulationMatrix (see `execute_rows`).
+        """
+        if isinstance(parents, PopulationMatrix):
+            return self.execute_rows(parents)
+
         average_cost, minimum_cost = self.compute_statistics(parents)
 
         children = self.initialize(parents)
-        while len(children) < self.ga_settings.population_size:
+        while len(children) < self.num_children:
             parent1 = self.select(parents)
             parent2 = self.select(parents)
 
@@ -55,7 +65,32 @@ class PopulationPropagator:
 
             children.extend([child1, child2])
 
-        return children
+        # Children are bred in pairs
+        return children[:self.num_children]
+
+    def execute_rows(self, parents: PopulationMatrix) -> PopulationMatrix:
+        """Create next generation from the rows of the `parents` matrix. Selection, crossover and mutation act on row
+        indices and parameter rows, so no Individual objects are created. Children that are copies of a parent (elites,
+        or children that skipped both crossover and mutation) keep the parent's ReaxFF energies and cost.
+        """
+        average_cost, minimum_cost = float(np.mean(parents.costs)), float(np.min(parents.costs))
+
+        # Children as (parameters, row of the parent they are a copy of, or None)
+        children = [(parents.params[row], row) for row in self.initialize_rows(parents)]
+        while len(children) < self.num_children:
+            row1 = self.select_row(parents)
+            row2 = self.select_row(parents)
+
+            self.adapt_cross_and_mutate_rates(average_cost, minimum_cost,
+                                              (float(parents.costs[row1]), float(parents.costs[row2])))
+
+            child1, child2 = self.cross_rows((parents.params[row1], row1), (parents.params[row2], row2))
+            child1, child2 = self.mutate_rows(child1, child2)
+
+            children.extend([child1, child2])
+
+        # Children are bred in pairs
+        return self.__children_matrix(parents, children[:self.num_children])
 
     def initialize(self, parents: List[Individual]) -> List[Individual]:
         children = []
@@ -63,9 +98,17 @@ class PopulationPropagator:
             children.extend(sorted(parents)[0:2])
         return children
 
+    def initialize_rows(self, parents: PopulationMatrix) -> List[int]:
+        if self.ga_settings.use_elitism:
+            return parents.sorted_indices()[0:2].tolist()
+        return []
+
     def select(self, parents: List[Individual]) -> Individual:
         return self.selection_strategy.selection(parents, **self.selection_settings_dict)
 
+    def select_row(self, parents: PopulationMatrix) -> int:
+        return self.selection_strategy.selection_index(parents.costs, **self.selection_settings_dict)
+
     def cross(self, parent1: Individual, parent2: Individual) -> Tuple[Individual, Individual]:
         child1, child2 = parent1, parent2
         if random.random() < self.crossover_rate:
@@ -73,6 +116,26 @@ class PopulationPropagator:
                                                                **self.crossover_settings_dict)
         return child1, child2
 
+    def cross_rows(self, parent1: Tuple[np.ndarray, Optional[int]], parent2: Tuple[np.ndarray, Optional[int]]) \
+            -> Tuple[Tuple[np.ndarray, Optional[int]], Tuple[np.ndarray, Optional[int]]]:
+        """`cross` on (parameters, parent row) pairs; crossed children are no longer copies of a parent."""
+        child1, child2 = parent1, parent2
+        if random.random() < self.crossover_rate:
+            child1_params, child2_params = self.crossover_strategy.crossover_params(parent1[0], parent2[0],
+                                                                                    **self.crossover_settings_dict)
+            child1, child2 = (child1_params, None), (child2_params, None)
+        return child1, child2
+
+    def mutate_rows(self, parent1: Tuple[np.ndarray, Optional[int]], parent2: Tuple[np.ndarray, Optional[int]]) \
+            -> Tuple[Tuple[np.ndarray, Optional[int]], Tuple[np.ndarray, Optional[int]]]:
+        """`mutate` on (parameters, parent row) pairs; mutated children are no longer copies of a parent."""
+        child1, child2 = parent1, parent2
+        if random.random() < self.mutation_rates[0]:
+            child1 = (self.mutation_strategy.mutation_params(parent1[0], **self.mutation_settings_dict), None)
+        if random.random() < self.mutation_rates[1]:
+            child2 = (self.mutation_strategy.mutation_params(parent2[0], **self.mutation_settings_dict), None)
+        return child1, child2
+
     def mutate(self, parent1: Individual, parent2: Individual) -> Tuple[Individual, Individual]:
         child1, child2 = parent1, parent2
         if random.random() < self.mutation_rates[0]:
@@ -91,3 +154,22 @@ class PopulationPropagator:
     def compute_statistics(population: List[Individual]) -> Tuple[float, float]:
         costs = [individual.cost for individual in population]
         return statistics.mean(costs), min(costs)
+
+    @staticmethod
+    def __children_matrix(parents: PopulationMatrix, children: List[Tuple[np.ndarray, Optional[int]]]) \
+            -> PopulationMatrix:
+        """Stack the children into a PopulationMatrix; copies of a parent take its ReaxFF energies and cost."""
+        params = np.array([child_params for child_params, _ in children], dtype=np.float64)
+        params = params.reshape(len(children), parents.num_params)
+        copied = [(child_row, parent_row) for child_row, (_, parent_row) in enumerate(children)
+                  if parent_row is not None]
+        child_rows = [child_row for child_row, _ in copied]
+        parent_rows = [parent_row for _, parent_row in copied]
+
+        costs = np.full(len(children), np.nan)
+        costs[child_rows] = parents.costs[parent_rows]
+        reax_energies = None
+        if parents.reax_energies is not None:
+            reax_energies = np.full((len(children), parents.reax_energies.shape[1]), np.nan)
+            reax_energies[child_rows] = parents.reax_energies[parent_rows]
+        return PopulationMatrix(params, reax_energies, costs)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+
+"""Module that contains interface for evaluators, used to obtain the ReaxFF energies (and costs) of a population,
+e.g., by running ReaxFF optimizations or through an in-process stand-in model.
+"""
+
+# Standard library
+import abc
+from typing import List, Optional, Union
+
+# 3rd party packages
+
+# Local source
+from parametrization_clean.domain.individual import Individual
+from parametrization_clean.domain.population_matrix import PopulationMatrix
+
+
+class IEvaluator(metaclass=abc.ABCMeta):
+
+    @abc.abstractmethod
+    def evaluate(self, population: Union[List[Individual], PopulationMatrix], generation_number: int) \
+            -> PopulationMatrix:
+        """Evaluate the individuals of generation `generation_number`. Returns the successfully evaluated
+        individuals with their ReaxFF energies and costs; case numbers are the indices of the individuals in
+        `population`.
+        """
+        raise NotImplementedError
+
+    def evaluate_individual(self, individual: Individual, case_number: int) -> Optional[Individual]:
+        """Evaluate a single individual, e.g., as soon as an evaluation slot frees up in the steady-state GA.
+        `case_number` identifies the evaluation (unique within a run). Returns the individual with its ReaxFF energies
+        and cost, or None if it could not be evaluated. May be called from several threads at the same time.
+        """
+        raise NotImplementedError("{} does not evaluate individuals one at a time.".format(self.__class__.__name__))
@@ -5,7 +5,7 @@
 
 # Standard library
 import abc
-from typing import List
+from typing import Iterator, List, Tuple, Union
 
 # 3rd party packages
 
@@ -13,6 +13,7 @@ from typing import List
 # Local source
 from parametrization_clean.domain.root_individual import RootIndividual
 from parametrization_clean.domain.individual import Individual
+from parametrization_clean.domain.population_matrix import PopulationMatrix
 
 
 class IPopulationRepository(metaclass=abc.ABCMeta):
@@ -27,6 +28,26 @@ class IPopulationRepository(metaclass=abc.ABCMeta):
         """Get population of Individuals based on the (unique) generation number."""
         raise NotImplementedError
 
+    def get_population_matrix(self, generation_number: int) -> PopulationMatrix:
+        """Get population based on the (unique) generation number as a PopulationMatrix, with case numbers of
+        successfully retrieved individuals. Repositories can override this to avoid building Individual objects.
+        """
+        population, successfully_retrieved_case_numbers = self.get_population(generation_number)
+        return PopulationMatrix.from_individuals(population, successfully_retrieved_case_numbers)
+
+    def iter_population_range(self, lower_bound: int, upper_bound: int) -> Iterator[Tuple[int, PopulationMatrix]]:
+        """Stream the generations between [lower_bound, upper_bound) (lower bound inclusive, upper bound exclusive),
+        one generation at a time, as (generation number, PopulationMatrix) pairs. The PopulationMatrix holds the
+        parameters, ReaxFF energies, costs and case numbers of the successfully retrieved individuals, so consumers
+        only need memory for one generation at a time.
+        """
+        for generation_number in range(lower_bound, upper_bound):
+            yield generation_number, self.get_population_matrix(generation_number)
+
+    def set_generation_number(self, generation_number: int):
+        """Set the current generation number, relative to which previous populations are read."""
+        self.current_generation_number = generation_number
+
     @abc.abstractmethod
     def get_previous_n_populations(self, num_populations: int) -> List[Individual]:
         """Read previous N populations relative to the current generation.
@@ -34,12 +55,19 @@ class IPopulationRepository(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    def get_history(self, num_populations: int) -> PopulationMatrix:
+        """Evaluated individuals of the previous N populations relative to the current generation, as a single
+        PopulationMatrix (e.g., training data for the ANN). Repositories can override this to serve the history
+        without building Individual objects.
+        """
+        return PopulationMatrix.from_individuals(self.get_previous_n_populations(num_populations))
+
     @abc.abstractmethod
     def write_individual(self, individual: Individual, **kwargs):
         """Write an individual in the population to the repository."""
         raise NotImplementedError
 
     @abc.abstractmethod
-    def write_population(self, population: List[Individual], generation_number):
+    def write_population(self, population: Union[List[Individual], PopulationMatrix], generation_number):
         """Write a population of individuals to the repository."""
         raise NotImplementedError
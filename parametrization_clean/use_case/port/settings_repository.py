@@ -6,7 +6,7 @@ All settings are subdivided into different categories based on groupings/relevan
 
 # Standard library
 import abc
-from typing import List
+from typing import List, Optional
 
 # 3rd party packages
 
@@ -40,6 +40,7 @@ class IGeneticAlgorithmSettings:
         self.use_elitism: bool = NotImplemented
         self.use_adaptation: bool = NotImplemented
         self.use_neural_network: bool = NotImplemented
+        self.num_extra_children: int = NotImplemented
 
 
 class IMutationSettings(abc.ABC):
@@ -100,6 +101,30 @@ class INeuralNetSettings(abc.ABC):
         self.minimum_validation_r_squared: float = NotImplemented
 
 
+class IRepositorySettings(abc.ABC):
+
+    @abc.abstractmethod
+    def __init__(self):
+        self.use_parse_cache: bool = NotImplemented
+        self.num_read_workers: int = NotImplemented
+        self.num_write_workers: int = NotImplemented
+        self.file_materialization: str = NotImplemented
+        self.history_dtype: str = NotImplemented
+        self.use_evaluation_cache: bool = NotImplemented
+
+
+class IRunnerSettings(abc.ABC):
+
+    @abc.abstractmethod
+    def __init__(self):
+        self.reax_command: str = NotImplemented
+        self.num_run_workers: int = NotImplemented
+        self.run_timeout: float = NotImplemented
+        self.max_retries: int = NotImplemented
+        self.generation_deadline: Optional[float] = NotImplemented
+        self.reseed_stragglers: bool = NotImplemented
+
+
 class IAllSettings(abc.ABC):
 
     @abc.abstractmethod
@@ -110,3 +135,5 @@ class IAllSettings(abc.ABC):
         self.crossover_settings: ICrossoverSettings = NotImplemented
         self.selection_settings: ISelectionSettings = NotImplemented
         self.neural_net_settings: INeuralNetSettings = NotImplemented
+        self.repository_settings: IRepositorySettings = NotImplemented
+        self.runner_settings: IRunnerSettings = NotImplemented
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+"""Runs the steady-state (asynchronous) genetic algorithm: up to `num_workers` individuals are evaluated at the same
+time, and whenever an evaluation finishes, its slot is immediately refilled with new children bred from the current
+pool of evaluated individuals (see `steady_state_propagator`). Unlike the generational loop, no evaluation ever waits
+for the slowest individual of a generation, so all slots stay busy regardless of the spread of evaluation times.
+
+The nested ANN is only available with the generational loop.
+"""
+
+# Standard library
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, List, Optional
+
+# 3rd party packages
+
+# Local source
+from parametrization_clean.domain.individual import Individual
+from parametrization_clean.use_case.port.evaluator import IEvaluator
+from parametrization_clean.use_case.port.settings_repository import IAllSettings
+from parametrization_clean.use_case.port.population_repository import IPopulationRepository
+from parametrization_clean.use_case.population_initializer import PopulationInitializer
+from parametrization_clean.use_case.steady_state_propagator import SteadyStatePropagator
+
+
+class SteadyStateLoop(object):
+
+    def __init__(self, settings_repository: IAllSettings, population_repository: IPopulationRepository,
+                 evaluator: IEvaluator, num_workers: int = 1, pool: Optional[List[Individual]] = None):
+        self.settings_repository = settings_repository
+        self.population_repository = population_repository
+        self.evaluator = evaluator
+        self.num_workers = max(1, num_workers)
+        self.population_repository.set_generation_number(1)
+        self.propagator = SteadyStatePropagator(settings_repository, population_repository, pool)
+
+    def run(self, num_evaluations: int, population: Optional[List[Individual]] = None,
+            on_evaluation: Optional[Callable[[int, Optional[Individual]], None]] = None) -> List[Individual]:
+        """Run `num_evaluations` evaluations: first the individuals of `population` (by default, a newly initialized
+        first population, unless the pool was seeded with evaluated individuals), then children bred from the pool.
+        After each evaluation, `on_evaluation(case_number, evaluated_individual)` is called (with None if the
+        individual could not be evaluated). Evaluation case numbers are 0, 1, ..., in order of submission.
+
+        Returns
+        -------
+        List[Individual]
+            Pool of the best evaluated individuals.
+        """
+        if population is None:
+            population = [] if self.propagator.pool else \
+                PopulationInitializer(self.population_repository, self.settings_repository).execute()
+        queue = deque(population)
+        in_flight = {}
+
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            num_submitted = self.__fill_slots(executor, queue, in_flight, 0, num_evaluations)
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    case_number = in_flight.pop(future)
+                    evaluated_individual = future.result()
+                    if evaluated_individual is not None:
+                        self.propagator.insert(evaluated_individual)
+                    if on_evaluation is not None:
+                        on_evaluation(case_number, evaluated_individual)
+                num_submitted = self.__fill_slots(executor, queue, in_flight, num_submitted, num_evaluations)
+        return self.propagator.pool
+
+    def __fill_slots(self, executor: ThreadPoolExecutor, queue: deque, in_flight: dict, num_submitted: int,
+                     num_evaluations: int) -> int:
+        """Submit individuals (queued ones first, then newly bred children) until every slot is busy; returns the
+        number of evaluations submitted so far.
+        """
+        while len(in_flight) < self.num_workers and num_submitted < num_evaluations:
+            if not queue:
+                if not self.propagator.can_breed():
+                    # Wait for more evaluated individuals
+                    break
+                num_free_slots = min(self.num_workers - len(in_flight), num_evaluations - num_submitted)
+                queue.extend(self.propagator.create_children(num_free_slots))
+            future = executor.submit(self.evaluator.evaluate_individual, queue.popleft(), num_submitted)
+            in_flight[future] = num_submitted
+            num_submitted += 1
+        return num_submitted
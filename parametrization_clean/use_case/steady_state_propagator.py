@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+"""Combines domain logic to propagate a steady-state genetic algorithm. Instead of replacing a whole generation at once,
+a pool of the best evaluated individuals (of size `population_size`) is kept, and new children are bred from the pool
+one or two at a time, whenever they are needed. Evaluated children enter the pool by replacing its worst individual
+if they are better (so the best individuals are always kept, as with elitism).
+
+The same selection, crossover, mutation and adaptation operators as in the generational GA are used.
+"""
+
+# Standard library
+from typing import List, Optional
+import math
+
+# 3rd party packages
+
+# Local source
+from parametrization_clean.domain.individual import Individual
+from parametrization_clean.use_case.port.settings_repository import IAllSettings
+from parametrization_clean.use_case.port.population_repository import IPopulationRepository
+from parametrization_clean.use_case.population_propagator import PopulationPropagator
+
+
+class SteadyStatePropagator(PopulationPropagator):
+
+    def __init__(self, settings_repository: IAllSettings, population_repository: IPopulationRepository,
+                 pool: Optional[List[Individual]] = None):
+        super().__init__(settings_repository, population_repository)
+        self.pool_size = self.ga_settings.population_size
+        # Smallest pool parents can be selected from (e.g., a tournament needs `tournament_size` individuals)
+        self.min_pool_size = max(2, self.selection_settings_dict.get('tournament_size', 2))
+        self.pool = []  # type: List[Individual]
+        for individual in pool or []:
+            self.insert(individual)
+
+    def can_breed(self) -> bool:
+        return len(self.pool) >= self.min_pool_size
+
+    def insert(self, individual: Individual) -> bool:
+        """Add an evaluated individual to the pool. Once the pool is full, the individual replaces the worst individual
+        of the pool if it is better. Returns whether the individual was added.
+        """
+        if individual.cost is None or not math.isfinite(individual.cost):
+            return False
+        if len(self.pool) < self.pool_size:
+            self.pool.append(individual)
+            return True
+        worst_index = max(range(len(self.pool)), key=lambda index: self.pool[index].cost)
+        if individual.cost >= self.pool[worst_index].cost:
+            return False
+        self.pool[worst_index] = individual
+        return True
+
+    def create_children(self, num_children: int = 2) -> List[Individual]:
+        """Breed one or two new children from parents selected from the pool."""
+        average_cost, minimum_cost = self.compute_statistics(self.pool)
+        parent1 = self.select(self.pool)
+        parent2 = self.select(self.pool)
+
+        self.adapt_cross_and_mutate_rates(average_cost, minimum_cost, (parent1.cost, parent2.cost))
+
+        child1, child2 = self.cross(parent1, parent2)
+        child1, child2 = self.mutate(child1, child2)
+        return [child1, child2][:max(1, min(num_children, 2))]
@@ -11,6 +11,7 @@ with open("README.md", 'r') as readme_file:
 
 requirements = [
     # Note that TensorFlow isn't put here - install TensorFlow if you wish to use Neural Network!
+    # Optionally, install inotify_simple to receive file events (instead of polling) in `cli watch`.
     'numpy',
     'pandas',
     'Click'
@@ -2,9 +2,11 @@
 # Standard library
 
 # 3rd party packages
+import numpy as np
 import pytest
 
 # Local source
+from parametrization_clean.domain.cost.strategy import IErrorStrategy
 from parametrization_clean.domain.cost.reax_error import ReaxError
 
 
@@ -18,3 +20,37 @@ def test_reax_error(reax_energies, dft_energies, weights):
     assert reax_energies[0][0] == reax_energy
     assert dft_energies[0] == dft_energy
     assert weights[0] == weight
+
+
+class ScalarReaxError(IErrorStrategy):
+    """Same error as ReaxError, but without a vectorized `error_batch` (uses the IErrorStrategy fallback)."""
+
+    @staticmethod
+    def error(reax_val, dft_val, weight, **kwargs) -> float:
+        return ReaxError.error(reax_val, dft_val, weight)
+
+
+@pytest.mark.usefixtures('reax_energies', 'dft_energies', 'weights')
+def test_reax_error_batch(reax_energies, dft_energies, weights):
+    total_errors = ReaxError.error_batch(np.array(reax_energies), dft_energies, weights)
+    assert total_errors.shape == (len(reax_energies),)
+    for total_error, reax_row in zip(total_errors, reax_energies):
+        expected = sum(ReaxError.error(reax_val, dft_val, weight)
+                       for reax_val, dft_val, weight in zip(reax_row, dft_energies, weights))
+        assert total_error == pytest.approx(expected)
+    assert ReaxError.error_batch(reax_energies[0], dft_energies, weights) == pytest.approx(total_errors[0])
+
+
+@pytest.mark.usefixtures('reax_energies', 'dft_energies', 'weights')
+def test_error_batch_fallback(reax_energies, dft_energies, weights):
+    total_errors = ScalarReaxError.error_batch(reax_energies, dft_energies, weights)
+    assert total_errors == pytest.approx(ReaxError.error_batch(reax_energies, dft_energies, weights))
+    assert ScalarReaxError.error_batch(reax_energies[1], dft_energies, weights).shape == ()
+
+
+@pytest.mark.usefixtures('reax_energies', 'dft_energies', 'weights')
+def test_reax_error_batch_inverse_squared_weights(reax_energies, dft_energies, weights):
+    inverse_squared_weights = 1.0 / np.square(weights)
+    assert ReaxError.error_batch(reax_energies, dft_energies, weights,
+                                 inverse_squared_weights=inverse_squared_weights) \
+        == pytest.approx(ReaxError.error_batch(reax_energies, dft_energies, weights))
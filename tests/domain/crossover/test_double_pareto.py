@@ -1,12 +1,15 @@
 
 # Standard library
+import random
 from unittest.mock import patch
 
 # 3rd party packages
+import numpy as np
 import pytest
 
 # Local source
 from parametrization_clean.domain.crossover.double_pareto import DoubleParetoCross
+from parametrization_clean.domain.crossover.strategy import ICrossoverStrategy
 from parametrization_clean.domain.root_individual import RootIndividual
 
 
@@ -58,3 +61,45 @@ def test_double_pareto_2(uniform_mock, get_root_individual, get_individuals, dou
                                                  dpx_alpha=alpha, dpx_beta=beta)
     assert child1.params == child1_true_params
     assert child2.params == child2_true_params
+
+
+@patch('random.uniform')
+@pytest.mark.usefixtures('get_individuals')
+def test_double_pareto_params(uniform_mock, get_individuals, double_pareto_params):
+    alpha, beta = double_pareto_params
+    u = [0.75, 0.25, 0.75, 0.25, 0.75]
+    uniform_mock.side_effect = u
+    parent1_params, parent2_params = get_individuals[0].params, get_individuals[1].params
+    child1_params, child2_params = DoubleParetoCross.crossover_params(np.array(parent1_params),
+                                                                      np.array(parent2_params),
+                                                                      dpx_alpha=alpha, dpx_beta=beta)
+    modified_betas = {0.75: alpha * beta * (1 - (2 * 0.75) ** (-1 / alpha)),
+                      0.25: alpha * beta * ((1 - (2 * 0.25)) ** (-1 / alpha) - 1)}
+    for i, u_i in enumerate(u):
+        child1_true_params, child2_true_params = get_true_children_params(parent1_params, parent2_params,
+                                                                          modified_betas[u_i])
+        assert child1_params[i] == pytest.approx(child1_true_params[i])
+        assert child2_params[i] == pytest.approx(child2_true_params[i])
+
+
+@pytest.mark.usefixtures('get_individuals')
+def test_double_pareto_params_seeded(get_root_individual, get_individuals):
+    parent1, parent2 = get_individuals[0], get_individuals[1]
+    random.seed(7)
+    child1, child2 = DoubleParetoCross.crossover(parent1, parent2, root_individual=get_root_individual)
+    random.seed(7)
+    child1_params, child2_params = DoubleParetoCross.crossover_params(np.array(parent1.params),
+                                                                      np.array(parent2.params))
+    assert child1_params.tolist() == pytest.approx(child1.params)
+    assert child2_params.tolist() == pytest.approx(child2.params)
+
+
+def test_default_crossover_params():
+    class SwapCross(ICrossoverStrategy):
+        @staticmethod
+        def crossover(parent1, parent2, root_individual, **kwargs):
+            return parent2, parent1
+
+    child1_params, child2_params = SwapCross.crossover_params(np.array([1.0, 2.0]), np.array([3.0, 4.0]))
+    assert child1_params.tolist() == [3.0, 4.0]
+    assert child2_params.tolist() == [1.0, 2.0]
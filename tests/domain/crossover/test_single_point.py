@@ -3,6 +3,7 @@
 from unittest.mock import patch
 
 # 3rd party packages
+import numpy as np
 import pytest
 
 # Local source
@@ -20,3 +21,12 @@ def test_single_point(randrange_mock, get_root_individual, get_individuals):
     assert child1.params == [1.0, 0.1, -0.76, 8.6, 2.1]
     assert child2.params == [0.5, 0.05, -0.5, 4.3, 2.4]
 
+
+@patch('random.randrange')
+@pytest.mark.usefixtures('get_individuals')
+def test_single_point_params(randrange_mock, get_individuals):
+    randrange_mock.return_value = 2
+    child1_params, child2_params = SinglePointCross.crossover_params(np.array(get_individuals[0].params),
+                                                                     np.array(get_individuals[1].params))
+    assert child1_params.tolist() == [1.0, 0.1, -0.76, 8.6, 2.1]
+    assert child2_params.tolist() == [0.5, 0.05, -0.5, 4.3, 2.4]
@@ -3,6 +3,7 @@
 from unittest.mock import patch
 
 # 3rd party packages
+import numpy as np
 import pytest
 
 # Local source
@@ -19,3 +20,15 @@ def test_two_point(sample_mock, get_root_individual, get_individuals):
     child1, child2 = TwoPointCross.crossover(parent1, parent2, root_individual=get_root_individual)
     assert child1.params == [1.0, 0.1, -0.76, 8.6, 2.4]
     assert child2.params == [0.5, 0.05, -0.5, 4.3, 2.1]
+
+
+@patch('random.sample')
+@pytest.mark.usefixtures('get_individuals')
+def test_two_point_params(sample_mock, get_individuals):
+    sample_mock.return_value = [4, 2]
+    parent1_params, parent2_params = np.array(get_individuals[0].params), np.array(get_individuals[1].params)
+    child1_params, child2_params = TwoPointCross.crossover_params(parent1_params, parent2_params)
+    assert child1_params.tolist() == [1.0, 0.1, -0.76, 8.6, 2.4]
+    assert child2_params.tolist() == [0.5, 0.05, -0.5, 4.3, 2.1]
+    # Parents are left untouched
+    assert parent1_params.tolist() == get_individuals[0].params
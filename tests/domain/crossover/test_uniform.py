@@ -20,3 +20,13 @@ def test_uniform(randint_mock, get_root_individual, get_individuals):
     child1, child2 = UniformCross.crossover(parent1, parent2, root_individual=get_root_individual)
     assert child1.params == [1.0, 0.05, -0.5, 8.6, 2.1]
     assert child2.params == [0.5, 0.1, -0.76, 4.3, 2.4]
+
+
+@patch('numpy.random.randint')
+@pytest.mark.usefixtures('get_individuals')
+def test_uniform_params(randint_mock, get_individuals):
+    randint_mock.return_value = np.array([1, 0, 1, 0, 0])
+    child1_params, child2_params = UniformCross.crossover_params(np.array(get_individuals[0].params),
+                                                                 np.array(get_individuals[1].params))
+    assert child1_params.tolist() == [1.0, 0.05, -0.5, 8.6, 2.1]
+    assert child2_params.tolist() == [0.5, 0.1, -0.76, 4.3, 2.4]
@@ -1,7 +1,9 @@
 
 # Standard library
+import random
 
 # 3rd party packages
+import numpy as np
 import pytest
 
 # Local source
@@ -18,3 +20,20 @@ def test_central_uniform(get_root_individual, get_individuals, param_bounds):
         low = param_bounds[0] + delta
         high = param_bounds[1] - delta
         assert low <= param <= high
+
+
+@pytest.mark.usefixtures('get_individuals', 'param_bounds')
+def test_central_uniform_params(get_individuals, param_bounds):
+    child_params = CentralUniformMutate.mutation_params(np.array(get_individuals[0].params), param_bounds=param_bounds)
+    for param, param_bounds in zip(child_params, param_bounds):
+        delta = (param_bounds[1] - param_bounds[0]) / 4
+        assert param_bounds[0] + delta <= param <= param_bounds[1] - delta
+
+
+@pytest.mark.usefixtures('get_individuals', 'param_bounds')
+def test_central_uniform_params_seeded(get_root_individual, get_individuals, param_bounds):
+    random.seed(7)
+    child = CentralUniformMutate.mutation(get_individuals[0], get_root_individual, param_bounds=param_bounds)
+    random.seed(7)
+    child_params = CentralUniformMutate.mutation_params(np.array(get_individuals[0].params), param_bounds=param_bounds)
+    assert child_params.tolist() == pytest.approx(child.params)
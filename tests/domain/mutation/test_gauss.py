@@ -1,8 +1,10 @@
 
 # Standard library
+import random
 from unittest.mock import patch
 
 # 3rd party packages
+import numpy as np
 import pytest
 
 # Local source
@@ -58,3 +60,35 @@ def test_multi_gauss_std_1(uniform_mock, gauss_mock, get_root_individual, get_in
     GaussianMutate.mutation(parent, root_individual=get_root_individual,
                             gauss_std=[0.01, 0.1, 1.0], gauss_frac=[0.25, 0.5, 0.25])
     gauss_mock.assert_called_with(0, 1.0)
+
+
+@patch('random.gauss')
+@patch('random.uniform')
+@pytest.mark.usefixtures('get_individuals')
+def test_multi_gauss_params(uniform_mock, gauss_mock, get_individuals):
+    uniform_mock.return_value = 0.50
+    gauss_mock.return_value = 0.5
+    parent_params = np.array(get_individuals[0].params)
+    child_params = GaussianMutate.mutation_params(parent_params, gauss_std=[0.01, 0.1, 1.0],
+                                                  gauss_frac=[0.25, 0.5, 0.25])
+    gauss_mock.assert_called_with(0, 0.1)
+    assert child_params.tolist() == (1.5 * parent_params).tolist()
+
+
+@patch('random.uniform')
+@pytest.mark.usefixtures('get_individuals')
+def test_gauss_params_outside_probabilities(uniform_mock, get_individuals):
+    # u above the cumulative probability of all scaling factors -> no mutation
+    uniform_mock.return_value = 0.9
+    parent_params = np.array(get_individuals[0].params)
+    child_params = GaussianMutate.mutation_params(parent_params, gauss_std=[0.01, 0.1], gauss_frac=[0.25, 0.5])
+    assert child_params.tolist() == parent_params.tolist()
+    assert child_params is not parent_params
+
+
+@pytest.mark.usefixtures('get_individuals')
+def test_gauss_params_seeded(get_root_individual, get_individuals):
+    random.seed(7)
+    child = GaussianMutate.mutation(get_individuals[0], get_root_individual)
+    random.seed(7)
+    assert GaussianMutate.mutation_params(np.array(get_individuals[0].params)).tolist() == pytest.approx(child.params)
@@ -1,7 +1,9 @@
 
 # Standard library
+import random
 
 # 3rd party packages
+import numpy as np
 import pytest
 
 # Local source
@@ -18,3 +20,20 @@ def test_single_point(get_root_individual, get_individuals):
         low = min(0.9 * param, 1.1 * param)
         high = max(0.9 * param, 1.1 * param)
         assert low <= param <= high
+
+
+@pytest.mark.usefixtures('get_individuals')
+def test_nakata_params(get_individuals):
+    parent_params = np.array(get_individuals[0].params)
+    child_params = NakataMutate.mutation_params(parent_params, nakata_scale=0.1, nakata_rand_lower=-1.0,
+                                                nakata_rand_higher=1.0)
+    for parent_param, param in zip(parent_params, child_params):
+        assert min(0.9 * parent_param, 1.1 * parent_param) <= param <= max(0.9 * parent_param, 1.1 * parent_param)
+
+
+@pytest.mark.usefixtures('get_individuals')
+def test_nakata_params_seeded(get_root_individual, get_individuals):
+    random.seed(7)
+    child = NakataMutate.mutation(get_individuals[0], get_root_individual)
+    random.seed(7)
+    assert NakataMutate.mutation_params(np.array(get_individuals[0].params)).tolist() == pytest.approx(child.params)
@@ -1,11 +1,15 @@
 
 # Standard library
+import random
 
 # 3rd party packages
+import numpy as np
 import pytest
 
 # Local source
+from parametrization_clean.domain.individual import Individual
 from parametrization_clean.domain.mutation.polynomial import PolynomialMutate
+from parametrization_clean.domain.mutation.strategy import IMutationStrategy
 from tests.domain.crossover.test_double_pareto import get_root_individual
 
 
@@ -15,3 +19,28 @@ def test_polynomial(get_root_individual, get_individuals):
     child = PolynomialMutate.mutation(parent, get_root_individual, polynomial_eta=60)
     assert parent.params != child.params
     assert parent.params == get_individuals[0].params
+
+
+@pytest.mark.usefixtures('get_individuals')
+def test_polynomial_params(get_individuals):
+    parent_params = np.array(get_individuals[0].params)
+    child_params = PolynomialMutate.mutation_params(parent_params, polynomial_eta=60)
+    assert child_params.tolist() != parent_params.tolist()
+    assert parent_params.tolist() == get_individuals[0].params
+
+
+def test_default_mutation_params():
+    class NegateMutate(IMutationStrategy):
+        @staticmethod
+        def mutation(parent, root_individual, **kwargs):
+            return Individual([-param for param in parent.params])
+
+    assert NegateMutate.mutation_params(np.array([1.0, -2.0])).tolist() == [-1.0, 2.0]
+
+
+@pytest.mark.usefixtures('get_individuals')
+def test_polynomial_params_seeded(get_root_individual, get_individuals):
+    random.seed(7)
+    child = PolynomialMutate.mutation(get_individuals[0], get_root_individual)
+    random.seed(7)
+    assert PolynomialMutate.mutation_params(np.array(get_individuals[0].params)).tolist() == pytest.approx(child.params)
@@ -8,7 +8,8 @@ import pandas as pd
 # Local source
 from parametrization_clean.domain.neural_network.extract_data import (individuals_to_features_df,
                                                                       individuals_to_features_and_outputs_df)
-from parametrization_clean.domain.neural_network.transform_data import (train_test_split, normalize_features,
+from parametrization_clean.domain.neural_network.transform_data import (train_test_split, train_test_split_indices,
+                                                                        normalize_features,
                                                                         denormalize_features,
                                                                         get_columns_to_remove,
                                                                         remove_problematic_columns)
@@ -40,6 +41,14 @@ def test_train_test_split(x_y_df):
     assert test_df.shape[1] == 9
 
 
+def test_train_test_split_indices():
+    train_rows, test_rows = train_test_split_indices(10, 0.75)
+    assert len(train_rows) == 8
+    assert len(test_rows) == 2
+    assert sorted(train_rows.tolist() + test_rows.tolist()) == list(range(10))
+    assert train_rows.tolist() == sorted(train_rows.tolist())
+
+
 def test_normalize_features(x_df, x_train_stats):
     normalized_x_df = normalize_features(x_df, x_train_stats)
     normalized_x_nd_array = normalized_x_df.to_numpy()
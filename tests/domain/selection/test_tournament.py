@@ -3,9 +3,11 @@
 from unittest.mock import patch
 
 # 3rd party packages
+import numpy as np
 import pytest
 
 # Local source
+from parametrization_clean.domain.selection.strategy import ISelectionStrategy
 from parametrization_clean.domain.selection.tournament import TournamentSelect
 
 
@@ -20,3 +22,21 @@ def test_tournament(sample_mock, get_individuals):
     assert TournamentSelect.selection(get_individuals) == get_individuals[0]
     sample_mock.return_value = get_individuals
     assert TournamentSelect.selection(get_individuals, tournament_size=4) == get_individuals[1]
+
+
+@patch('random.sample')
+def test_tournament_selection_index(sample_mock):
+    costs = np.array([5142, 4387, 5789, 4698], dtype=np.float64)
+    sample_mock.return_value = [0, 2]
+    assert TournamentSelect.selection_index(costs) == 0
+    sample_mock.return_value = [0, 1, 2, 3]
+    assert TournamentSelect.selection_index(costs, tournament_size=4) == 1
+
+
+def test_default_selection_index():
+    class BestSelect(ISelectionStrategy):
+        @staticmethod
+        def selection(population, **kwargs):
+            return min(population)
+
+    assert BestSelect.selection_index(np.array([3.0, 1.0, 2.0])) == 1
@@ -1,5 +1,6 @@
 
 # Standard library
+from unittest import mock
 
 # 3rd party packages
 import pytest
@@ -8,6 +9,7 @@ import pytest
 from parametrization_clean.domain.individual import Individual
 from parametrization_clean.domain.root_individual import RootIndividual
 from parametrization_clean.domain.cost.reax_error import ReaxError
+from parametrization_clean.domain.utils.param_index import ParamIndex
 
 
 @pytest.fixture()
@@ -106,3 +108,14 @@ def test_individual_gt(get_individuals):
     get_individuals[0].cost = 5142
     get_individuals[1].cost = 4387
     assert get_individuals[0] > get_individuals[1]
+
+
+def test_individual_ffield_is_lazy(root_individual):
+    with mock.patch.object(ParamIndex, 'unflatten') as unflatten_mock:
+        individual = Individual(params=[0.5, 0.4, 1.0, -4.7, 8.6], root_individual=root_individual)
+        unflatten_mock.assert_not_called()
+
+    individual.params = [0.1, 0.2, 0.3, 0.4, 0.5]
+    assert individual.ffield[2][0][0] == 0.1
+    assert individual.ffield[3][2][1] == 0.5
+    assert Individual(params=[0.5, 0.4, 1.0, -4.7, 8.6]).ffield is None
@@ -0,0 +1,129 @@
+# Standard library
+
+# 3rd party packages
+import numpy as np
+import pytest
+
+# Local source
+from parametrization_clean.domain.individual import Individual
+from parametrization_clean.domain.population_matrix import PopulationMatrix, as_population_matrix
+from parametrization_clean.domain.root_individual import RootIndividual
+
+
+@pytest.fixture()
+@pytest.mark.usefixtures('dft_energies', 'weights', 'root_ffield', 'param_keys')
+def root_individual(dft_energies, weights, root_ffield, param_keys):
+    return RootIndividual(dft_energies, weights, root_ffield, param_keys)
+
+
+@pytest.fixture()
+@pytest.mark.usefixtures('get_individuals')
+def population_matrix(get_individuals):
+    return PopulationMatrix.from_individuals(get_individuals, case_numbers=[0, 2, 3, 5])
+
+
+def test_population_matrix_init():
+    population = PopulationMatrix([[1, 2, 3], [4, 5, 6]])
+    assert population.params.dtype == np.float64
+    assert population.params.shape == (2, 3)
+    assert population.num_params == 3
+    assert population.reax_energies is None
+    assert np.isnan(population.costs).all()
+    assert list(population.case_numbers) == [0, 1]
+    assert len(population) == 2
+
+
+def test_population_matrix_init_keeps_float_arrays():
+    params = np.zeros((3, 2), dtype=np.float32)
+    population = PopulationMatrix(params)
+    assert population.params is params
+
+
+@pytest.mark.usefixtures('get_individuals', 'reax_energies')
+def test_population_matrix_from_individuals(population_matrix, get_individuals, reax_energies):
+    assert population_matrix.params.shape == (4, 5)
+    assert list(population_matrix.params[2]) == get_individuals[2].params
+    assert population_matrix.reax_energies.tolist() == reax_energies
+    assert list(population_matrix.case_numbers) == [0, 2, 3, 5]
+    assert np.isnan(population_matrix.costs).all()
+
+
+def test_population_matrix_from_individuals_partially_evaluated():
+    population = PopulationMatrix.from_individuals([Individual([1.0, 2.0], reax_energies=[3.0, 4.0, 5.0]),
+                                                    Individual([6.0, 7.0])])
+    assert population.reax_energies.shape == (2, 3)
+    assert np.isnan(population.reax_energies[1]).all()
+
+
+def test_population_matrix_from_empty_population():
+    population = PopulationMatrix.from_individuals([])
+    assert len(population) == 0
+    assert population.reax_energies is None
+
+
+def test_population_matrix_compute_costs(population_matrix, root_individual):
+    costs = population_matrix.compute_costs(root_individual)
+    assert costs is population_matrix.costs
+    for individual_costs, reax_row in zip(costs, population_matrix.reax_energies):
+        expected = Individual(params=[], reax_energies=list(reax_row)).total_error(root_individual)
+        assert individual_costs == pytest.approx(expected)
+
+
+def test_population_matrix_sorted_indices(population_matrix, root_individual):
+    population_matrix.compute_costs(root_individual)
+    sorted_indices = population_matrix.sorted_indices()
+    assert list(population_matrix.costs[sorted_indices]) == sorted(population_matrix.costs)
+    assert population_matrix.best_index() == sorted_indices[0]
+
+
+def test_population_matrix_take(population_matrix):
+    head = population_matrix.take(slice(0, 2))
+    assert len(head) == 2
+    assert list(head.case_numbers) == [0, 2]
+    head.costs[:] = 1.0
+    assert list(population_matrix.costs[0:2]) == [1.0, 1.0]
+
+    subset = population_matrix.take([3, 1])
+    assert list(subset.case_numbers) == [5, 2]
+    assert subset.params[0].tolist() == population_matrix.params[3].tolist()
+
+
+def test_population_matrix_set_evaluations(population_matrix):
+    population_matrix.set_evaluations(np.zeros((2, 4)), [1.0, 2.0], rows=slice(2, None))
+    assert population_matrix.reax_energies[2:].tolist() == np.zeros((2, 4)).tolist()
+    assert population_matrix.costs[2:].tolist() == [1.0, 2.0]
+    assert not (population_matrix.reax_energies[:2] == 0).all()
+
+    unevaluated = PopulationMatrix(np.ones((3, 5)))
+    unevaluated.set_evaluations(np.zeros((1, 4)), [3.0], rows=[1])
+    assert unevaluated.reax_energies.shape == (3, 4)
+    assert np.isnan(unevaluated.reax_energies[[0, 2]]).all()
+    assert np.isnan(unevaluated.costs[[0, 2]]).all()
+    assert unevaluated.costs[1] == 3.0
+
+
+def test_population_matrix_concatenate(population_matrix):
+    unevaluated = PopulationMatrix(np.ones((2, 5)))
+    population = PopulationMatrix.concatenate([population_matrix, unevaluated])
+    assert len(population) == 6
+    assert population.reax_energies.shape == (6, 4)
+    assert np.isnan(population.reax_energies[4:]).all()
+    assert list(population.case_numbers) == [0, 2, 3, 5, 0, 1]
+
+
+def test_population_matrix_to_individuals(population_matrix, root_individual):
+    population_matrix.compute_costs(root_individual)
+    population = population_matrix.to_individuals()
+    assert len(population) == 4
+    for row, individual in enumerate(population):
+        assert isinstance(individual.params, list)
+        assert individual.params == population_matrix.params[row].tolist()
+        assert individual.reax_energies == population_matrix.reax_energies[row].tolist()
+        assert isinstance(individual.cost, float)
+        assert individual.cost == population_matrix.costs[row]
+
+
+@pytest.mark.usefixtures('get_individuals')
+def test_as_population_matrix(population_matrix, get_individuals):
+    assert as_population_matrix(population_matrix) is population_matrix
+    assert isinstance(as_population_matrix(get_individuals), PopulationMatrix)
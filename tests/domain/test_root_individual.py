@@ -2,6 +2,7 @@
 # Standard library
 
 # 3rd party packages
+import numpy as np
 import pytest
 
 # Local source
@@ -18,3 +19,15 @@ def test_root_individual_init(dft_energies, weights, root_ffield, param_keys):
     assert root_individual.param_keys == param_keys
     assert root_individual.extract_params() == true_params
     assert root_individual.root_params == true_params
+
+
+@pytest.mark.usefixtures('dft_energies', 'weights', 'root_ffield', 'param_keys')
+def test_root_individual_arrays_are_read_only(dft_energies, weights, root_ffield, param_keys):
+    root_individual = RootIndividual(dft_energies, weights, root_ffield, param_keys)
+    for array in (root_individual.dft_energies, root_individual.weights, root_individual.inverse_squared_weights):
+        assert array.dtype == np.float64
+        assert array.flags['C_CONTIGUOUS']
+        with pytest.raises(ValueError):
+            array[0] = 0.0
+    assert root_individual.inverse_squared_weights.tolist() == pytest.approx([1 / weight ** 2 for weight in weights])
+    assert root_individual.error_kwargs['inverse_squared_weights'] is root_individual.inverse_squared_weights
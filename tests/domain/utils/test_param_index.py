@@ -0,0 +1,76 @@
+# Standard library
+
+# 3rd party packages
+import numpy as np
+import pytest
+
+# Local source
+from parametrization_clean.domain.utils.helpers import get_param
+from parametrization_clean.domain.utils.param_index import ParamIndex
+
+
+@pytest.fixture()
+@pytest.mark.usefixtures('root_ffield', 'param_keys')
+def param_index(root_ffield, param_keys):
+    return ParamIndex(param_keys, root_ffield)
+
+
+@pytest.fixture()
+def array_ffield():
+    return {1: np.array([10.0, 20.0, 30.0]),
+            2: [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]],
+            4: np.array([[7.0, 8.0], [9.0, 10.0], [11.0, 12.0]]),
+            }
+
+
+def test_param_index_init(param_index, root_ffield):
+    assert param_index.size == 5 + 8 + 9
+    # Section 2 starts after the 5 scalars of section 1; section 3 after the 4 rows of 2 in section 2
+    assert list(param_index.offsets) == [5, 11, 13, 15, 20]
+
+
+@pytest.mark.usefixtures('root_ffield', 'param_keys')
+def test_param_index_flatten_and_extract(param_index, root_ffield, param_keys):
+    buffer = param_index.flatten(root_ffield)
+    assert buffer.dtype == np.float64
+    assert buffer.tolist() == [1, 2, 3, 4, 5, 1, 2, 3, 4, 5, 6, 7, 8, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+    assert param_index.extract(buffer).tolist() == [get_param(key, root_ffield) for key in param_keys]
+
+
+def test_param_index_extract_stacked_buffers(param_index, root_ffield):
+    buffers = np.stack([param_index.flatten(root_ffield), 2 * param_index.flatten(root_ffield)])
+    params = param_index.extract(buffers)
+    assert params.shape == (2, 5)
+    assert params[1].tolist() == [2 * param for param in params[0]]
+
+
+@pytest.mark.usefixtures('root_ffield', 'param_keys')
+def test_param_index_inject_and_unflatten(param_index, root_ffield, param_keys):
+    buffer = param_index.flatten(root_ffield)
+    new_params = [0.5, 0.4, 1.0, -4.7, 8.6]
+    new_buffer = param_index.inject(new_params, buffer)
+    assert new_buffer is not buffer
+    assert param_index.extract(buffer).tolist() == [1, 7, 1, 3, 8]
+
+    ffield = param_index.unflatten(new_buffer)
+    assert [get_param(key, ffield) for key in param_keys] == new_params
+    assert ffield[1] == root_ffield[1]
+    assert ffield[2][1] == root_ffield[2][1]
+    assert isinstance(ffield[3][0], list)
+
+
+def test_param_index_array_sections(array_ffield):
+    param_index = ParamIndex([[1, 2, 1], [4, 3, 2]], array_ffield)
+    buffer = param_index.flatten(array_ffield)
+    assert param_index.extract(buffer).tolist() == [20.0, 12.0]
+
+    ffield = param_index.unflatten(param_index.inject([-1.0, -2.0], buffer))
+    assert ffield[1].shape == (3,)
+    assert ffield[4].shape == (3, 2)
+    assert ffield[4][2][1] == -2.0
+    assert ffield[2] == array_ffield[2]
+
+
+def test_param_index_key_out_of_layout(root_ffield):
+    with pytest.raises(IndexError):
+        ParamIndex([[2, 1, 3]], root_ffield)
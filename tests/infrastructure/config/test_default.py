@@ -1,5 +1,6 @@
 
 # Standard library
+import os
 
 # 3rd party packages
 
@@ -28,6 +29,7 @@ def test_all_settings_init():
     assert default_settings.ga_settings.crossover_rate == 0.8
     assert default_settings.ga_settings.use_elitism
     assert not default_settings.ga_settings.use_adaptation
+    assert default_settings.ga_settings.num_extra_children == 0
 
     assert default_settings.mutation_settings.gauss_std == [0.01, 0.1]
     assert default_settings.mutation_settings.gauss_frac == [0.5, 0.5]
@@ -56,3 +58,17 @@ def test_all_settings_init():
     assert default_settings.neural_net_settings.num_epochs == 10000
     assert default_settings.neural_net_settings.num_populations_to_train_on == 1
     assert default_settings.neural_net_settings.num_nested_ga_iterations == 1
+
+    assert not default_settings.repository_settings.use_parse_cache
+    assert default_settings.repository_settings.num_read_workers == 1
+    assert default_settings.repository_settings.num_write_workers == 8
+    assert default_settings.repository_settings.file_materialization == "copy"
+    assert default_settings.repository_settings.history_dtype == "float64"
+    assert not default_settings.repository_settings.use_evaluation_cache
+
+    assert default_settings.runner_settings.reax_command == "reac"
+    assert default_settings.runner_settings.num_run_workers == (os.cpu_count() or 1)
+    assert default_settings.runner_settings.run_timeout == 1800
+    assert default_settings.runner_settings.max_retries == 1
+    assert default_settings.runner_settings.generation_deadline is None
+    assert not default_settings.runner_settings.reseed_stragglers
@@ -46,6 +46,7 @@ def test_user_settings_init_with_nonexistent_file():
     assert user_settings.ga_settings.crossover_rate == 0.8
     assert user_settings.ga_settings.use_elitism
     assert not user_settings.ga_settings.use_adaptation
+    assert user_settings.ga_settings.num_extra_children == 0
 
     assert user_settings.mutation_settings.gauss_std == [0.01, 0.1]
     assert user_settings.mutation_settings.gauss_frac == [0.5, 0.5]
@@ -75,6 +76,20 @@ def test_user_settings_init_with_nonexistent_file():
     assert user_settings.neural_net_settings.num_populations_to_train_on == 1
     assert user_settings.neural_net_settings.num_nested_ga_iterations == 1
 
+    assert not user_settings.repository_settings.use_parse_cache
+    assert user_settings.repository_settings.num_read_workers == 1
+    assert user_settings.repository_settings.num_write_workers == 8
+    assert user_settings.repository_settings.file_materialization == "copy"
+    assert user_settings.repository_settings.history_dtype == "float64"
+    assert not user_settings.repository_settings.use_evaluation_cache
+
+    assert user_settings.runner_settings.reax_command == "reac"
+    assert user_settings.runner_settings.num_run_workers == (os.cpu_count() or 1)
+    assert user_settings.runner_settings.run_timeout == 1800
+    assert user_settings.runner_settings.max_retries == 1
+    assert user_settings.runner_settings.generation_deadline is None
+    assert not user_settings.runner_settings.reseed_stragglers
+
 
 def test_user_settings_init_with_some_parameters_specified():
     config_file_path = os.path.join(PROJECT_ROOT, "tests", "integration",
@@ -121,3 +136,10 @@ def test_user_settings_init_with_some_parameters_specified():
     assert user_settings.neural_net_settings.num_epochs == 10000
     assert user_settings.neural_net_settings.num_populations_to_train_on == 10
     assert user_settings.neural_net_settings.num_nested_ga_iterations == 100
+
+    assert not user_settings.repository_settings.use_parse_cache
+
+    assert user_settings.runner_settings.reax_command == "reac"
+    assert user_settings.runner_settings.max_retries == 3
+    assert user_settings.runner_settings.generation_deadline == 3600
+    assert not user_settings.runner_settings.reseed_stragglers
@@ -0,0 +1,69 @@
+# Standard library
+
+# 3rd party packages
+import numpy as np
+import pytest
+
+# Local source
+from parametrization_clean.domain.individual import Individual
+from parametrization_clean.domain.population_matrix import PopulationMatrix
+from parametrization_clean.infrastructure.evaluator.analytic import AnalyticEvaluator
+from parametrization_clean.infrastructure.repository.in_memory import InMemoryPopulationRepository
+from tests.fixtures.domain import root_ffield, param_keys
+
+ROOT_PARAMS = [1.0, 0.2, -0.5, 6.0, 2.0]
+
+
+def test_analytic_evaluator_model():
+    evaluator = AnalyticEvaluator(ROOT_PARAMS, num_energies=7, seed=3)
+    assert evaluator.dft_energies.shape == (7,)
+    assert evaluator.weights.shape == (7,)
+
+    # Optimum parameters reproduce the reference energies -> zero cost
+    evaluated_population = evaluator.evaluate(PopulationMatrix(evaluator.optimum_params[np.newaxis]), 1)
+    assert evaluated_population.reax_energies.shape == (1, 7)
+    assert evaluated_population.costs[0] == pytest.approx(0.0)
+
+    # Same seed -> same model; linear model without quadratic terms
+    assert AnalyticEvaluator(ROOT_PARAMS, 7, seed=3).dft_energies.tolist() == evaluator.dft_energies.tolist()
+    linear_evaluator = AnalyticEvaluator(ROOT_PARAMS, 7, model="linear", seed=3)
+    assert linear_evaluator.quadratic_coefficients is None
+    deviations = np.array([[0.1, 0.0, 0.0, 0.0, 0.0]]) * linear_evaluator.scale
+    energies = linear_evaluator.energies(linear_evaluator.root_params + np.vstack([deviations, 2 * deviations]))
+    assert (energies[1] - linear_evaluator.offsets).tolist() == \
+        pytest.approx((2 * (energies[0] - linear_evaluator.offsets)).tolist())
+
+    with pytest.raises(ValueError):
+        AnalyticEvaluator(ROOT_PARAMS, 7, model="cubic")
+
+
+def test_analytic_evaluator_evaluate(root_ffield, param_keys):
+    evaluator = AnalyticEvaluator(ROOT_PARAMS, num_energies=4, noise=0.1)
+    root_individual = evaluator.root_individual(root_ffield, param_keys)
+    assert root_individual.dft_energies.tolist() == evaluator.dft_energies.tolist()
+
+    population_repository = InMemoryPopulationRepository(root_individual)
+    evaluator.population_repository = population_repository
+    params = np.array(ROOT_PARAMS) * np.random.default_rng(0).uniform(0.9, 1.1, (6, 5))
+    evaluated_population = evaluator.evaluate(PopulationMatrix(params), generation_number=2)
+
+    assert evaluated_population.case_numbers.tolist() == list(range(6))
+    assert not np.isnan(evaluated_population.costs).any()
+    # Noise is added to the model's energies
+    assert not np.allclose(evaluated_population.reax_energies, evaluator.energies(params))
+    assert np.allclose(evaluated_population.reax_energies, evaluator.energies(params), atol=1.0)
+    # Evaluated generation is written to the repository
+    assert population_repository.get_population_matrix(2) is evaluated_population
+
+
+def test_analytic_evaluator_evaluate_individual(root_ffield, param_keys):
+    evaluator = AnalyticEvaluator(ROOT_PARAMS, num_energies=4)
+    root_individual = evaluator.root_individual(root_ffield, param_keys)
+    individual = Individual(list(evaluator.optimum_params), root_individual=root_individual)
+
+    evaluated_individual = evaluator.evaluate_individual(individual, case_number=0)
+    assert evaluated_individual is not individual
+    assert evaluated_individual.params == individual.params
+    assert evaluated_individual.reax_energies == pytest.approx(evaluator.dft_energies.tolist())
+    assert evaluated_individual.cost == pytest.approx(0.0)
+    assert evaluated_individual.root_individual is root_individual
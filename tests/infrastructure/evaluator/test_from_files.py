@@ -0,0 +1,148 @@
+# Standard library
+import os
+from unittest import mock
+
+# 3rd party packages
+import numpy as np
+import pytest
+
+# Local source
+from parametrization_clean.domain.individual import Individual
+from parametrization_clean.domain.population_matrix import PopulationMatrix
+from parametrization_clean.domain.cost.reax_error import ReaxError
+from parametrization_clean.infrastructure.evaluator.from_files import FileReaxEvaluator
+from parametrization_clean.infrastructure.exception.exception import EvaluationError
+from parametrization_clean.infrastructure.repository.from_files import PopulationFileRepository
+from parametrization_clean.infrastructure.repository.evaluation_cache import EvaluationCache
+from parametrization_clean.infrastructure.repository.generation_manifest import GenerationManifest
+from parametrization_clean.infrastructure.utils.local_runner import LocalReaxRunner
+from parametrization_clean.infrastructure.utils.reax_reader import ReaxReader
+from parametrization_clean.infrastructure.utils.reax_converter import Fort99Extractor
+from parametrization_clean.infrastructure.utils.response_object import ResponseFailure
+from tests.use_case.test_population_propagator import all_settings
+
+
+@pytest.fixture()
+@pytest.mark.usefixtures("training_set_dir_path", "reax_output_dir_path")
+def file_evaluator(all_settings, training_set_dir_path, reax_output_dir_path, tmp_path):
+    population_repository = PopulationFileRepository(training_set_dir_path, str(tmp_path / "population"),
+                                                     all_settings, current_generation_number=1)
+    # Stand-in for ReaxFF: "optimizes" a child by copying the results of an evaluated child
+    fort99_path = os.path.join(str(reax_output_dir_path), "generation-1", "child-0", "fort.99")
+    return FileReaxEvaluator(population_repository, LocalReaxRunner('cp "{}" fort.99'.format(fort99_path),
+                                                                    num_workers=2))
+
+
+def test_file_evaluator_evaluate(file_evaluator):
+    population_repository = file_evaluator.population_repository
+    root_params = np.array(population_repository.get_root_individual().root_params)
+    population = PopulationMatrix(root_params * np.random.default_rng(0).uniform(0.95, 1.05, (4, len(root_params))))
+
+    evaluated_population = file_evaluator.evaluate(population, generation_number=1)
+    assert evaluated_population.case_numbers.tolist() == [0, 1, 2, 3]
+    assert np.allclose(evaluated_population.params, population.params, rtol=1e-3, atol=1e-4)
+    assert np.isfinite(evaluated_population.costs).all()
+    generation_path = os.path.join(str(population_repository.population_path), "generation-1")
+    assert GenerationManifest(generation_path).summary()['done'] == 4
+    assert os.path.isfile(os.path.join(generation_path, "generation-archive.npz"))
+
+    with mock.patch.object(population_repository, 'write_population',
+                           return_value=ResponseFailure.build_resource_error("Disk quota exceeded")):
+        with pytest.raises(EvaluationError, match="Disk quota exceeded"):
+            file_evaluator.evaluate(population, generation_number=2)
+
+
+def test_file_evaluator_run_generation_failures(file_evaluator):
+    population_repository = file_evaluator.population_repository
+    root_params = np.array(population_repository.get_root_individual().root_params)
+    population_repository.write_population(PopulationMatrix(np.tile(root_params, (4, 1))), 1)
+
+    file_evaluator.local_runner = LocalReaxRunner("exit 1", max_retries=0)
+    errors = file_evaluator.run_generation(generation_number=1)
+    assert sorted(errors) == [0, 1, 2, 3]
+    assert all(error.endswith("exited with status 1.") for error in errors.values())
+    manifest = GenerationManifest(os.path.join(str(population_repository.population_path), "generation-1"))
+    assert manifest.summary()['failed'] == 4
+
+
+def test_file_evaluator_evaluate_individual(file_evaluator, tmp_path):
+    population_repository = file_evaluator.population_repository
+    root_individual = population_repository.get_root_individual()
+    individual = Individual.from_root_individual(root_individual)
+
+    evaluated_individual = file_evaluator.evaluate_individual(individual, case_number=5)
+    child_dir = os.path.join(str(population_repository.population_path), "steady-state", "child-5")
+    assert os.path.isfile(os.path.join(child_dir, "fort.99"))
+    fort99_extractor = Fort99Extractor(ReaxReader(child_dir).read_fort99_array())
+    assert evaluated_individual.reax_energies == fort99_extractor.get_reax_energies().tolist()
+    assert evaluated_individual.cost == pytest.approx(float(ReaxError.error_batch(
+        fort99_extractor.get_reax_energies(), fort99_extractor.get_dft_energies(), fort99_extractor.get_weights())))
+    assert np.allclose(evaluated_individual.params, individual.params, rtol=1e-3, atol=1e-4)
+
+    # Failed optimization
+    file_evaluator.local_runner = LocalReaxRunner("exit 1", max_retries=0)
+    assert file_evaluator.evaluate_individual(individual, case_number=6) is None
+
+    # Parameters already evaluated -> served from the evaluation cache, not run
+    population_repository.evaluation_cache = EvaluationCache(str(tmp_path / "evaluation-cache"))
+    population_repository.evaluation_cache.put(individual.params, evaluated_individual.reax_energies,
+                                               evaluated_individual.cost)
+    cached_individual = file_evaluator.evaluate_individual(individual, case_number=7)
+    assert cached_individual.cost == pytest.approx(evaluated_individual.cost)
+    assert not os.path.exists(os.path.join(str(population_repository.population_path), "steady-state", "child-7"))
+
+
+def test_file_evaluator_closes_over_provisioned_generation(file_evaluator, reax_output_dir_path):
+    population_repository = file_evaluator.population_repository
+    population_repository.num_extra_children = 1
+    root_params = np.array(population_repository.get_root_individual().root_params)
+    population_repository.write_population(PopulationMatrix(np.tile(root_params, (5, 1))), 1)
+    generation_path = os.path.join(str(population_repository.population_path), "generation-1")
+    # Child 2 straggles; the generation is closed once the 4 others completed
+    open(os.path.join(generation_path, "child-2", "slow"), 'w').close()
+    fort99_path = os.path.join(str(reax_output_dir_path), "generation-1", "child-0", "fort.99")
+    file_evaluator.local_runner = LocalReaxRunner('if [ -f slow ]; then sleep 30; fi; cp "{}" fort.99'
+                                                  .format(fort99_path), num_workers=5)
+
+    errors = file_evaluator.run_generation(generation_number=1)
+    assert [case_number for case_number, error in errors.items() if error is None] == [0, 1, 3, 4]
+    assert errors[2].startswith("GenerationClosed")
+    assert population_repository.late_case_numbers(1) == [2]
+    manifest = GenerationManifest(generation_path)
+    assert manifest.summary()['failed'] == 1
+    assert manifest.read()['children'][2]['late']
+
+    # Late children count as failed, even if they complete afterwards
+    population_repository.set_generation_number(2)
+    evaluated_population = population_repository.compact_generation(1)
+    assert evaluated_population.case_numbers.tolist() == [0, 1, 3, 4]
+    with np.load(os.path.join(generation_path, "generation-archive.npz")) as archive:
+        assert archive['failed'].tolist() == [False, False, True, False, False]
+
+
+def test_file_evaluator_reseeds_timed_out_children(file_evaluator, reax_output_dir_path):
+    population_repository = file_evaluator.population_repository
+    root_individual = population_repository.get_root_individual()
+    root_params = np.array(root_individual.root_params)
+    population_repository.write_population(PopulationMatrix(np.tile(root_params, (4, 1))), 1)
+    generation_path = os.path.join(str(population_repository.population_path), "generation-1")
+    open(os.path.join(generation_path, "child-1", "slow"), 'w').close()
+    fort99_path = os.path.join(str(reax_output_dir_path), "generation-1", "child-0", "fort.99")
+    file_evaluator.local_runner = LocalReaxRunner('if [ -f slow ]; then sleep 30; fi; cp "{}" fort.99'
+                                                  .format(fort99_path), num_workers=4, timeout=0.5, max_retries=1)
+    reseeded_params = (root_params * 1.01).tolist()
+
+    def reseed(generation_number):
+        assert generation_number == 1
+        # Stand-in for parameters that do not stall ReaxFF
+        os.remove(os.path.join(generation_path, "child-1", "slow"))
+        return Individual(reseeded_params, root_individual=root_individual)
+
+    file_evaluator.reseed = reseed
+    assert file_evaluator.run_generation(generation_number=1) == {0: None, 1: None, 2: None, 3: None}
+
+    population_repository.set_generation_number(2)
+    evaluated_population = population_repository.compact_generation(1)
+    assert evaluated_population.case_numbers.tolist() == [0, 1, 2, 3]
+    assert np.allclose(evaluated_population.params[1], reseeded_params, rtol=1e-3, atol=1e-4)
+    assert np.allclose(evaluated_population.params[0], root_params, rtol=1e-3, atol=1e-4)
@@ -102,6 +102,7 @@ def test_write_summary(file_repository, presenter_output_path):
         assert best_error == 4094932.470
         best_case = int(next(in_file).split('-')[-1])
         assert best_case == 1
+        assert next(in_file) == "Number of late cases (generation closed before they completed): 0\n"
 
 
 @pytest.mark.usefixtures("presenter_output_path", "reax_output_dir_path")
@@ -0,0 +1,68 @@
+# Standard library
+import os
+
+# 3rd party packages
+import numpy as np
+import pytest
+
+# Local source
+from parametrization_clean.domain.population_matrix import PopulationMatrix
+from parametrization_clean.infrastructure.repository.evaluation_cache import EvaluationCache, training_set_fingerprint
+
+
+@pytest.fixture()
+def evaluation_cache(tmp_path):
+    return EvaluationCache(str(tmp_path / "evaluation-cache"), namespace="training-set")
+
+
+def test_evaluation_cache_key(evaluation_cache):
+    params = np.array([1.0, -0.5, 123.4567])
+    # Parameters written identically to the ffield files share a key
+    assert evaluation_cache.key(params) == evaluation_cache.key(params + 1e-6)
+    assert evaluation_cache.key(np.array([0.0, 1.0])) == evaluation_cache.key(np.array([-0.0, 1.0]))
+    assert evaluation_cache.key(params) != evaluation_cache.key(params + 1e-3)
+    assert evaluation_cache.key(params) != EvaluationCache(evaluation_cache.cache_path, "other").key(params)
+
+
+def test_evaluation_cache_get_put(evaluation_cache):
+    params = np.array([1.0, -0.5, 123.4567])
+    assert evaluation_cache.get(params) is None
+    assert not os.path.exists(evaluation_cache.cache_path)
+
+    assert evaluation_cache.put(params, [1.0, 2.0, 3.0], 4.5)
+    reax_energies, cost = evaluation_cache.get(params + 1e-6)
+    assert reax_energies.tolist() == [1.0, 2.0, 3.0]
+    assert cost == 4.5
+
+    # Existing entries are kept
+    assert evaluation_cache.put(params, [0.0, 0.0, 0.0])
+    assert evaluation_cache.get(params)[0].tolist() == [1.0, 2.0, 3.0]
+
+    assert evaluation_cache.put(params + 1.0, [1.0], None)
+    assert evaluation_cache.get(params + 1.0)[1] is None
+
+
+def test_evaluation_cache_put_population(evaluation_cache):
+    population = PopulationMatrix(np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]),
+                                  np.array([[1.0, 1.0], [2.0, np.nan], [3.0, 3.0]]), np.array([0.1, np.nan, np.nan]))
+    assert evaluation_cache.put_population(population) == 2
+    assert evaluation_cache.get([1.0, 2.0])[1] == pytest.approx(0.1)
+    assert evaluation_cache.get([3.0, 4.0]) is None
+    assert evaluation_cache.get([5.0, 6.0])[1] is None
+
+    assert evaluation_cache.put_population(PopulationMatrix(np.array([[7.0, 8.0]]))) == 0
+
+
+def test_training_set_fingerprint(training_set_dir_path, tmp_path):
+    fingerprint = training_set_fingerprint(training_set_dir_path, ('geo', 'trainset.in', 'missing'))
+    assert fingerprint == training_set_fingerprint(training_set_dir_path, ('geo', 'trainset.in'))
+    assert fingerprint != training_set_fingerprint(training_set_dir_path, ('geo', 'control'))
+
+    training_file_path = tmp_path / "trainset.in"
+    training_file_path.write_text("ENERGY")
+    fingerprint = training_set_fingerprint(str(tmp_path), ('trainset.in',))
+    assert fingerprint == training_set_fingerprint(str(tmp_path), ('trainset.in',))
+    # Modified training files change the fingerprint
+    file_stat = os.stat(str(training_file_path))
+    os.utime(str(training_file_path), ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 10 ** 9))
+    assert fingerprint != training_set_fingerprint(str(tmp_path), ('trainset.in',))
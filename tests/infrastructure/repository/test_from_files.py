@@ -3,16 +3,24 @@
 import os
 from pathlib import Path
 import shutil
+from unittest import mock
 
 # 3rd party packages
+import numpy as np
 import pytest
 
 # Local source
-from parametrization_clean.infrastructure.repository.from_files import PopulationFileRepository
+from parametrization_clean.infrastructure.repository.from_files import PopulationFileRepository, CACHED_RESULT_NAME
+from parametrization_clean.infrastructure.repository.evaluation_cache import EvaluationCache
+from parametrization_clean.infrastructure.repository.generation_manifest import (GenerationManifest, WRITTEN,
+                                                                                  RUNNING, DONE, FAILED, CACHED)
 from parametrization_clean.domain.root_individual import RootIndividual, FirstGenerationRootIndividual
+from parametrization_clean.domain.population_matrix import PopulationMatrix
 from parametrization_clean.infrastructure.utils.response_object import (ResponseSuccess,
                                                   ResponseWarning,
                                                   ResponseFailure)
+from parametrization_clean.infrastructure.exception.exception import ConfigurationError
+from parametrization_clean.infrastructure.utils.reax_reader import ReaxReader
 from tests.use_case.test_population_propagator import all_settings
 from tests.infrastructure.utils.test_reaxff_reader import reax_io_obj
 
@@ -30,8 +38,12 @@ def module_setup_teardown(reax_output_dir_path):
 @pytest.fixture()
 @pytest.mark.usefixtures("training_set_dir_path", "reax_output_dir_path")
 def file_repository(all_settings, training_set_dir_path, reax_output_dir_path):
-    return PopulationFileRepository(training_set_dir_path, reax_output_dir_path, all_settings,
-                                    current_generation_number=3)
+    yield PopulationFileRepository(training_set_dir_path, reax_output_dir_path, all_settings,
+                                   current_generation_number=3)
+    # Teardown - binary reference data written when building the root individual
+    reference_data_path = os.path.join(reax_output_dir_path, 'reference-files', 'reference-data.npz')
+    if os.path.isfile(reference_data_path):
+        os.remove(reference_data_path)
 
 
 @pytest.fixture()
@@ -44,8 +56,12 @@ def first_generation_file_repository(all_settings, training_set_dir_path, reax_o
 @pytest.fixture()
 @pytest.mark.usefixtures("training_set_dir_path", "reax_output_dir_path")
 def second_generation_file_repository(all_settings, training_set_dir_path, reax_output_dir_path):
-    return PopulationFileRepository(training_set_dir_path, reax_output_dir_path, all_settings,
-                                    current_generation_number=2)
+    yield PopulationFileRepository(training_set_dir_path, reax_output_dir_path, all_settings,
+                                   current_generation_number=2)
+    # Teardown - binary reference data written when building the root individual
+    reference_data_path = os.path.join(reax_output_dir_path, 'reference-files', 'reference-data.npz')
+    if os.path.isfile(reference_data_path):
+        os.remove(reference_data_path)
 
 
 @pytest.mark.usefixtures("training_set_dir_path", "reax_output_dir_path")
@@ -113,6 +129,30 @@ def test_get_root_individual(reax_io_obj, file_repository):
     assert root_individual.param_keys == param_keys
 
 
+def test_get_root_individual_memoized(file_repository, all_settings, training_set_dir_path, reax_output_dir_path):
+    reference_data_path = os.path.join(reax_output_dir_path, 'reference-files', 'reference-data.npz')
+    root_individual = file_repository.get_root_individual()
+    assert os.path.isfile(reference_data_path)
+    assert file_repository.get_root_individual() is root_individual
+
+    # Later repositories build the root individual from the binary reference data, without parsing text files
+    repository = PopulationFileRepository(training_set_dir_path, reax_output_dir_path, all_settings,
+                                          current_generation_number=4)
+    with mock.patch.object(ReaxReader, 'read_fort99_array', side_effect=AssertionError("fort.99 parsed")), \
+            mock.patch.object(ReaxReader, 'read_ffield', side_effect=AssertionError("ffield parsed")):
+        new_root_individual = repository.get_root_individual()
+    assert new_root_individual.dft_energies.tolist() == root_individual.dft_energies.tolist()
+    assert new_root_individual.weights.tolist() == root_individual.weights.tolist()
+
+    # Same reference data for all later generations -> still memoized
+    file_repository.current_generation_number = 5
+    assert file_repository.get_root_individual() is root_individual
+
+    # Root individual depends on the generation number
+    file_repository.current_generation_number = 1
+    assert isinstance(file_repository.get_root_individual(), FirstGenerationRootIndividual)
+
+
 def test_get_population(file_repository):
     first_generation_population, successfully_retrieved_case_numbers = \
         file_repository.get_population(generation_number=1)
@@ -132,6 +172,113 @@ def test_get_population(file_repository):
     assert first_generation_population[-1].cost == pytest.approx(248741.8623, rel=100)
 
 
+def test_get_population_parallel_ingest(file_repository):
+    population, successfully_retrieved_case_numbers = file_repository.get_population(generation_number=1)
+
+    file_repository.num_read_workers = 2
+    file_repository.population_size = 5
+    parallel_population, parallel_case_numbers = file_repository.get_population(generation_number=1)
+    assert parallel_case_numbers == successfully_retrieved_case_numbers
+    assert [individual.params for individual in parallel_population] == [individual.params
+                                                                         for individual in population]
+    assert [individual.cost for individual in parallel_population] == pytest.approx([individual.cost
+                                                                                     for individual in population])
+
+
+def test_read_generation_does_not_mutate_readers(file_repository, training_set_dir_path):
+    file_repository.get_population(generation_number=1)
+    file_repository.get_root_individual()
+    assert file_repository.training_reax_reader.dir_path == training_set_dir_path
+
+
+def test_get_population_matrix(file_repository):
+    population, successfully_retrieved_case_numbers = file_repository.get_population(generation_number=1)
+    population_matrix = file_repository.get_population_matrix(generation_number=1)
+
+    assert isinstance(population_matrix, PopulationMatrix)
+    assert len(population_matrix) == 4
+    assert population_matrix.params.shape == (4, len(file_repository.param_keys))
+    assert list(population_matrix.case_numbers) == successfully_retrieved_case_numbers
+    for row, individual in enumerate(population):
+        assert population_matrix.params[row].tolist() == individual.params
+        assert population_matrix.costs[row] == pytest.approx(individual.cost)
+
+
+def test_compact_generation(file_repository, reax_output_dir_path):
+    archive_path = os.path.join(reax_output_dir_path, 'generation-1', 'generation-archive.npz')
+    file_repository.population_size = 5
+    try:
+        population_matrix = file_repository.compact_generation(generation_number=1)
+        assert os.path.isfile(archive_path)
+        with np.load(archive_path) as archive:
+            assert archive['failed'].tolist() == [False, False, False, False, True]
+            assert archive['params'].shape == population_matrix.params.shape
+
+        # The archive is preferred over the child directories once it exists
+        with mock.patch.object(file_repository, '_PopulationFileRepository__read_generation_files') as read_files:
+            archived_matrix = file_repository.get_population_matrix(generation_number=1)
+            archived_population, case_numbers = file_repository.get_population(generation_number=1)
+        read_files.assert_not_called()
+        assert np.array_equal(archived_matrix.params, population_matrix.params)
+        assert np.array_equal(archived_matrix.reax_energies, population_matrix.reax_energies)
+        assert np.array_equal(archived_matrix.costs, population_matrix.costs)
+        assert case_numbers == [0, 1, 2, 3]
+        assert archived_population[0].cost == pytest.approx(7253274.4676, rel=100)
+
+        # Compacted generations are appended to the history store
+        assert file_repository.history_store.generation_numbers == [1]
+    finally:
+        if os.path.isfile(archive_path):
+            os.remove(archive_path)
+        shutil.rmtree(os.path.join(reax_output_dir_path, 'history'), ignore_errors=True)
+
+
+def test_get_history(file_repository, reax_output_dir_path):
+    file_repository.population_size = 5
+    history = file_repository.get_history(num_populations=2)
+    assert len(history) == 8
+    assert history.params.tolist() == (file_repository.get_population_matrix(1).params.tolist() +
+                                       file_repository.get_population_matrix(2).params.tolist())
+
+    try:
+        file_repository.compact_generation(generation_number=1)
+        file_repository.compact_generation(generation_number=2)
+        # Served from the memory-mapped history store, without reading the generations
+        with mock.patch.object(file_repository, 'get_population_matrix') as get_population_matrix:
+            stored_history = file_repository.get_history(num_populations=2)
+        get_population_matrix.assert_not_called()
+        assert isinstance(stored_history.params.base, np.memmap)
+        assert stored_history.params.tolist() == history.params.tolist()
+        assert stored_history.reax_energies.tolist() == history.reax_energies.tolist()
+    finally:
+        for generation_number in (1, 2):
+            archive_path = os.path.join(reax_output_dir_path, 'generation-{}'.format(generation_number),
+                                        'generation-archive.npz')
+            if os.path.isfile(archive_path):
+                os.remove(archive_path)
+        shutil.rmtree(os.path.join(reax_output_dir_path, 'history'), ignore_errors=True)
+
+
+@pytest.mark.usefixtures("training_set_dir_path", "reax_output_dir_path")
+def test_file_repository_invalid_history_dtype(all_settings, training_set_dir_path, reax_output_dir_path):
+    all_settings.repository_settings.history_dtype = "float16"
+    with pytest.raises(ConfigurationError):
+        PopulationFileRepository(training_set_dir_path, reax_output_dir_path, all_settings,
+                                 current_generation_number=3)
+
+
+def test_write_population_removes_stale_archive(file_repository, reax_output_dir_path):
+    population = file_repository.get_population_matrix(generation_number=2)
+    generation_path = os.path.join(reax_output_dir_path, 'generation-3')
+    os.mkdir(generation_path)
+    archive_path = os.path.join(generation_path, 'generation-archive.npz')
+    with open(archive_path, 'w') as out_file:
+        out_file.write('stale')
+
+    file_repository.write_population(population, generation_number=3)
+    assert not os.path.exists(archive_path)
+
+
 def test_read_population_range(file_repository):
     first_and_second_generation_population = file_repository.read_population_range(lower_bound=1,
                                                                                    upper_bound=3)
@@ -146,6 +293,64 @@ def test_read_population_range(file_repository):
     assert isinstance(first_and_second_generation_population[7].cost, float)
 
 
+def test_stage_child(file_repository, reax_output_dir_path):
+    generation_path = os.path.join(reax_output_dir_path, 'generation-3')
+    file_repository.write_population(file_repository.get_population_matrix(generation_number=2), generation_number=3)
+    for case_number in range(4):
+        shutil.copy(os.path.join(reax_output_dir_path, 'generation-2', 'child-{}'.format(case_number), 'fort.99'),
+                    os.path.join(generation_path, 'child-{}'.format(case_number)))
+    parsed_population = file_repository.get_population_matrix(generation_number=3)
+
+    assert not file_repository.stage_child(generation_number=3, case_number=4)
+    for case_number in range(4):
+        assert file_repository.stage_child(generation_number=3, case_number=case_number)
+        assert os.path.isfile(os.path.join(generation_path, 'child-{}'.format(case_number), 'staged-result.npz'))
+
+    # Staged results are merged without parsing any fort.99 of the generation
+    read_fort99_array = ReaxReader.read_fort99_array
+    with mock.patch.object(ReaxReader, 'read_fort99_array', autospec=True,
+                           side_effect=read_fort99_array) as read_fort99_mock:
+        staged_population = file_repository.get_population_matrix(generation_number=3)
+    assert all(not str(call[0][0].dir_path).startswith(generation_path) for call in read_fort99_mock.call_args_list)
+    assert staged_population.params.tolist() == parsed_population.params.tolist()
+    assert staged_population.reax_energies.tolist() == parsed_population.reax_energies.tolist()
+    assert staged_population.case_numbers.tolist() == [0, 1, 2, 3]
+
+    # Staged results of a fort.99 that changed since are ignored; rewritten children drop their staged results
+    child_fort99_path = os.path.join(generation_path, 'child-0', 'fort.99')
+    with open(child_fort99_path, 'a') as out_file:
+        out_file.write('\n')
+    with mock.patch.object(ReaxReader, 'read_fort99_array', autospec=True,
+                           side_effect=read_fort99_array) as read_fort99_mock:
+        file_repository.get_population_matrix(generation_number=3)
+    assert [str(call[0][0].dir_path) for call in read_fort99_mock.call_args_list
+            if str(call[0][0].dir_path).startswith(generation_path)] == [os.path.dirname(child_fort99_path)]
+
+    file_repository.write_population(file_repository.get_population_matrix(generation_number=2), generation_number=3)
+    assert not os.path.exists(os.path.join(generation_path, 'child-1', 'staged-result.npz'))
+
+
+def test_iter_population_range(file_repository):
+    chunks = file_repository.iter_population_range(lower_bound=1, upper_bound=3)
+    assert not isinstance(chunks, list)
+
+    with mock.patch.object(file_repository, 'get_population_matrix',
+                           wraps=file_repository.get_population_matrix) as get_population_matrix:
+        generation_number, population = next(chunks)
+        # Generations are only read when they are consumed
+        get_population_matrix.assert_called_once_with(1)
+        assert generation_number == 1
+        assert isinstance(population, PopulationMatrix)
+        assert population.params.shape == (4, len(file_repository.param_keys))
+        assert population.reax_energies.shape[0] == 4
+        assert population.case_numbers.tolist() == [0, 1, 2, 3]
+        assert [chunk[0] for chunk in chunks] == [2]
+
+    individuals = file_repository.read_population_range(lower_bound=1, upper_bound=2)
+    assert [individual.params for individual in individuals] == population.params.tolist()
+    assert [individual.cost for individual in individuals] == pytest.approx(population.costs.tolist())
+
+
 def test_get_previous_n_populations(file_repository):
     previous_two_populations = file_repository.get_previous_n_populations(num_populations=2)
 
@@ -189,6 +394,28 @@ def test_write_individual(file_repository, reax_output_dir_path):
     assert response.message == "Child directory not provided."
 
 
+def test_write_individual_linked_training_files(file_repository, reax_output_dir_path, training_set_dir_path):
+    population, _ = file_repository.get_population(generation_number=1)
+    file_repository.file_materialization = "symlink"
+
+    generation_path = os.path.join(reax_output_dir_path, 'generation-3')
+    os.mkdir(generation_path)
+    child_dir = os.path.join(generation_path, 'child-0')
+    response = file_repository.write_individual(population[0], child_dir=child_dir)
+    assert isinstance(response, ResponseSuccess)
+    for file_name in ('control', 'geo', 'params', 'trainset.in'):
+        assert os.path.samefile(os.path.join(child_dir, file_name), os.path.join(training_set_dir_path, file_name))
+    assert not os.path.islink(os.path.join(child_dir, 'ffield'))
+
+
+@pytest.mark.usefixtures("training_set_dir_path", "reax_output_dir_path")
+def test_file_repository_invalid_file_materialization(all_settings, training_set_dir_path, reax_output_dir_path):
+    all_settings.repository_settings.file_materialization = "teleport"
+    with pytest.raises(ConfigurationError):
+        PopulationFileRepository(training_set_dir_path, reax_output_dir_path, all_settings,
+                                 current_generation_number=3)
+
+
 def test_write_population(file_repository, reax_output_dir_path):
     population, _ = file_repository.get_population(generation_number=2)
 
@@ -202,3 +429,149 @@ def test_write_population(file_repository, reax_output_dir_path):
     response = file_repository.write_population(population, generation_number=3)
     assert isinstance(response, ResponseWarning)
     assert response.message == "Population generation directory {} overwritten.".format(generation_path)
+
+
+def test_write_population_reports_failed_children(file_repository, reax_output_dir_path):
+    population = file_repository.get_population_matrix(generation_number=2)
+
+    # A regular file in place of child-1's directory makes writing that child fail
+    generation_path = os.path.join(reax_output_dir_path, 'generation-3')
+    os.mkdir(generation_path)
+    with open(os.path.join(generation_path, 'child-1'), 'w') as out_file:
+        out_file.write('')
+
+    response = file_repository.write_population(population, generation_number=3)
+    assert isinstance(response, ResponseWarning)
+    assert response.message.startswith("1 of 4 children in population directory {} were not written:"
+                                       .format(generation_path))
+    assert os.path.join(generation_path, 'child-1') in response.message
+    for case_number in (0, 2, 3):
+        assert os.path.isfile(os.path.join(generation_path, 'child-{}'.format(case_number), 'ffield'))
+
+    with mock.patch.object(file_repository, 'write_individual', side_effect=OSError("Disk quota exceeded")):
+        response = file_repository.write_population(population, generation_number=3)
+    assert isinstance(response, ResponseFailure)
+    assert response.message.count("OSError: Disk quota exceeded") == 4
+
+
+def test_generation_manifest(file_repository, reax_output_dir_path):
+    population = file_repository.get_population_matrix(generation_number=2)
+    generation_path = os.path.join(reax_output_dir_path, 'generation-3')
+    file_repository.write_population(population, generation_number=3)
+
+    manifest = GenerationManifest(generation_path)
+    assert manifest.read()['population_size'] == 4
+    assert manifest.summary() == {WRITTEN: 4, RUNNING: 0, DONE: 0, FAILED: 0, CACHED: 0}
+
+    for case_number in (0, 1, 3):
+        shutil.copy(os.path.join(reax_output_dir_path, 'generation-2', 'child-{}'.format(case_number), 'fort.99'),
+                    os.path.join(generation_path, 'child-{}'.format(case_number)))
+    assert file_repository.stage_child(generation_number=3, case_number=3)
+    assert manifest.read()['children'][3]['status'] == DONE
+
+    # Plain reads do not touch the manifest...
+    file_repository.get_population_matrix(generation_number=3)
+    assert manifest.summary() == {WRITTEN: 3, RUNNING: 0, DONE: 1, FAILED: 0, CACHED: 0}
+
+    # ...only ingesting the generation does
+    try:
+        read_population = file_repository.compact_generation(generation_number=3)
+    finally:
+        shutil.rmtree(os.path.join(reax_output_dir_path, 'history'), ignore_errors=True)
+    children = manifest.read()['children']
+    assert manifest.summary() == {WRITTEN: 0, RUNNING: 0, DONE: 3, FAILED: 1, CACHED: 0}
+    assert children[2]['error'].startswith("FileNotFoundError")
+    for case_number, cost in zip(read_population.case_numbers.tolist(), read_population.costs.tolist()):
+        assert children[case_number]['cost'] == pytest.approx(cost)
+
+    # Generations without a manifest (e.g., written by earlier versions) are read without creating one
+    file_repository.get_population_matrix(generation_number=2)
+    assert not GenerationManifest(os.path.join(reax_output_dir_path, 'generation-2')).exists()
+    assert not os.path.exists(os.path.join(reax_output_dir_path, 'generation-2', GenerationManifest.LOCK_NAME))
+
+
+
+def test_write_population_serves_cached_children(file_repository, reax_output_dir_path, tmp_path):
+    population = file_repository.get_population_matrix(generation_number=2)
+    file_repository.evaluation_cache = EvaluationCache(str(tmp_path))
+    for case_number in (0, 2):
+        file_repository.evaluation_cache.put(population.params[case_number], population.reax_energies[case_number],
+                                             population.costs[case_number])
+
+    generation_path = os.path.join(reax_output_dir_path, 'generation-3')
+    response = file_repository.write_population(population, generation_number=3)
+    assert isinstance(response, ResponseSuccess)
+    assert response.message == "Generation successfully written at {} (2 of 4 children reuse cached results)"\
+        .format(generation_path)
+    assert file_repository.cached_case_numbers(generation_number=3) == [0, 2]
+    children = GenerationManifest(generation_path).read()['children']
+    assert children[0]['status'] == CACHED
+    assert children[0]['cost'] == pytest.approx(population.costs[0])
+    assert children[1]['status'] == WRITTEN
+    for case_number in (0, 2):
+        assert os.path.isfile(os.path.join(generation_path, 'child-{}'.format(case_number), CACHED_RESULT_NAME))
+
+    # Only the other children are run
+    for case_number in (1, 3):
+        shutil.copy(os.path.join(reax_output_dir_path, 'generation-2', 'child-{}'.format(case_number), 'fort.99'),
+                    os.path.join(generation_path, 'child-{}'.format(case_number)))
+    try:
+        read_population = file_repository.compact_generation(generation_number=3)
+    finally:
+        shutil.rmtree(os.path.join(reax_output_dir_path, 'history'), ignore_errors=True)
+    assert read_population.case_numbers.tolist() == [0, 1, 2, 3]
+    assert np.allclose(read_population.reax_energies, population.reax_energies)
+    assert [child['status'] for _, child in sorted(GenerationManifest(generation_path).read()['children'].items())]\
+        == [CACHED, DONE, CACHED, DONE]
+
+    # Rewritten children do not keep cached results of the previous occupant of their directories
+    file_repository.evaluation_cache = None
+    file_repository.write_population(population, generation_number=3)
+    assert not os.path.exists(os.path.join(generation_path, 'child-0', CACHED_RESULT_NAME))
+    assert file_repository.cached_case_numbers(generation_number=3) == []
+
+def test_write_population_sequential(file_repository, reax_output_dir_path):
+    population = file_repository.get_population_matrix(generation_number=2)
+    file_repository.num_write_workers = 1
+    response = file_repository.write_population(population, generation_number=3)
+    assert isinstance(response, ResponseSuccess)
+    assert len([name for name in os.listdir(os.path.join(reax_output_dir_path, 'generation-3'))
+                if name.startswith('child-')]) == 4
+
+
+def test_write_population_matrix(file_repository, reax_output_dir_path):
+    population = file_repository.get_population_matrix(generation_number=2)
+
+    generation_path = os.path.join(reax_output_dir_path, 'generation-3')
+    response = file_repository.write_population(population, generation_number=3)
+    assert isinstance(response, ResponseSuccess)
+    for case_number in range(len(population)):
+        assert os.path.isfile(os.path.join(generation_path, 'child-{}'.format(case_number), 'ffield'))
+
+
+def test_get_population_from_written_params(file_repository, reax_output_dir_path):
+    population = file_repository.get_population_matrix(generation_number=2)
+    population.params[0, 0] += 1.23456789
+    file_repository.write_population(population, generation_number=3)
+
+    generation_path = os.path.join(reax_output_dir_path, 'generation-3')
+    assert os.path.isfile(os.path.join(generation_path, 'generation-params.npz'))
+    for case_number in range(len(population)):
+        shutil.copy(os.path.join(reax_output_dir_path, 'generation-2', 'child-{}'.format(case_number), 'fort.99'),
+                    os.path.join(generation_path, 'child-{}'.format(case_number)))
+    parsed_population = file_repository.get_population_matrix(generation_number=3)
+
+    # Children's ffield files are not parsed; parameters are the ones written to them
+    read_ffield = ReaxReader.read_ffield
+    with mock.patch.object(ReaxReader, 'read_ffield', autospec=True, side_effect=read_ffield) as read_ffield_mock:
+        written_population = file_repository.get_population_matrix(generation_number=3)
+    assert all(not str(call[0][0].dir_path).startswith(generation_path) for call in read_ffield_mock.call_args_list)
+    assert written_population.params.tolist() == parsed_population.params.tolist()
+    assert written_population.params[0, 0] == round(population.params[0, 0], 4)
+    assert written_population.costs.tolist() == pytest.approx(parsed_population.costs.tolist())
+
+    # Stale/partial matrix -> children's ffield files are parsed
+    file_repository.population_size = 5
+    np.savez(os.path.join(generation_path, 'generation-params.npz'), params=population.params[:2])
+    assert file_repository.get_population_matrix(generation_number=3).params.tolist() == \
+        parsed_population.params.tolist()
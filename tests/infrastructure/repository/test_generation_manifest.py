@@ -0,0 +1,59 @@
+# Standard library
+import json
+import os
+
+# 3rd party packages
+import pytest
+
+# Local source
+from parametrization_clean.infrastructure.repository.generation_manifest import (GenerationManifest, WRITTEN,
+                                                                                  RUNNING, DONE, FAILED, CACHED,
+                                                                                  count_statuses)
+
+
+@pytest.fixture()
+def manifest(tmp_path):
+    return GenerationManifest(str(tmp_path))
+
+
+def test_manifest_missing(manifest):
+    assert not manifest.exists()
+    assert manifest.read() is None
+    assert manifest.summary() is None
+    # Updates without a manifest are ignored
+    manifest.update({0: {'status': DONE}})
+    assert not manifest.exists()
+
+
+def test_manifest_create_update(manifest, tmp_path):
+    manifest.create(generation_number=3, children={0: {'status': WRITTEN}, 1: {'status': WRITTEN},
+                                                   2: {'status': FAILED, 'error': "OSError: Disk quota exceeded"}})
+    assert manifest.exists()
+    with open(os.path.join(str(tmp_path), GenerationManifest.MANIFEST_NAME), 'r') as in_file:
+        assert sorted(json.load(in_file)['children']) == ['0', '1', '2']
+
+    content = manifest.read()
+    assert content['generation_number'] == 3
+    assert content['population_size'] == 3
+    assert sorted(content['children']) == [0, 1, 2]
+    assert content['children'][2]['error'] == "OSError: Disk quota exceeded"
+    written_at = content['children'][0]['written_at']
+
+    manifest.update({0: {'status': RUNNING}, 1: {'status': DONE, 'cost': 12.5}})
+    content = manifest.read()
+    assert content['children'][0]['status'] == RUNNING
+    assert content['children'][0]['written_at'] == written_at
+    assert content['children'][1]['cost'] == 12.5
+    assert content['children'][1]['updated_at'] >= written_at
+    assert manifest.summary() == {WRITTEN: 0, RUNNING: 1, DONE: 1, FAILED: 1, CACHED: 0}
+
+    # Recreating the manifest (generation rewritten) drops previous statuses
+    manifest.create(generation_number=3, children={0: {'status': WRITTEN}})
+    assert manifest.summary() == {WRITTEN: 1, RUNNING: 0, DONE: 0, FAILED: 0, CACHED: 0}
+    assert not [name for name in os.listdir(str(tmp_path)) if name.endswith('.tmp')]
+
+
+def test_count_statuses():
+    assert count_statuses({}) == {WRITTEN: 0, RUNNING: 0, DONE: 0, FAILED: 0, CACHED: 0}
+    assert count_statuses({0: {}, 1: {'status': DONE}, 2: {'status': DONE}, 3: {'status': CACHED}}) == \
+        {WRITTEN: 1, RUNNING: 0, DONE: 2, FAILED: 0, CACHED: 1}
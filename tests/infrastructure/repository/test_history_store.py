@@ -0,0 +1,86 @@
+# Standard library
+import os
+
+# 3rd party packages
+import numpy as np
+import pytest
+
+# Local source
+from parametrization_clean.infrastructure.repository.history_store import HistoryStore
+from parametrization_clean.domain.population_matrix import PopulationMatrix
+
+
+@pytest.fixture()
+def history_dir_path(tmp_path):
+    return os.path.join(str(tmp_path), 'history')
+
+
+def generation_data(generation_number, num_individuals=3, num_params=5, num_energies=4):
+    params = np.arange(num_individuals * num_params, dtype=np.float64).reshape(num_individuals, num_params)
+    reax_energies = -np.arange(num_individuals * num_energies, dtype=np.float64).reshape(num_individuals,
+                                                                                         num_energies)
+    return params + 100 * generation_number, reax_energies - 100 * generation_number
+
+
+def test_history_store_append_and_get_generations(history_dir_path):
+    history_store = HistoryStore(history_dir_path)
+    assert len(history_store) == 0
+    assert history_store.get_generations(1, 2) is None
+    assert not os.path.isdir(history_dir_path)
+
+    for generation_number in (1, 2, 3):
+        history_store.append(generation_number, *generation_data(generation_number))
+    history_store.append(4, np.empty((0, 5)), None)
+    assert len(history_store) == 9
+    assert history_store.generation_numbers == [1, 2, 3, 4]
+
+    # Reopened store serves generations as slices of the memory-mapped files
+    history_store = HistoryStore(history_dir_path)
+    population = history_store.get_generations(2, 5)
+    assert isinstance(population, PopulationMatrix)
+    assert len(population) == 6
+    assert isinstance(population.params.base, np.memmap)
+    assert isinstance(population.reax_energies.base, np.memmap)
+    assert population.params.tolist() == np.vstack([generation_data(2)[0], generation_data(3)[0]]).tolist()
+    assert population.reax_energies.tolist() == np.vstack([generation_data(2)[1], generation_data(3)[1]]).tolist()
+    assert history_store.get_generations(3, 6) is None
+
+
+def test_history_store_replace_generation(history_dir_path):
+    history_store = HistoryStore(history_dir_path)
+    for generation_number in (1, 2, 3):
+        history_store.append(generation_number, *generation_data(generation_number))
+
+    params, reax_energies = generation_data(7, num_individuals=2)
+    history_store.append(2, params, reax_energies)
+    assert history_store.generation_numbers == [1, 2]
+    assert len(history_store) == 5
+    assert os.path.getsize(os.path.join(history_dir_path, 'params.bin')) == 5 * 5 * 8
+    assert history_store.get_generations(2, 3).params.tolist() == params.tolist()
+    assert history_store.get_generations(1, 2).params.tolist() == generation_data(1)[0].tolist()
+
+
+def test_history_store_float32(history_dir_path):
+    history_store = HistoryStore(history_dir_path, dtype="float32")
+    history_store.append(1, *generation_data(1))
+    assert os.path.getsize(os.path.join(history_dir_path, 'reax_energies.bin')) == 3 * 4 * 4
+
+    # The data type of an existing store is kept
+    history_store = HistoryStore(history_dir_path, dtype="float64")
+    assert history_store.dtype == np.float32
+    population = history_store.get_generations(1, 2)
+    assert population.params.dtype == np.float32
+    assert population.params.tolist() == generation_data(1)[0].tolist()
+
+
+def test_history_store_invalid_data(history_dir_path):
+    with pytest.raises(ValueError):
+        HistoryStore(history_dir_path, dtype="float16")
+
+    history_store = HistoryStore(history_dir_path)
+    history_store.append(1, *generation_data(1))
+    with pytest.raises(ValueError):
+        history_store.append(2, *generation_data(2, num_params=6))
+    with pytest.raises(ValueError):
+        history_store.append(2, generation_data(2)[0], generation_data(2, num_individuals=2)[1])
+    assert history_store.generation_numbers == [1]
@@ -0,0 +1,52 @@
+# Standard library
+
+# 3rd party packages
+import numpy as np
+import pytest
+
+# Local source
+from parametrization_clean.domain.population_matrix import PopulationMatrix
+from parametrization_clean.infrastructure.repository.in_memory import InMemoryPopulationRepository
+from parametrization_clean.infrastructure.utils.response_object import ResponseSuccess
+from tests.use_case.test_population_propagator import root_individual
+
+
+@pytest.fixture()
+def in_memory_repository(root_individual, get_individuals):
+    repository = InMemoryPopulationRepository(root_individual, current_generation_number=4)
+    for generation_number in (1, 2):
+        population = PopulationMatrix.from_individuals(get_individuals)
+        population.compute_costs(root_individual)
+        repository.write_population(population, generation_number)
+    # Generation 3 written, not evaluated yet
+    repository.write_population(PopulationMatrix(np.ones((4, 5))), 3)
+    return repository
+
+
+def test_in_memory_repository_populations(in_memory_repository, root_individual, get_individuals):
+    assert in_memory_repository.get_root_individual() is root_individual
+    assert in_memory_repository.get_population_matrix(1).params.tolist() == \
+        [individual.params for individual in get_individuals]
+    assert len(in_memory_repository.get_population_matrix(9)) == 0
+
+    population, case_numbers = in_memory_repository.get_population(2)
+    assert case_numbers == [0, 1, 2, 3]
+    assert population[0].reax_energies == get_individuals[0].reax_energies
+
+    response = in_memory_repository.write_population(get_individuals, 5)
+    assert isinstance(response, ResponseSuccess)
+    assert isinstance(in_memory_repository.write_individual(get_individuals[0]), ResponseSuccess)
+
+
+def test_in_memory_repository_history(in_memory_repository):
+    # Generations 1-3 precede generation 4; generation 3 is not evaluated
+    history = in_memory_repository.get_history(num_populations=3)
+    assert len(history) == 8
+    assert history.reax_energies.shape == (8, 4)
+    assert len(in_memory_repository.get_previous_n_populations(3)) == 12
+
+    in_memory_repository.set_generation_number(3)
+    assert len(in_memory_repository.get_history(num_populations=1)) == 4
+
+    in_memory_repository.set_generation_number(1)
+    assert len(in_memory_repository.get_history(num_populations=1)) == 0
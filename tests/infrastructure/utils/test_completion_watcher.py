@@ -0,0 +1,99 @@
+# Standard library
+import os
+import shutil
+import threading
+import time
+
+# 3rd party packages
+import pytest
+
+# Local source
+from parametrization_clean.infrastructure.utils.completion_watcher import CompletionWatcher
+
+
+@pytest.fixture()
+def child_dirs(tmp_path):
+    child_dirs = [os.path.join(str(tmp_path), 'child-{}'.format(case_number)) for case_number in range(3)]
+    for child_dir in child_dirs:
+        os.mkdir(child_dir)
+    return child_dirs
+
+
+@pytest.fixture(params=[False, True], ids=['polling', 'inotify'])
+def use_inotify(request):
+    if request.param:
+        pytest.importorskip('inotify_simple')
+    return request.param
+
+
+def write_fort99(child_dir, reax_output_dir_path, delay=0.0):
+    time.sleep(delay)
+    shutil.copy(os.path.join(reax_output_dir_path, 'generation-1', 'child-0', 'fort.99'),
+                os.path.join(child_dir, 'fort.99'))
+
+
+def test_completion_watcher_detects_children(child_dirs, reax_output_dir_path, use_inotify):
+    # Child 0 completed before watching; children 1 and 2 complete while watching
+    write_fort99(child_dirs[0], reax_output_dir_path)
+    writers = [threading.Thread(target=write_fort99, args=(child_dirs[case_number], reax_output_dir_path, delay))
+               for case_number, delay in ((2, 0.1), (1, 0.6))]
+    for writer in writers:
+        writer.start()
+
+    seen = []
+    completion_watcher = CompletionWatcher(child_dirs, poll_interval=0.05, max_poll_interval=0.2, settle_time=0.0,
+                                           use_inotify=use_inotify)
+    completed = completion_watcher.watch(lambda case_number, child_dir: seen.append(child_dir) or True, timeout=10)
+    for writer in writers:
+        writer.join()
+
+    assert completed == [0, 2, 1]
+    assert seen == [child_dirs[0], child_dirs[2], child_dirs[1]]
+
+
+def test_completion_watcher_timeout(child_dirs, reax_output_dir_path):
+    write_fort99(child_dirs[1], reax_output_dir_path)
+    completion_watcher = CompletionWatcher(child_dirs, poll_interval=0.05, settle_time=0.0, use_inotify=False)
+
+    start = time.monotonic()
+    completed = completion_watcher.watch(lambda case_number, child_dir: True, timeout=0.3)
+    assert completed == [1]
+    assert time.monotonic() - start < 5
+
+
+def test_completion_watcher_num_required(child_dirs, reax_output_dir_path):
+    # Child 1 never completes; the watch ends as soon as two children completed
+    write_fort99(child_dirs[0], reax_output_dir_path)
+    write_fort99(child_dirs[2], reax_output_dir_path)
+    completion_watcher = CompletionWatcher(child_dirs, poll_interval=0.05, settle_time=0.0, use_inotify=False)
+
+    start = time.monotonic()
+    completed = completion_watcher.watch(lambda case_number, child_dir: True, timeout=30, num_required=2)
+    assert completed == [0, 2]
+    assert time.monotonic() - start < 10.0
+    assert completion_watcher.watch(lambda case_number, child_dir: True, timeout=30, num_required=1) == [0]
+
+def test_completion_watcher_retries_unusable_results(child_dirs, reax_output_dir_path):
+    for child_dir in child_dirs:
+        write_fort99(child_dir, reax_output_dir_path)
+    attempts = []
+
+    def on_complete(case_number, child_dir):
+        attempts.append(case_number)
+        # Results of child 1 can only be used on the second attempt (e.g., fort.99 still being written)
+        return case_number != 1 or attempts.count(1) > 1
+
+    completion_watcher = CompletionWatcher(child_dirs, poll_interval=0.01, settle_time=0.0, use_inotify=False)
+    assert completion_watcher.watch(on_complete, timeout=10) == [0, 2, 1]
+    assert attempts.count(1) == 2
+
+
+def test_completion_watcher_waits_for_stable_file(child_dirs, reax_output_dir_path):
+    # Freshly written file is only handed over once it did not change between two polls
+    write_fort99(child_dirs[0], reax_output_dir_path)
+    polls = []
+    completion_watcher = CompletionWatcher(child_dirs[:1], poll_interval=0.05, settle_time=60, use_inotify=False)
+    completed = completion_watcher.watch(lambda case_number, child_dir: polls.append(time.monotonic()) or True,
+                                         timeout=10)
+    assert completed == [0]
+    assert len(polls) == 1
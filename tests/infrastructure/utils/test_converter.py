@@ -2,6 +2,7 @@
 # Standard library
 
 # 3rd party packages
+import numpy as np
 import pytest
 
 # Local source
@@ -13,7 +14,7 @@ from parametrization_clean.infrastructure.utils.reax_converter import Fort99Extr
 @pytest.mark.usefixtures("training_set_dir_path")
 def fort99_data(training_set_dir_path):
     reax_reader = ReaxReader(training_set_dir_path)
-    return reax_reader.read_fort99()
+    return reax_reader.read_fort99_array()
 
 
 @pytest.fixture()
@@ -23,7 +24,8 @@ def fort99_extractor(fort99_data):
 
 def test_get_reax_energies(fort99_extractor):
     reax_energies = fort99_extractor.get_reax_energies()
-    assert isinstance(reax_energies, list)
+    assert isinstance(reax_energies, np.ndarray)
+    assert np.shares_memory(reax_energies, fort99_extractor.data)
     assert reax_energies[0] == 1.1183
     assert reax_energies[-1] == -0.7802
     assert reax_energies[180] == 1.4460
@@ -31,7 +33,8 @@ def test_get_reax_energies(fort99_extractor):
 
 def test_get_dft_energies(fort99_extractor):
     dft_energies = fort99_extractor.get_dft_energies()
-    assert isinstance(dft_energies, list)
+    assert isinstance(dft_energies, np.ndarray)
+    assert np.shares_memory(dft_energies, fort99_extractor.data)
     assert dft_energies[0] == 1.0950
     assert dft_energies[-1] == -0.0010
     assert dft_energies[180] == 0.1090
@@ -39,7 +42,17 @@ def test_get_dft_energies(fort99_extractor):
 
 def test_get_weights(fort99_extractor):
     weights = fort99_extractor.get_weights()
-    assert isinstance(weights, list)
+    assert isinstance(weights, np.ndarray)
+    assert np.shares_memory(weights, fort99_extractor.data)
     assert weights[0] == 0.0500
     assert weights[-1] == 2.0000
     assert weights[180] == 1.0000
+
+
+@pytest.mark.usefixtures("training_set_dir_path")
+def test_fort99_extractor_from_list(training_set_dir_path):
+    fort99_list = ReaxReader(training_set_dir_path).read_fort99()
+    fort99_extractor = Fort99Extractor(fort99_list)
+    assert fort99_extractor.data.shape == (len(fort99_list), 3)
+    assert fort99_extractor.get_weights()[180] == 1.0000
+    assert Fort99Extractor([]).get_reax_energies().shape == (0,)
@@ -0,0 +1,73 @@
+# Standard library
+import os
+
+# 3rd party packages
+import numpy as np
+import pytest
+
+# Local source
+from parametrization_clean.infrastructure.utils.ffield_template import FfieldTemplate
+from parametrization_clean.infrastructure.utils.reax_reader import ReaxReader, parse_ffield
+from parametrization_clean.domain.utils.helpers import get_param
+
+
+@pytest.fixture()
+@pytest.mark.usefixtures("training_set_dir_path")
+def reax_reader(training_set_dir_path):
+    return ReaxReader(training_set_dir_path)
+
+
+@pytest.fixture()
+@pytest.mark.usefixtures("training_set_dir_path")
+def ffield_template(reax_reader, training_set_dir_path):
+    param_keys, _, _ = reax_reader.read_params()
+    return FfieldTemplate(os.path.join(training_set_dir_path, 'ffield'), param_keys)
+
+
+@pytest.mark.usefixtures("training_set_dir_path")
+def test_ffield_template_render_root_params(ffield_template, reax_reader, training_set_dir_path):
+    param_keys, _, _ = reax_reader.read_params()
+    ffield, _ = reax_reader.read_ffield()
+    root_params = [get_param(key, ffield) for key in param_keys]
+    with open(os.path.join(training_set_dir_path, 'ffield'), 'r') as in_file:
+        assert ffield_template.render(root_params) == in_file.read()
+
+
+def test_ffield_template_render(ffield_template, reax_reader):
+    param_keys, _, _ = reax_reader.read_params()
+    ffield, atom_types = reax_reader.read_ffield()
+    params = [get_param(key, ffield) * 1.5 - 0.01 for key in param_keys]
+
+    new_ffield, new_atom_types = parse_ffield(ffield_template.render(params).splitlines())
+    assert [get_param(key, new_ffield) for key in param_keys] == pytest.approx(params, abs=1e-4)
+    assert new_atom_types[3] == atom_types[3]
+    assert np.array_equal(new_ffield[6], ffield[6])
+
+
+def test_ffield_template_render_too_wide_values(ffield_template, reax_reader):
+    param_keys, _, _ = reax_reader.read_params()
+    ffield, _ = reax_reader.read_ffield()
+    params = [get_param(key, ffield) for key in param_keys]
+    params[0] = -123456.7891
+    params[-1] = 98765432.1
+
+    new_ffield, _ = parse_ffield(ffield_template.render(params).splitlines())
+    assert get_param(param_keys[0], new_ffield) == -123456.7891
+    assert get_param(param_keys[-1], new_ffield) == 98765432.1
+    assert get_param(param_keys[1], new_ffield) == params[1]
+
+
+def test_ffield_template_quantize(ffield_template, reax_reader):
+    param_keys, _, _ = reax_reader.read_params()
+    params = np.random.uniform(-10, 10, size=(2, len(param_keys)))
+    quantized_params = ffield_template.quantize(params)
+    assert quantized_params.shape == params.shape
+
+    new_ffield, _ = parse_ffield(ffield_template.render(params[1]).splitlines())
+    assert [get_param(key, new_ffield) for key in param_keys] == quantized_params[1].tolist()
+
+
+@pytest.mark.usefixtures("training_set_dir_path")
+def test_ffield_template_invalid_key(training_set_dir_path):
+    with pytest.raises(ValueError):
+        FfieldTemplate(os.path.join(training_set_dir_path, 'ffield'), [[5, 1000, 1]])
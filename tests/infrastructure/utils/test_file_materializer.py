@@ -0,0 +1,68 @@
+# Standard library
+import os
+from unittest import mock
+
+# 3rd party packages
+import pytest
+
+# Local source
+from parametrization_clean.infrastructure.utils.file_materializer import materialize
+
+
+@pytest.fixture()
+def source_path(tmp_path):
+    training_dir = tmp_path / "training"
+    training_dir.mkdir()
+    path = training_dir / "geo"
+    path.write_text("BIOGRF 200\n")
+    return str(path)
+
+
+@pytest.fixture()
+def child_dir(tmp_path):
+    path = tmp_path / "child-0"
+    path.mkdir()
+    return str(path)
+
+
+@pytest.mark.parametrize("mode", ["copy", "hardlink", "symlink", "reflink"])
+def test_materialize(source_path, child_dir, mode):
+    destination_path = materialize(source_path, child_dir, mode)
+    assert destination_path == os.path.join(child_dir, "geo")
+    with open(destination_path, 'r') as in_file:
+        assert in_file.read() == "BIOGRF 200\n"
+
+    # Materializing again replaces the destination instead of writing through it
+    destination_path = materialize(source_path, child_dir, mode)
+    with open(source_path, 'r') as in_file:
+        assert in_file.read() == "BIOGRF 200\n"
+    assert os.path.isfile(destination_path)
+
+
+def test_materialize_links(source_path, child_dir):
+    destination_path = materialize(source_path, child_dir, "hardlink")
+    assert os.path.samefile(destination_path, source_path)
+
+    destination_path = materialize(source_path, child_dir, "symlink")
+    assert os.path.islink(destination_path)
+    assert os.readlink(destination_path) == os.path.abspath(source_path)
+
+    destination_path = materialize(source_path, child_dir, "copy")
+    assert not os.path.islink(destination_path)
+    assert not os.path.samefile(destination_path, source_path)
+
+
+def test_materialize_fallback_to_copy(source_path, child_dir):
+    with mock.patch("os.link", side_effect=OSError("Invalid cross-device link")):
+        destination_path = materialize(source_path, child_dir, "hardlink")
+    assert not os.path.samefile(destination_path, source_path)
+    with open(destination_path, 'r') as in_file:
+        assert in_file.read() == "BIOGRF 200\n"
+
+
+def test_materialize_invalid(source_path, child_dir):
+    with pytest.raises(ValueError):
+        materialize(source_path, child_dir, "teleport")
+    with pytest.raises(FileNotFoundError):
+        materialize(source_path + ".missing", child_dir, "symlink")
+    assert not os.path.lexists(os.path.join(child_dir, "geo.missing"))
@@ -0,0 +1,146 @@
+# Standard library
+import os
+import time
+
+# 3rd party packages
+import pytest
+
+# Local source
+from parametrization_clean.infrastructure.utils.local_runner import LocalReaxRunner, is_late
+
+
+@pytest.fixture()
+def child_dirs(tmp_path):
+    child_dirs = [os.path.join(str(tmp_path), 'child-{}'.format(case_number)) for case_number in range(4)]
+    for child_dir in child_dirs:
+        os.mkdir(child_dir)
+    return child_dirs
+
+
+def test_local_runner_runs_children(child_dirs):
+    started, completed = [], []
+    runner = LocalReaxRunner("echo optimized; echo 1.0 > fort.99", num_workers=2)
+    errors = runner.run(child_dirs, on_start=lambda case_number, _: started.append(case_number),
+                        on_complete=lambda case_number, _: completed.append(case_number) is None)
+
+    assert errors == {0: None, 1: None, 2: None, 3: None}
+    assert sorted(started) == sorted(completed) == [0, 1, 2, 3]
+    for child_dir in child_dirs:
+        assert os.path.isfile(os.path.join(child_dir, 'fort.99'))
+        with open(os.path.join(child_dir, LocalReaxRunner.OUTPUT_NAME), 'r') as in_file:
+            assert in_file.read() == "optimized\n"
+
+    assert runner.run([]) == {}
+
+
+
+def test_local_runner_case_numbers(child_dirs):
+    started = []
+    errors = LocalReaxRunner("echo 1.0 > fort.99").run(child_dirs[1::2], case_numbers=[1, 3],
+                                                       on_start=lambda case_number, _: started.append(case_number))
+    assert errors == {1: None, 3: None}
+    assert started == [1, 3]
+    assert [os.path.isfile(os.path.join(child_dir, 'fort.99')) for child_dir in child_dirs] == [False, True, False, True]
+
+def test_local_runner_limits_concurrency(child_dirs):
+    runner = LocalReaxRunner("sleep 0.4; echo 1.0 > fort.99", num_workers=2)
+    start = time.monotonic()
+    errors = runner.run(child_dirs)
+    elapsed = time.monotonic() - start
+    assert not any(errors.values())
+    # 4 children, 2 at a time -> 2 waves
+    assert 0.8 <= elapsed < 4.0
+
+
+def test_local_runner_retries_crashes(child_dirs):
+    # Crashes on the first attempt, succeeds on the second one
+    command = "if [ -f attempted ]; then echo 1.0 > fort.99; else touch attempted; echo 1.0 > fort.99; exit 1; fi"
+    started = []
+    errors = LocalReaxRunner(command, max_retries=1).run(child_dirs[:1],
+                                                         on_start=lambda case_number, _: started.append(case_number))
+    assert errors == {0: None}
+    assert started == [0, 0]
+
+    errors = LocalReaxRunner("exit 3", max_retries=2).run(child_dirs[1:2])
+    assert errors[0] == "ReaxFF optimization in '{}' exited with status 3.".format(child_dirs[1])
+
+    # fort.99 of a previous run is removed before running again
+    with open(os.path.join(child_dirs[2], 'fort.99'), 'w') as out_file:
+        out_file.write("1.0\n")
+    errors = LocalReaxRunner("true", max_retries=0).run(child_dirs[2:3])
+    assert errors[0] == "ReaxFF optimization in '{}' did not write fort.99.".format(child_dirs[2])
+
+
+def test_local_runner_timeout(child_dirs):
+    started = []
+    runner = LocalReaxRunner("sleep 30; echo 1.0 > fort.99", timeout=0.3, max_retries=3)
+    start = time.monotonic()
+    errors = runner.run(child_dirs[:1], on_start=lambda case_number, _: started.append(case_number))
+    assert time.monotonic() - start < 10.0
+    assert errors[0] == "TimeoutExpired: ReaxFF optimization in '{}' exceeded 0.3 seconds.".format(child_dirs[0])
+    # Timeouts are not restarted
+    assert started == [0]
+    assert not os.path.exists(os.path.join(child_dirs[0], 'fort.99'))
+
+
+STRAGGLING_COMMAND = "if [ -f slow ]; then sleep 30; fi; echo 1.0 > fort.99"
+
+
+def test_local_runner_closes_after_num_required(child_dirs):
+    open(os.path.join(child_dirs[3], 'slow'), 'w').close()
+    runner = LocalReaxRunner(STRAGGLING_COMMAND, num_workers=4)
+    start = time.monotonic()
+    errors = runner.run(child_dirs, num_required=3)
+    assert time.monotonic() - start < 10.0
+    assert errors[0] is None and errors[1] is None and errors[2] is None
+    assert is_late(errors[3])
+    assert "3 children had completed" in errors[3]
+    assert not os.path.exists(os.path.join(child_dirs[3], 'fort.99'))
+    assert not is_late(None) and not is_late("TimeoutExpired: ...")
+
+
+def test_local_runner_closes_at_deadline(child_dirs):
+    for child_dir in child_dirs[2:]:
+        open(os.path.join(child_dir, 'slow'), 'w').close()
+    started = []
+    # Single worker -> child 3 has not started when the deadline passes
+    runner = LocalReaxRunner(STRAGGLING_COMMAND, num_workers=1)
+    start = time.monotonic()
+    errors = runner.run(child_dirs, deadline=0.5, on_start=lambda case_number, _: started.append(case_number))
+    assert time.monotonic() - start < 10.0
+    assert errors[0] is None and errors[1] is None
+    assert is_late(errors[2]) and is_late(errors[3])
+    assert "deadline of 0.5 seconds" in errors[2]
+    assert started == [0, 1, 2]
+
+
+def test_local_runner_on_timeout_restarts(child_dirs):
+    open(os.path.join(child_dirs[0], 'slow'), 'w').close()
+    timed_out = []
+
+    def on_timeout(case_number, child_dir):
+        # e.g., reseeded with parameters that do not stall
+        timed_out.append(case_number)
+        os.remove(os.path.join(child_dir, 'slow'))
+        return True
+
+    runner = LocalReaxRunner(STRAGGLING_COMMAND, timeout=0.3, max_retries=1)
+    errors = runner.run(child_dirs[:2], on_timeout=on_timeout)
+    assert errors == {0: None, 1: None}
+    assert timed_out == [0]
+
+    # Restarts are bounded by `max_retries`
+    open(os.path.join(child_dirs[0], 'slow'), 'w').close()
+    errors = LocalReaxRunner(STRAGGLING_COMMAND, timeout=0.3, max_retries=0).run(child_dirs[:1],
+                                                                                on_timeout=on_timeout)
+    assert errors[0].startswith("TimeoutExpired")
+
+
+def test_local_runner_failed_ingest_and_missing_directory(child_dirs, tmp_path):
+    runner = LocalReaxRunner("echo 1.0 > fort.99")
+    errors = runner.run(child_dirs[:1], on_complete=lambda case_number, child_dir: False)
+    assert errors[0] == "Results of '{}' could not be retrieved.".format(child_dirs[0])
+
+    missing_dir = os.path.join(str(tmp_path), 'child-9')
+    errors = runner.run([missing_dir])
+    assert errors[0].startswith("FileNotFoundError")
@@ -0,0 +1,90 @@
+# Standard library
+import glob
+import os
+import shutil
+
+# 3rd party packages
+import numpy as np
+import pytest
+
+# Local source
+from parametrization_clean.infrastructure.utils import parse_cache
+from parametrization_clean.infrastructure.utils.reax_reader import ReaxReader
+
+
+@pytest.fixture()
+@pytest.mark.usefixtures("training_set_dir_path")
+def cached_dir_path(training_set_dir_path, tmp_path):
+    for file_name in ('ffield', 'fort.99'):
+        shutil.copy(os.path.join(training_set_dir_path, file_name), str(tmp_path))
+    return str(tmp_path)
+
+
+def sidecars(dir_path, file_name):
+    return glob.glob(os.path.join(dir_path, "." + file_name + ".*.npz"))
+
+
+def test_sidecar_path(cached_dir_path):
+    ffield_path = os.path.join(cached_dir_path, 'ffield')
+    stat_result = os.stat(ffield_path)
+    assert parse_cache.sidecar_path(ffield_path) == os.path.join(
+        cached_dir_path, ".ffield.{}-{}.npz".format(stat_result.st_size, stat_result.st_mtime_ns))
+    with pytest.raises(FileNotFoundError):
+        parse_cache.sidecar_path(os.path.join(cached_dir_path, 'fort.7'))
+
+
+def test_encode_decode_sections():
+    sections = {1: np.array([1.0, 2.0]), 2: [[1.0, 2.0], [3.0]], 3: ['C', 'H'], 4: [['1', '2']]}
+    arrays = parse_cache.encode_sections('ffield', sections)
+    decoded = parse_cache.decode_sections('ffield', arrays)
+    assert decoded[1].tolist() == [1.0, 2.0]
+    assert decoded[2] == [[1.0, 2.0], [3.0]]
+    assert decoded[3] == ['C', 'H']
+    assert decoded[4] == [['1', '2']]
+    assert parse_cache.decode_sections('atom_types', arrays) == {}
+
+
+def test_reax_reader_cached_ffield(cached_dir_path):
+    ffield, atom_types = ReaxReader(cached_dir_path).read_ffield()
+    assert not sidecars(cached_dir_path, 'ffield')
+
+    reader = ReaxReader(cached_dir_path, use_cache=True)
+    reader.read_ffield()
+    assert len(sidecars(cached_dir_path, 'ffield')) == 1
+
+    cached_ffield, cached_atom_types = reader.read_ffield()
+    assert list(cached_ffield) == list(ffield)
+    for section in ffield:
+        assert type(cached_ffield[section]) == type(ffield[section])
+        assert np.array_equal(np.asarray(cached_ffield[section]), np.asarray(ffield[section]))
+    assert list(cached_atom_types) == list(atom_types)
+    for section in atom_types:
+        assert np.array_equal(np.asarray(cached_atom_types[section]), np.asarray(atom_types[section]))
+    assert cached_atom_types[3][36] == ['3', '14']
+
+
+def test_reax_reader_cached_fort99_invalidation(cached_dir_path):
+    reader = ReaxReader(cached_dir_path, use_cache=True)
+    fort99_results = reader.read_fort99_array()
+    stale_sidecar = sidecars(cached_dir_path, 'fort.99')[0]
+
+    # Cache hit
+    assert np.array_equal(reader.read_fort99_array(), fort99_results)
+
+    # Rewriting the source file changes its key: the stale sidecar is not used, and is replaced
+    fort99_path = os.path.join(cached_dir_path, 'fort.99')
+    with open(fort99_path, 'r') as in_file:
+        lines = in_file.readlines()
+    with open(fort99_path, 'w') as out_file:
+        out_file.writelines(lines[:-1])
+    assert np.array_equal(reader.read_fort99_array(), fort99_results[:-1])
+    assert sidecars(cached_dir_path, 'fort.99') != [stale_sidecar]
+    assert len(sidecars(cached_dir_path, 'fort.99')) == 1
+
+
+def test_reax_reader_corrupt_sidecar(cached_dir_path):
+    reader = ReaxReader(cached_dir_path, use_cache=True)
+    fort99_results = reader.read_fort99_array()
+    with open(sidecars(cached_dir_path, 'fort.99')[0], 'w') as out_file:
+        out_file.write("not a npz file")
+    assert np.array_equal(reader.read_fort99_array(), fort99_results)
@@ -3,10 +3,11 @@
 import os
 
 # 3rd party packages
+import numpy as np
 import pytest
 
 # Local source
-from parametrization_clean.infrastructure.utils.reax_reader import ReaxReader, write_ffield, read_array
+from parametrization_clean.infrastructure.utils.reax_reader import ReaxReader, write_ffield, read_array, parse_ffield
 from parametrization_clean.domain.utils.helpers import get_param
 
 
@@ -44,6 +45,28 @@ def test_reax_io_read_ffield(reax_io_obj):
     assert atom_types[3][37 - 1][1] == '14'
 
 
+@pytest.mark.usefixtures("training_set_dir_path")
+def test_parse_ffield(reax_io_obj, training_set_dir_path):
+    with open(os.path.join(training_set_dir_path, 'ffield'), 'r') as in_file:
+        lines = in_file.read().splitlines()
+    ffield, atom_types = reax_io_obj.read_ffield()
+    assert ffield[1].shape == (39,)
+    assert len(ffield[2]) == len(atom_types[2]) == 16
+    assert len(ffield[3]) == len(atom_types[3]) == 43
+    assert ffield[4].shape == (23, 6) and atom_types[4].shape == (23, 2)
+    assert ffield[5].shape == (105, 7) and atom_types[5].shape == (105, 3)
+    assert ffield[6].shape == (38, 7) and atom_types[6].shape == (38, 4)
+    assert ffield[7].shape == (9, 4) and atom_types[7].shape == (9, 3)
+
+    # Sections with a single row are still parsed as 2D arrays
+    hbond_line = len(lines) - 10
+    single_hbond_lines = lines[:hbond_line] + [" 1" + lines[hbond_line][3:], lines[hbond_line + 1]]
+    single_hbond_ffield, single_hbond_atom_types = parse_ffield(single_hbond_lines)
+    assert single_hbond_ffield[7].shape == (1, 4)
+    assert single_hbond_ffield[7].tolist() == ffield[7][:1].tolist()
+    assert single_hbond_atom_types[7].tolist() == atom_types[7][:1].tolist()
+
+
 def test_reax_io_read_fort99(reax_io_obj):
     fort99_results = reax_io_obj.read_fort99()
     assert fort99_results[0][1] == 1.0950
@@ -52,6 +75,39 @@ def test_reax_io_read_fort99(reax_io_obj):
     assert fort99_results[-1][0] == -0.7802
 
 
+def test_reax_io_read_fort99_array(reax_io_obj):
+    fort99_results = reax_io_obj.read_fort99_array()
+    assert fort99_results.dtype == np.float64
+    assert fort99_results.shape == (388, 3)
+    assert fort99_results.tolist() == reax_io_obj.read_fort99()
+    assert fort99_results[62][1] == 107.2990
+
+
+@pytest.mark.usefixtures("reax_output_dir_path")
+def test_reax_io_read_fort99_array_merged_columns(reax_output_dir_path):
+    fort99_path = os.path.join(reax_output_dir_path, 'fort.99')
+    # Large values fill their whole 12 character field, so there is no separating space between columns
+    merged_columns = "".join("{:12.4f}".format(value) for value in (-123456.7890, 1234567.8901, 0.0100,
+                                                                     9999999.9999, 9999999.9999))
+    with open(fort99_path, 'w') as out_file:
+        out_file.write("    FField value QM/Lit value  Weight      Error    Total error\n")
+        out_file.write("Energy +zno_12   /1 -zno_1    /1" + " " * 28 + merged_columns + "\n")
+        out_file.write("\n")
+        out_file.write("Charge atom:   2" + " " * 44 + "".join("{:12.4f}".format(value) for value in
+                                                            (1.0, 2.0, 3.0, 4.0, 5.0)) + "\n")
+    try:
+        fort99_results = ReaxReader(reax_output_dir_path).read_fort99_array()
+
+        # Lines that do not follow the fixed-width layout fall back to extracting the %.4f numbers
+        with open(fort99_path, 'a') as out_file:
+            out_file.write("short line 6.0000 7.0000 8.0000\n")
+        fallback_results = ReaxReader(reax_output_dir_path).read_fort99_array()
+    finally:
+        os.remove(fort99_path)
+    assert fort99_results.tolist() == [[-123456.7890, 1234567.8901, 0.0100], [1.0, 2.0, 3.0]]
+    assert fallback_results[1:].tolist() == [[1.0, 2.0, 3.0], [6.0, 7.0, 8.0]]
+
+
 def test_reax_io_read_params(reax_io_obj):
     param_keys, param_increments, param_bounds = reax_io_obj.read_params()
     assert param_keys[0] == [2, 14, 1]
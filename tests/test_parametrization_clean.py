@@ -2,13 +2,18 @@
 
 """Tests for `parametrization_clean` package."""
 
+import glob
+import json
 import os
 import shutil
+import time
 
+import numpy as np
 import pytest
 from click.testing import CliRunner
 
 from parametrization_clean.cli import main
+from parametrization_clean.infrastructure.repository.generation_manifest import GenerationManifest
 
 
 @pytest.mark.usefixtures("training_set_dir_path", "cli_output_path", "reax_output_dir_path")
@@ -57,7 +62,276 @@ def test_command_line_interface(training_set_dir_path, cli_output_path, reax_out
 
     # Teardown
     shutil.rmtree(os.path.join(population_path, "generation-3"))
+    os.remove(os.path.join(population_path, "generation-2", "generation-archive.npz"))
+    os.remove(os.path.join(population_path, "reference-files", "reference-data.npz"))
+    shutil.rmtree(os.path.join(population_path, "history"))
 
     result = runner.invoke(main, '')
     print(result)
     assert result.exception
+
+
+@pytest.mark.usefixtures("training_set_dir_path", "reax_output_dir_path")
+def test_command_line_interface_watch(training_set_dir_path, reax_output_dir_path):
+    """Test the CLI command staging results of a generation's children."""
+    training_path = str(training_set_dir_path)
+    population_path = str(reax_output_dir_path)
+    config_path = str(os.path.join(os.path.abspath(os.path.join(__file__, "../../")),
+                                   "tests", "integration", "config", "cli_config.json"))
+
+    runner = CliRunner()
+    try:
+        result = runner.invoke(main, 'watch --generation_number 1 --training_path "{}" --population_path "{}" '
+                                     '--config_path "{}" --timeout 3 --poll_interval 0.2'
+                               .format(training_path, population_path, config_path))
+        assert result.exit_code == 0
+        assert not result.exception
+        # cli_config.json expects 10 children; only 4 exist in generation-1
+        assert "{}: {}".format("WARNING", "4 of 10 children of generation directory {} were staged"
+                               .format(os.path.join(population_path, "generation-1"))) in result.output
+        assert len(glob.glob(os.path.join(population_path, "generation-1", "child-*", "staged-result.npz"))) == 4
+    finally:
+        for staged_result_path in glob.glob(os.path.join(population_path, "generation-1", "child-*",
+                                                         "staged-result.npz")):
+            os.remove(staged_result_path)
+
+    help_result = runner.invoke(main, ['watch', '--help'])
+    assert help_result.exit_code == 0
+    assert "Usage: cli watch [OPTIONS]" in help_result.output
+
+
+@pytest.mark.usefixtures("reax_output_dir_path")
+def test_command_line_interface_status(reax_output_dir_path):
+    """Test the CLI command showing the status of a generation's children."""
+    population_path = str(reax_output_dir_path)
+    generation_path = os.path.join(population_path, "generation-1")
+
+    runner = CliRunner()
+    result = runner.invoke(main, ['status', '-g', '1', '-p', population_path])
+    assert result.exit_code != 0
+    assert "No manifest found for generation 1" in result.output
+
+    manifest = GenerationManifest(generation_path)
+    try:
+        manifest.create(1, {0: {'status': 'written'}, 1: {'status': 'failed', 'error': "OSError: Disk quota exceeded"}})
+        manifest.update({0: {'status': 'done', 'cost': 12.5}})
+        result = runner.invoke(main, ['status', '-g', '1', '-p', population_path, '--children'])
+        assert result.exit_code == 0
+        assert not result.exception
+        assert "Generation 1: 2 children" in result.output
+        assert "  done: 1" in result.output
+        assert "  failed: 1" in result.output
+        assert "child-0\tdone\t12.500\t" in result.output
+        assert "child-1\tfailed\t-\tOSError: Disk quota exceeded" in result.output
+    finally:
+        for file_name in (GenerationManifest.MANIFEST_NAME, GenerationManifest.LOCK_NAME):
+            if os.path.isfile(os.path.join(generation_path, file_name)):
+                os.remove(os.path.join(generation_path, file_name))
+
+
+@pytest.mark.usefixtures("training_set_dir_path", "reax_output_dir_path")
+def test_command_line_interface_run(training_set_dir_path, reax_output_dir_path, tmp_path):
+    """Test the CLI command running several generations in one process."""
+    training_path = str(training_set_dir_path)
+    population_path = str(tmp_path / "population")
+    config_path = str(os.path.join(os.path.abspath(os.path.join(__file__, "../../")),
+                                   "tests", "integration", "config", "cli_config.json"))
+    # "Evaluates" a generation by copying the results of the first 4 children of an evaluated generation
+    evaluate_command = ('for i in 0 1 2 3; do cp "' + os.path.join(str(reax_output_dir_path), "generation-1") +
+                        '/child-$i/fort.99" "{generation_path}/child-$i/"; done')
+
+    runner = CliRunner()
+    result = runner.invoke(main, ['run', '-g', '1', '-m', '2', '-t', training_path, '-p', population_path,
+                                  '-c', config_path, '-e', evaluate_command])
+    assert result.exit_code == 0
+    assert not result.exception
+    assert "Running generations 1 to 2 at: {}".format(population_path) in result.output
+    assert "{}: {}".format("SUCCESS", "Generation successfully written at {}"
+                           .format(os.path.join(population_path, "generation-3"))) in result.output
+    for generation_number in (1, 2):
+        assert os.path.isfile(os.path.join(population_path, "generation-{}".format(generation_number),
+                                           "generation-archive.npz"))
+    assert not os.path.exists(os.path.join(population_path, "generation-3", "generation-archive.npz"))
+    with open(os.path.join(population_path, "00-generation-vs-error.txt"), 'r') as in_file:
+        assert len(in_file.readlines()) == 3
+
+    # Failed evaluation -> stops before propagating the next generation
+    result = runner.invoke(main, ['run', '-g', '3', '-m', '4', '-t', training_path, '-p', population_path,
+                                  '-c', config_path, '-e', 'exit 3'])
+    assert "SYSTEM_ERROR: Evaluation command 'exit 3' exited with status 3." in result.output
+    assert os.path.isdir(os.path.join(population_path, "generation-3"))
+    assert not os.path.exists(os.path.join(population_path, "generation-4"))
+
+    result = runner.invoke(main, ['run', '-g', '3', '-m', '2', '-t', training_path, '-p', population_path])
+    assert result.exit_code != 0
+    assert "must be at least the generation number (3)" in result.output
+
+
+@pytest.mark.usefixtures("training_set_dir_path", "reax_output_dir_path")
+def test_command_line_interface_evaluate(training_set_dir_path, reax_output_dir_path, tmp_path):
+    """Test the CLI commands running ReaxFF optimizations with the local runner."""
+    training_path = str(training_set_dir_path)
+    population_path = str(tmp_path / "population")
+    with open(os.path.join(os.path.abspath(os.path.join(__file__, "../../")),
+                           "tests", "integration", "config", "cli_config.json"), 'r') as in_file:
+        config = json.load(in_file)
+    # Stand-in for ReaxFF: "optimizes" a child by copying the results of an evaluated child
+    fort99_path = os.path.join(str(reax_output_dir_path), "generation-1", "child-0", "fort.99")
+    config['runner_settings'] = {'reax_command': 'cp "{}" fort.99'.format(fort99_path), 'num_run_workers': 4}
+    config_path = str(tmp_path / "config.json")
+    with open(config_path, 'w') as out_file:
+        json.dump(config, out_file)
+
+    runner = CliRunner()
+    result = runner.invoke(main, ['run', '-g', '1', '-m', '1', '-t', training_path, '-p', population_path,
+                                  '-c', config_path, '--local'])
+    assert result.exit_code == 0
+    assert not result.exception
+    assert "SUCCESS: Generation successfully written at {}".format(os.path.join(population_path, "generation-2")) \
+        in result.output
+    generation_path = os.path.join(population_path, "generation-1")
+    assert len(glob.glob(os.path.join(generation_path, "child-*", "staged-result.npz"))) == 10
+    assert GenerationManifest(generation_path).summary()['done'] == 10
+
+    result = runner.invoke(main, ['evaluate', '-g', '2', '-t', training_path, '-p', population_path,
+                                  '-c', config_path])
+    assert result.exit_code == 0
+    assert "SUCCESS: All 10 children of generation directory {} were evaluated."\
+        .format(os.path.join(population_path, "generation-2")) in result.output
+
+    config['runner_settings'] = {'reax_command': 'exit 1', 'max_retries': 0}
+    with open(config_path, 'w') as out_file:
+        json.dump(config, out_file)
+    result = runner.invoke(main, ['evaluate', '-g', '2', '-t', training_path, '-p', population_path,
+                                  '-c', config_path])
+    assert "SYSTEM_ERROR: 10 of 10 children of generation directory" in result.output
+    assert GenerationManifest(os.path.join(population_path, "generation-2")).summary()['failed'] == 10
+
+    result = runner.invoke(main, ['run', '-m', '1', '-t', training_path, '-p', population_path, '-l', '-e', 'true'])
+    assert result.exit_code != 0
+    assert "cannot be combined with --local" in result.output
+
+
+@pytest.mark.usefixtures("training_set_dir_path", "reax_output_dir_path")
+def test_command_line_interface_evaluation_cache(training_set_dir_path, reax_output_dir_path, tmp_path):
+    """Test that children already evaluated in previous generations are not run again."""
+    training_path = str(training_set_dir_path)
+    population_path = str(tmp_path / "population")
+    with open(os.path.join(os.path.abspath(os.path.join(__file__, "../../")),
+                           "tests", "integration", "config", "cli_config.json"), 'r') as in_file:
+        config = json.load(in_file)
+    fort99_path = os.path.join(str(reax_output_dir_path), "generation-1", "child-0", "fort.99")
+    config['ga_settings']['use_elitism'] = True
+    config['runner_settings'] = {'reax_command': 'cp "{}" fort.99'.format(fort99_path), 'num_run_workers': 4}
+    config['repository_settings'] = {'use_evaluation_cache': True}
+    config_path = str(tmp_path / "config.json")
+    with open(config_path, 'w') as out_file:
+        json.dump(config, out_file)
+
+    runner = CliRunner()
+    result = runner.invoke(main, ['run', '-g', '1', '-m', '2', '-t', training_path, '-p', population_path,
+                                  '-c', config_path, '--local'])
+    assert result.exit_code == 0
+    assert not result.exception
+
+    generation_path = os.path.join(population_path, "generation-2")
+    cached_child_dirs = glob.glob(os.path.join(generation_path, "child-*", "cached-result.npz"))
+    # At least the two elites of generation 1 are served from the cache...
+    assert len(cached_child_dirs) >= 2
+    manifest = GenerationManifest(generation_path).read()
+    assert sum(child['status'] == 'cached' for child in manifest['children'].values()) == len(cached_child_dirs)
+    # ...and are not run, while the results of all children are read back
+    for cached_result_path in cached_child_dirs:
+        assert not os.path.exists(os.path.join(os.path.dirname(cached_result_path), "fort.99"))
+    generation_3_path = os.path.join(population_path, "generation-3")
+    assert "SUCCESS: Generation successfully written at {}".format(generation_3_path) in result.output
+    with np.load(os.path.join(generation_path, "generation-archive.npz")) as archive:
+        assert not archive['failed'].any()
+
+
+@pytest.mark.usefixtures("training_set_dir_path", "reax_output_dir_path")
+def test_command_line_interface_over_provisioning(training_set_dir_path, reax_output_dir_path, tmp_path):
+    """Test that over-provisioned generations are closed without waiting for their stragglers."""
+    training_path = str(training_set_dir_path)
+    population_path = str(tmp_path / "population")
+    with open(os.path.join(os.path.abspath(os.path.join(__file__, "../../")),
+                           "tests", "integration", "config", "cli_config.json"), 'r') as in_file:
+        config = json.load(in_file)
+    fort99_path = os.path.join(str(reax_output_dir_path), "generation-1", "child-0", "fort.99")
+    config['ga_settings']['num_extra_children'] = 2
+    # Children 10 and 11 straggle
+    config['runner_settings'] = {'reax_command': 'case "$PWD" in */child-1[01]) sleep 30;; esac; cp "{}" fort.99'
+                                 .format(fort99_path), 'num_run_workers': 12}
+    config_path = str(tmp_path / "config.json")
+    with open(config_path, 'w') as out_file:
+        json.dump(config, out_file)
+
+    runner = CliRunner()
+    start = time.monotonic()
+    result = runner.invoke(main, ['run', '-g', '1', '-m', '1', '-t', training_path, '-p', population_path,
+                                  '-c', config_path, '--local'])
+    assert time.monotonic() - start < 20.0
+    assert result.exit_code == 0
+    assert not result.exception
+    generation_path = os.path.join(population_path, "generation-1")
+    manifest = GenerationManifest(generation_path).read()
+    assert sorted(case_number for case_number, child in manifest['children'].items() if child.get('late')) == [10, 11]
+    assert GenerationManifest(generation_path).summary()['done'] == 10
+    with open(os.path.join(generation_path, "00-gen-summary.txt"), 'r') as in_file:
+        summary = in_file.read()
+    assert "Number of failed cases: 2.000" in summary
+    assert "Number of late cases (generation closed before they completed): 2" in summary
+    assert len(glob.glob(os.path.join(population_path, "generation-2", "child-*"))) == 12
+
+    # Watch that times out -> the generation is not closed: no child is late (example/main.sh relies on it to decide
+    # whether the remaining jobs can be cancelled)
+    result = runner.invoke(main, ['watch', '-g', '2', '-t', training_path, '-p', population_path,
+                                  '-c', config_path, '--timeout', '0.2', '--poll_interval', '0.1'])
+    assert "were staged before the watch ended" in result.output
+    result = runner.invoke(main, ['status', '-g', '2', '-p', population_path, '--children'])
+    assert "GenerationClosed" not in result.output
+
+    # Watched generation closed at its deadline
+    config['runner_settings']['generation_deadline'] = 0.5
+    with open(config_path, 'w') as out_file:
+        json.dump(config, out_file)
+    result = runner.invoke(main, ['watch', '-g', '2', '-t', training_path, '-p', population_path,
+                                  '-c', config_path, '--poll_interval', '0.1'])
+    assert result.exit_code == 0
+    assert "0 of 12 children of generation directory {} were staged; the generation was closed before the 12 " \
+           "others completed.".format(os.path.join(population_path, "generation-2")) in result.output
+    assert GenerationManifest(os.path.join(population_path, "generation-2")).summary()['failed'] == 12
+    result = runner.invoke(main, ['status', '-g', '2', '-p', population_path, '--children'])
+    assert result.output.count("GenerationClosed") == 12
+
+
+@pytest.mark.usefixtures("training_set_dir_path", "reax_output_dir_path")
+def test_command_line_interface_steady(training_set_dir_path, reax_output_dir_path, tmp_path):
+    """Test the CLI command running the steady-state GA with the local runner."""
+    training_path = str(training_set_dir_path)
+    population_path = str(tmp_path / "population")
+    with open(os.path.join(os.path.abspath(os.path.join(__file__, "../../")),
+                           "tests", "integration", "config", "cli_config.json"), 'r') as in_file:
+        config = json.load(in_file)
+    fort99_path = os.path.join(str(reax_output_dir_path), "generation-1", "child-0", "fort.99")
+    config['runner_settings'] = {'reax_command': 'cp "{}" fort.99'.format(fort99_path), 'num_run_workers': 4}
+    config_path = str(tmp_path / "config.json")
+    with open(config_path, 'w') as out_file:
+        json.dump(config, out_file)
+
+    runner = CliRunner()
+    result = runner.invoke(main, ['steady', '-n', '15', '-t', training_path, '-p', population_path,
+                                  '-c', config_path])
+    assert result.exit_code == 0
+    assert not result.exception
+    steady_state_path = os.path.join(population_path, "steady-state")
+    assert "SUCCESS: 15 of 15 evaluations at {} succeeded; best cost".format(steady_state_path) in result.output
+    assert len(glob.glob(os.path.join(steady_state_path, "child-*", "fort.99"))) == 15
+
+    config['runner_settings'] = {'reax_command': 'exit 1', 'max_retries': 0}
+    with open(config_path, 'w') as out_file:
+        json.dump(config, out_file)
+    result = runner.invoke(main, ['steady', '-n', '15', '-t', training_path, '-p', population_path,
+                                  '-c', config_path])
+    # The initial population fails -> nothing to breed from
+    assert "SYSTEM_ERROR: None of the 10 evaluations at {} succeeded.".format(steady_state_path) in result.output
@@ -0,0 +1,88 @@
+# Standard library
+from unittest import mock
+
+# 3rd party packages
+import numpy as np
+import pytest
+
+# Local source
+from parametrization_clean.domain.mutation.nakata import NakataMutate
+from parametrization_clean.domain.population_matrix import PopulationMatrix, as_population_matrix
+from parametrization_clean.use_case.generation_loop import GenerationLoop
+from parametrization_clean.use_case.port.evaluator import IEvaluator
+from tests.use_case.test_population_propagator import all_settings, population_repository, root_individual
+
+
+class SumOfSquaresEvaluator(IEvaluator):
+    """Evaluator with cost = sum of squared parameters; records the evaluated generations."""
+
+    def __init__(self):
+        self.generation_numbers = []
+
+    def evaluate(self, population, generation_number):
+        self.generation_numbers.append(generation_number)
+        population = as_population_matrix(population)
+        reax_energies = np.square(population.params)
+        return PopulationMatrix(population.params, reax_energies, reax_energies.sum(axis=1))
+
+
+@pytest.fixture()
+def generation_loop(all_settings, population_repository):
+    all_settings.strategy_settings.initialization_strategy = NakataMutate
+    return GenerationLoop(all_settings, population_repository, SumOfSquaresEvaluator())
+
+
+def test_generation_loop_initialize(generation_loop, population_repository):
+    population = generation_loop.initialize()
+    assert isinstance(population, PopulationMatrix)
+    assert len(population) == 4
+    assert population.num_params == 5
+    assert population_repository.current_generation_number == 1
+
+
+def test_generation_loop_run(generation_loop, population_repository):
+    on_generation = mock.MagicMock()
+    evaluated_population = generation_loop.run(num_generations=5, on_generation=on_generation)
+
+    assert generation_loop.evaluator.generation_numbers == [1, 2, 3, 4, 5]
+    assert population_repository.current_generation_number == 5
+    assert len(evaluated_population) == 4
+    assert not np.isnan(evaluated_population.costs).any()
+    assert [call[0][0] for call in on_generation.call_args_list] == [1, 2, 3, 4, 5]
+    # Standalone GA -> no ANN training history
+    assert all(call[0][2] is None for call in on_generation.call_args_list)
+
+
+def test_generation_loop_reseed(generation_loop, root_individual):
+    # First generation -> reseeded around the root individual
+    individual = generation_loop.reseed()
+    assert len(individual.params) == 5
+    assert individual.params != root_individual.root_params
+
+    parents = generation_loop.evaluator.evaluate(generation_loop.initialize(), 1)
+    individual = generation_loop.reseed(parents)
+    assert len(individual.params) == 5
+    assert individual.cost is None
+    assert not any(np.allclose(individual.params, params) for params in parents.params)
+
+
+def test_generation_loop_propagate_with_neural_network(generation_loop, all_settings):
+    generation_loop.use_neural_network = True
+    generation_loop.num_populations_to_train_on = 2
+    parents = generation_loop.evaluator.evaluate(generation_loop.initialize(), 1)
+
+    with mock.patch('parametrization_clean.use_case.nested_ga_with_ann.GeneticNeuralNetPropagator') \
+            as propagator_mock:
+        propagator_mock.return_value.execute.return_value = (parents, "model", "history")
+        # Not enough generations elapsed to train the ANN
+        children, history = generation_loop.propagate(parents, generation_number=2)
+        propagator_mock.assert_not_called()
+        assert history is None
+        assert len(children) == 4
+
+        children, history = generation_loop.propagate(parents, generation_number=3)
+        assert history == "history"
+        assert generation_loop.model == "model"
+        # The model of the previous nested GA run is trained further
+        generation_loop.propagate(parents, generation_number=4)
+        assert propagator_mock.call_args_list[-1][0][2] == "model"
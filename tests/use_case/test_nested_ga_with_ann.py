@@ -11,6 +11,7 @@ from parametrization_clean.domain.mutation.gauss import GaussianMutate
 from parametrization_clean.domain.crossover.double_pareto import DoubleParetoCross
 from parametrization_clean.domain.adaptation.xiao import XiaoAdapt
 from parametrization_clean.domain.cost.reax_error import ReaxError
+from parametrization_clean.domain.population_matrix import PopulationMatrix
 
 # Fixtures
 from tests.use_case.test_population_propagator import root_individual
@@ -31,6 +32,7 @@ def all_settings(all_settings_mock, param_bounds):
     all_settings_mock.ga_settings.crossover_rate = 0.80
     all_settings_mock.ga_settings.use_elitism = True
     all_settings_mock.ga_settings.use_adaptation = False
+    all_settings_mock.ga_settings.num_extra_children = 0
 
     all_settings_mock.mutation_settings.gauss_std = [0.10]
     all_settings_mock.mutation_settings.gauss_frac = [1.0]
@@ -70,7 +72,7 @@ def test_genetic_neural_net_propagator_init(repository_mock, all_settings, get_i
     # Conditional import machinery
     nested_ga_with_ann = pytest.importorskip('parametrization_clean.use_case.nested_ga_with_ann')
 
-    repository_mock.get_previous_n_populations = mock.MagicMock(return_value=get_individuals*10)
+    repository_mock.get_history = mock.MagicMock(return_value=PopulationMatrix.from_individuals(get_individuals*10))
     repository_mock.get_root_individual = mock.MagicMock(return_value=root_individual)
     propagator = nested_ga_with_ann.GeneticNeuralNetPropagator(all_settings, repository_mock)
 
@@ -94,7 +96,7 @@ def test_genetic_neural_net_propagator_train_neural_net(repository_mock, all_set
     # Conditional import machinery
     nested_ga_with_ann = pytest.importorskip('parametrization_clean.use_case.nested_ga_with_ann')
 
-    repository_mock.get_previous_n_populations = mock.MagicMock(return_value=get_individuals)
+    repository_mock.get_history = mock.MagicMock(return_value=PopulationMatrix.from_individuals(get_individuals))
     repository_mock.get_root_individual = mock.MagicMock(return_value=root_individual)
     propagator = nested_ga_with_ann.GeneticNeuralNetPropagator(all_settings, repository_mock)
 
@@ -114,7 +116,7 @@ def test_genetic_neural_net_propagator_update_costs(repository_mock, all_setting
     for individual in get_individuals:
         individual.cost = individual.total_error(root_individual)
 
-    repository_mock.get_previous_n_populations = mock.MagicMock(return_value=get_individuals)
+    repository_mock.get_history = mock.MagicMock(return_value=PopulationMatrix.from_individuals(get_individuals))
     repository_mock.get_root_individual = mock.MagicMock(return_value=root_individual)
     propagator = nested_ga_with_ann.GeneticNeuralNetPropagator(all_settings, repository_mock)
 
@@ -146,7 +148,7 @@ def test_genetic_neural_net_propagator_propagate_first(repository_mock, all_sett
     for individual in get_individuals:
         individual.cost = individual.total_error(root_individual)
 
-    repository_mock.get_previous_n_populations = mock.MagicMock(return_value=get_individuals)
+    repository_mock.get_history = mock.MagicMock(return_value=PopulationMatrix.from_individuals(get_individuals))
     repository_mock.get_root_individual = mock.MagicMock(return_value=root_individual)
     propagator = nested_ga_with_ann.GeneticNeuralNetPropagator(all_settings, repository_mock)
 
@@ -168,7 +170,7 @@ def test_genetic_neural_net_propagator_propagate_remaining(repository_mock, all_
     for individual in get_individuals:
         individual.cost = individual.total_error(root_individual)
 
-    repository_mock.get_previous_n_populations = mock.MagicMock(return_value=get_individuals)
+    repository_mock.get_history = mock.MagicMock(return_value=PopulationMatrix.from_individuals(get_individuals))
     repository_mock.get_root_individual = mock.MagicMock(return_value=root_individual)
     propagator = nested_ga_with_ann.GeneticNeuralNetPropagator(all_settings, repository_mock)
 
@@ -188,7 +190,7 @@ def test_genetic_neural_propagator_final_ann_accuracy_is_poor(repository_mock, a
     for individual in get_individuals:
         individual.cost = individual.total_error(root_individual)
 
-    repository_mock.get_previous_n_populations = mock.MagicMock(return_value=get_individuals)
+    repository_mock.get_history = mock.MagicMock(return_value=PopulationMatrix.from_individuals(get_individuals))
     repository_mock.get_root_individual = mock.MagicMock(return_value=root_individual)
     propagator = nested_ga_with_ann.GeneticNeuralNetPropagator(all_settings, repository_mock)
 
@@ -208,7 +210,7 @@ def test_genetic_neural_net_propagator_execute(repository_mock, all_settings,
     for individual in get_individuals:
         individual.cost = individual.total_error(root_individual)
 
-    repository_mock.get_previous_n_populations = mock.MagicMock(return_value=get_individuals)
+    repository_mock.get_history = mock.MagicMock(return_value=PopulationMatrix.from_individuals(get_individuals))
     repository_mock.get_root_individual = mock.MagicMock(return_value=root_individual)
     propagator = nested_ga_with_ann.GeneticNeuralNetPropagator(all_settings, repository_mock)
 
@@ -216,3 +218,39 @@ def test_genetic_neural_net_propagator_execute(repository_mock, all_settings,
     assert len(final_generation) == 4
     assert model
     assert history
+
+
+@pytest.mark.usefixtures('get_individuals')
+@mock.patch('parametrization_clean.use_case.port.population_repository.IPopulationRepository')
+def test_genetic_neural_net_propagator_warm_start(repository_mock, all_settings,
+                                                  get_individuals, root_individual):
+    # Conditional import machinery
+    nested_ga_with_ann = pytest.importorskip('parametrization_clean.use_case.nested_ga_with_ann')
+
+    repository_mock.get_history = mock.MagicMock(return_value=PopulationMatrix.from_individuals(get_individuals))
+    repository_mock.get_root_individual = mock.MagicMock(return_value=root_individual)
+    model, _ = nested_ga_with_ann.GeneticNeuralNetPropagator(all_settings, repository_mock).train_neural_net()
+    train_stats = model.train_stats
+
+    # Model of the previous generation is trained further instead of building a new one...
+    repository_mock.get_history = mock.MagicMock(
+        return_value=PopulationMatrix.from_individuals(get_individuals[::-1]).take(slice(0, -1)))
+    propagator = nested_ga_with_ann.GeneticNeuralNetPropagator(all_settings, repository_mock, model=model)
+    with mock.patch.object(propagator.neural_net, 'build') as build_mock:
+        warm_model, _ = propagator.train_neural_net()
+    build_mock.assert_not_called()
+    assert warm_model is model
+    assert propagator.model is model
+    # ...with the input normalization its weights were fitted with, not the one of the new training data
+    assert model.train_stats is train_stats
+    assert propagator.neural_net.train_stats is train_stats
+    assert propagator.neural_net.columns_to_remove.equals(model.columns_to_remove)
+    # Models without a stored input normalization are not reused
+    del model.train_stats
+    assert not propagator.neural_net.is_compatible(model)
+
+    # Incompatible model (e.g., different number of parameters) -> new model
+    incompatible_model = mock.MagicMock(input_shape=(None, 1), output_shape=(None, 1))
+    propagator = nested_ga_with_ann.GeneticNeuralNetPropagator(all_settings, repository_mock, model=incompatible_model)
+    new_model, _ = propagator.train_neural_net()
+    assert new_model is not incompatible_model
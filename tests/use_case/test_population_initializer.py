@@ -54,6 +54,16 @@ def test_population_initializer(population_repository_mock, all_settings, root_i
         assert case.params != root_individual.root_params
 
 
+@mock.patch('parametrization_clean.use_case.port.population_repository.IPopulationRepository')
+def test_population_initializer_extra_children(population_repository_mock, all_settings, root_individual):
+    all_settings.ga_settings.num_extra_children = 2
+    population_repository_mock.get_root_individual = mock.MagicMock(return_value=root_individual)
+    initializer = PopulationInitializer(population_repository=population_repository_mock,
+                                        settings_repository=all_settings)
+    assert initializer.population_size == 4
+    assert len(initializer.execute()) == 6
+
+
 @mock.patch('parametrization_clean.use_case.port.population_repository.IPopulationRepository')
 @pytest.mark.usefixtures('param_bounds')
 def test_population_initializer_with_kwargs(population_repository_mock, all_settings, param_bounds, root_individual):
@@ -4,10 +4,12 @@ from typing import List
 from unittest import mock
 
 # 3rd party packages
+import numpy as np
 import pytest
 
 # Local source
 from parametrization_clean.domain.individual import Individual
+from parametrization_clean.domain.population_matrix import PopulationMatrix
 from parametrization_clean.domain.selection.tournament import TournamentSelect
 from parametrization_clean.domain.mutation.gauss import GaussianMutate
 from parametrization_clean.domain.crossover.double_pareto import DoubleParetoCross
@@ -61,6 +63,7 @@ def all_settings(all_settings_mock, param_bounds):
     all_settings_mock.ga_settings.use_elitism = True
     all_settings_mock.ga_settings.use_adaptation = False
     all_settings_mock.ga_settings.use_neural_network = False
+    all_settings_mock.ga_settings.num_extra_children = 0
 
     all_settings_mock.mutation_settings.gauss_std = [0.10]
     all_settings_mock.mutation_settings.gauss_frac = [1.0]
@@ -84,6 +87,20 @@ def all_settings(all_settings_mock, param_bounds):
     all_settings_mock.adaptation_settings.xiao_min_mutation_rate = 0.1
     all_settings_mock.adaptation_settings.xiao_scale = 0.4
 
+    all_settings_mock.repository_settings.use_parse_cache = False
+    all_settings_mock.repository_settings.num_read_workers = 1
+    all_settings_mock.repository_settings.num_write_workers = 2
+    all_settings_mock.repository_settings.file_materialization = "copy"
+    all_settings_mock.repository_settings.history_dtype = "float64"
+    all_settings_mock.repository_settings.use_evaluation_cache = False
+
+    all_settings_mock.runner_settings.reax_command = "reac"
+    all_settings_mock.runner_settings.num_run_workers = 2
+    all_settings_mock.runner_settings.run_timeout = 1800
+    all_settings_mock.runner_settings.max_retries = 1
+    all_settings_mock.runner_settings.generation_deadline = None
+    all_settings_mock.runner_settings.reseed_stragglers = False
+
     return all_settings_mock
 
 
@@ -277,3 +294,48 @@ def test_population_propagator_execute(population_repository_mock, get_individua
     children = propagator.execute(parents)
 
     assert len(children) == 4
+
+    # Over-provisioned generation; children are bred in pairs but exactly `num_children` are returned
+    all_settings.ga_settings.num_extra_children = 1
+    propagator = PopulationPropagator(all_settings, population_repository_mock)
+    assert propagator.num_children == 5
+    assert len(propagator.execute(parents)) == 5
+
+
+@mock.patch('parametrization_clean.use_case.port.population_repository.IPopulationRepository')
+@pytest.mark.usefixtures('get_individuals')
+def test_population_propagator_execute_population_matrix(population_repository_mock, get_individuals,
+                                                         root_individual, all_settings):
+    population_repository_mock.get_root_individual = mock.MagicMock(return_value=root_individual)
+
+    for individual in get_individuals:
+        individual.cost = individual.total_error(root_individual)
+    propagator = PopulationPropagator(all_settings, population_repository_mock)
+    parents = PopulationMatrix.from_individuals(get_individuals)
+
+    # The matrix is propagated row-wise, without any Individual objects
+    with mock.patch.object(PopulationMatrix, 'to_individuals') as to_individuals_mock:
+        children = propagator.execute(parents)
+    to_individuals_mock.assert_not_called()
+
+    assert isinstance(children, PopulationMatrix)
+    assert len(children) == 4
+    assert children.params.shape == parents.params.shape
+    # Elite parents are carried over with their costs and ReaxFF energies
+    best_row = parents.best_index()
+    assert children.costs[0] == min(individual.cost for individual in get_individuals)
+    assert children.reax_energies[0].tolist() == parents.reax_energies[best_row].tolist()
+    assert children.params[0].tolist() == parents.params[best_row].tolist()
+
+    # Children that are neither crossed nor mutated are copies of their parent, evaluations included
+    propagator.crossover_rate, propagator.mutation_rates = 0.0, [0.0, 0.0]
+    children = propagator.execute(parents)
+    assert not np.isnan(children.costs).any()
+    for child_params, child_cost in zip(children.params.tolist(), children.costs.tolist()):
+        assert child_cost == parents.costs[parents.params.tolist().index(child_params)]
+
+    # Crossed and mutated children are not evaluated
+    propagator.crossover_rate, propagator.mutation_rates = 1.0, [1.0, 1.0]
+    children = propagator.execute(parents)
+    assert np.isnan(children.costs[2:]).all()
+    assert np.isnan(children.reax_energies[2:]).all()
@@ -0,0 +1,102 @@
+# Standard library
+import threading
+import time
+
+# 3rd party packages
+import numpy as np
+import pytest
+
+# Local source
+from parametrization_clean.domain.individual import Individual
+from parametrization_clean.domain.mutation.nakata import NakataMutate
+from parametrization_clean.use_case.port.evaluator import IEvaluator
+from parametrization_clean.use_case.steady_state_loop import SteadyStateLoop
+from tests.use_case.test_population_propagator import all_settings, population_repository, root_individual
+
+
+class SlowSumOfSquaresEvaluator(IEvaluator):
+    """Evaluator with cost = sum of squared parameters; evaluation `slow_case_number` takes `slow_time` seconds, and
+    every other evaluation listed in `failed_case_numbers` fails.
+    """
+
+    def __init__(self, slow_case_number=None, slow_time=0.0, failed_case_numbers=()):
+        self.slow_case_number = slow_case_number
+        self.slow_time = slow_time
+        self.failed_case_numbers = failed_case_numbers
+        self.lock = threading.Lock()
+        self.num_running = 0
+        self.max_num_running = 0
+
+    def evaluate(self, population, generation_number):
+        raise NotImplementedError
+
+    def evaluate_individual(self, individual, case_number):
+        with self.lock:
+            self.num_running += 1
+            self.max_num_running = max(self.max_num_running, self.num_running)
+        time.sleep(self.slow_time if case_number == self.slow_case_number else 0.01)
+        with self.lock:
+            self.num_running -= 1
+        if case_number in self.failed_case_numbers:
+            return None
+        evaluated_individual = Individual(list(individual.params), root_individual=individual.root_individual)
+        evaluated_individual.reax_energies = np.square(individual.params).tolist()
+        evaluated_individual.cost = float(np.square(individual.params).sum())
+        return evaluated_individual
+
+
+@pytest.fixture()
+def settings(all_settings):
+    all_settings.strategy_settings.initialization_strategy = NakataMutate
+    return all_settings
+
+
+def test_steady_state_loop_run(settings, population_repository):
+    evaluator = SlowSumOfSquaresEvaluator(failed_case_numbers=(1, 7))
+    steady_state_loop = SteadyStateLoop(settings, population_repository, evaluator, num_workers=3)
+    evaluations = []
+    pool = steady_state_loop.run(num_evaluations=20, on_evaluation=lambda case_number, individual:
+                                 evaluations.append((case_number, individual)))
+
+    assert population_repository.current_generation_number == 1
+    assert sorted(case_number for case_number, _ in evaluations) == list(range(20))
+    assert sorted(case_number for case_number, individual in evaluations if individual is None) == [1, 7]
+    assert evaluator.max_num_running <= 3
+    # Pool = best evaluated individuals
+    assert len(pool) == 4
+    evaluated_costs = sorted(individual.cost for _, individual in evaluations if individual is not None)
+    assert sorted(individual.cost for individual in pool) == evaluated_costs[:4]
+
+
+def test_steady_state_loop_does_not_wait_for_slow_evaluations(settings, population_repository):
+    evaluator = SlowSumOfSquaresEvaluator(slow_case_number=0, slow_time=1.0)
+    steady_state_loop = SteadyStateLoop(settings, population_repository, evaluator, num_workers=2)
+    evaluations = []
+    start = time.monotonic()
+    steady_state_loop.run(num_evaluations=12, on_evaluation=lambda case_number, _: evaluations.append(case_number))
+
+    # Every other evaluation (initial population and children) runs in the other slot meanwhile
+    assert time.monotonic() - start < 1.0 + 0.5
+    assert evaluations[-1] == 0
+    assert sorted(evaluations) == list(range(12))
+    assert evaluator.max_num_running == 2
+
+
+def test_steady_state_loop_seeded_pool(settings, population_repository, root_individual):
+    pool = [SlowSumOfSquaresEvaluator().evaluate_individual(Individual.from_root_individual(root_individual), 0)
+            for _ in range(2)]
+    steady_state_loop = SteadyStateLoop(settings, population_repository, SlowSumOfSquaresEvaluator(),
+                                        num_workers=2, pool=pool)
+    evaluations = []
+    steady_state_loop.run(num_evaluations=4, on_evaluation=lambda case_number, individual:
+                          evaluations.append(individual))
+    # No initial population -> children are bred right away
+    assert len(evaluations) == 4
+    assert len(steady_state_loop.propagator.pool) == 4
+
+
+def test_steady_state_loop_all_failed(settings, population_repository):
+    evaluator = SlowSumOfSquaresEvaluator(failed_case_numbers=range(4))
+    steady_state_loop = SteadyStateLoop(settings, population_repository, evaluator, num_workers=2)
+    # Nothing to breed from -> stops after the initial population
+    assert steady_state_loop.run(num_evaluations=10) == []
@@ -0,0 +1,60 @@
+# Standard library
+
+# 3rd party packages
+import pytest
+
+# Local source
+from parametrization_clean.domain.individual import Individual
+from parametrization_clean.use_case.steady_state_propagator import SteadyStatePropagator
+from tests.use_case.test_population_propagator import all_settings, population_repository, root_individual
+
+
+@pytest.fixture()
+@pytest.mark.usefixtures('get_individuals')
+def evaluated_individuals(get_individuals, root_individual):
+    for individual in get_individuals:
+        individual.root_individual = root_individual
+        individual.cost = individual.total_error(root_individual)
+    return get_individuals
+
+
+def test_steady_state_propagator_init(all_settings, population_repository, evaluated_individuals):
+    propagator = SteadyStatePropagator(all_settings, population_repository)
+    assert propagator.pool_size == 4
+    assert propagator.min_pool_size == 2
+    assert propagator.pool == []
+    assert not propagator.can_breed()
+
+    propagator = SteadyStatePropagator(all_settings, population_repository, pool=evaluated_individuals[:2])
+    assert propagator.pool == evaluated_individuals[:2]
+    assert propagator.can_breed()
+
+
+def test_steady_state_propagator_insert(all_settings, population_repository, evaluated_individuals, root_individual):
+    propagator = SteadyStatePropagator(all_settings, population_repository, pool=evaluated_individuals)
+    worst_individual = max(evaluated_individuals)
+
+    # Unevaluated individuals never enter the pool
+    assert not propagator.insert(Individual(params=[1.0, 0.1, -0.5, 4.3, 2.4]))
+
+    # Full pool -> a better individual replaces the worst one (identity checks: individuals compare by cost)
+    better_individual = Individual(params=[1.0, 0.1, -0.5, 4.3, 2.4], root_individual=root_individual,
+                                   reax_energies=[42.1, 9.8, -154.3, 980.6])
+    assert propagator.insert(better_individual)
+    assert len(propagator.pool) == 4
+    assert any(individual is better_individual for individual in propagator.pool)
+    assert not any(individual is worst_individual for individual in propagator.pool)
+
+    # ...and a worse individual is discarded
+    worse_individual = Individual(params=[1.0, 0.1, -0.5, 4.3, 2.4], root_individual=root_individual,
+                                  reax_energies=[1000.0, 1000.0, 1000.0, 1000.0])
+    assert not propagator.insert(worse_individual)
+    assert not any(individual is worse_individual for individual in propagator.pool)
+
+
+def test_steady_state_propagator_create_children(all_settings, population_repository, evaluated_individuals):
+    propagator = SteadyStatePropagator(all_settings, population_repository, pool=evaluated_individuals)
+    children = propagator.create_children()
+    assert len(children) == 2
+    assert all(len(child.params) == 5 for child in children)
+    assert len(propagator.create_children(num_children=1)) == 1